@@ -12,9 +12,15 @@ class Prompt(models.Model):
     # 只允许一个是 True，其他的都是 False
     is_active = fields.BooleanField(default=False)
 
+    # 同时招聘多个岗位时，开放中的岗位和启用的提示词一起参与每份简历的评估
+    is_open = fields.BooleanField(default=False, description="是否参与多岗位评估")
+
     is_deleted = fields.IntField(default=0, description="逻辑删除状态，0=正常, 1=已删除")
     
     created_at = fields.DatetimeField(auto_now_add=True)
+    # 任何修改都要刷新（queryset.update 不会自动填，由 PromptService 显式写入），各进程据此判断提示词缓存是否过期
+    updated_at = fields.DatetimeField(auto_now=True, description="最后修改时间")
 
     class Meta:
-        table = "prompts"
\ No newline at end of file
+        table = "prompts"
+        indexes = (("is_active", "is_deleted"),)
\ No newline at end of file
@@ -0,0 +1,24 @@
+from tortoise import fields, models
+
+
+class ReanalysisRun(models.Model):
+    """
+    一次批量重测（/resumes/reanalyze/all），进度按 resume_jobs.run_id 汇总
+    简历不是一次性全部入队，而是由 worker 的调度协程按窗口分段喂进任务队列
+    """
+
+    id = fields.IntField(pk=True)
+    total = fields.IntField(default=0, description="本次重测的简历数")
+    # 状态：0=进行中, 1=已完成, 2=已暂停, 3=已取消
+    status = fields.IntField(default=0, description="重测状态")
+    # 按简历 ID 顺序分段入队：范围是 (checkpoint_id, max_resume_id]
+    max_resume_id = fields.IntField(default=0, description="本次重测的最大简历 ID")
+    checkpoint_id = fields.IntField(default=0, description="已入队的最大简历 ID（断点）")
+    # 创建时参与评估的提示词快照 [{id, name, content, is_active, is_open}]，整个批次都按它评估，
+    # 中途切换 / 修改提示词不会让同一批次出现两种标准
+    prompts = fields.JSONField(null=True, description="本次重测使用的提示词")
+    created_at = fields.DatetimeField(auto_now_add=True)
+    finished_at = fields.DatetimeField(null=True, description="完成时间")
+
+    class Meta:
+        table = "reanalysis_runs"
@@ -16,8 +16,12 @@ class ResumeEvaluation(models.Model):
     score = fields.IntField(null=True, description="AI判断岗位契合度分数")
     is_qualified = fields.BooleanField(default=False, description="是否合格")
     reason = fields.TextField(null=True, description="AI判断合格/不合格的理由")
+    # 评估时提示词内容的 SHA-256，提示词没改过且结构化信息没变时不用重新评估
+    criteria_hash = fields.CharField(max_length=64, null=True, description="评估时的提示词哈希")
     evaluated_at = fields.DatetimeField(auto_now_add=True, description="评估时间")
 
     class Meta:
         table = "resume_evaluations"
         unique_together = (("resume", "prompt"),)
+        # 按岗位给候选人排名：WHERE prompt_id = ? ORDER BY score DESC
+        indexes = (("prompt_id", "score"),)
@@ -0,0 +1,39 @@
+from tortoise import fields, models
+
+
+class ResumeJob(models.Model):
+    id = fields.IntField(pk=True)
+    resume = fields.ForeignKeyField(
+        "models.Resume",
+        related_name="jobs",
+        description="关联简历",
+    )
+    # 由批量重测产生的任务记录所属批次，用于汇总进度
+    run = fields.ForeignKeyField(
+        "models.ReanalysisRun",
+        related_name="jobs",
+        null=True,
+        on_delete=fields.SET_NULL,
+        description="所属批量重测",
+    )
+
+    # 任务状态：0=待处理, 1=处理中, 2=已完成, 3=失败（重试次数耗尽）, 4=已暂停, 5=已取消
+    status = fields.IntField(default=0, description="任务状态")
+    # 优先级：数字大的先领取，新上传的简历排在批量重测前面
+    priority = fields.IntField(default=0, description="优先级")
+    attempts = fields.IntField(default=0, description="已领取次数")
+    # 重试退避：available_at 之前不会被领取
+    available_at = fields.DatetimeField(description="最早可领取时间")
+
+    # 租约：locked_until 过期后视为 worker 已失联，其他 worker 可以重新领取
+    locked_by = fields.CharField(max_length=100, null=True, description="持有租约的 worker")
+    locked_until = fields.DatetimeField(null=True, description="租约到期时间")
+
+    last_error = fields.TextField(null=True, description="最近一次失败原因")
+    created_at = fields.DatetimeField(auto_now_add=True)
+    # 状态变化时显式刷新（queryset 的 update() 不会自动更新），其他进程按它增量同步
+    updated_at = fields.DatetimeField(auto_now=True, index=True)
+
+    class Meta:
+        table = "resume_jobs"
+        indexes = (("status", "available_at"), ("status", "locked_until"), ("run_id", "status"))
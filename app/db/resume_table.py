@@ -1,4 +1,5 @@
 from tortoise import fields, models
+from app.enums.education import SchoolTier
 
 class Resume(models.Model):
     # 主键 ID，自动生成的
@@ -7,8 +8,10 @@ class Resume(models.Model):
     is_deleted = fields.IntField(default=0, description="逻辑删除状态，0=正常, 1=已删除")
 
     # 存 MinIO 返回的文件地址
-    file_url = fields.CharField(max_length=255, description="简历文件URL")
+    file_url = fields.CharField(max_length=255, index=True, description="简历文件URL")
     avatar_url = fields.CharField(max_length=255, null=True, description="头像URL")
+    # 文件内容 SHA-256，用于识别重复上传、复用解析缓存
+    file_hash = fields.CharField(max_length=64, null=True, index=True, description="文件SHA-256")
 
     # 状态：0=未处理, 1=处理中, 2=合格, 3=不合格, 4=失败
     # 给个默认值 0
@@ -22,6 +25,9 @@ class Resume(models.Model):
     #教育背景
     university = fields.CharField(max_length=100, null=True, description="毕业院校")
     schooltier = fields.CharField(max_length=50, null=True, description="学校层次")
+    # 写库时由 resolve_school_tier 计算，筛选走索引等值查询
+    university_canonical = fields.CharField(max_length=100, null=True, index=True, description="标准化学校名")
+    school_tier = fields.CharEnumField(SchoolTier, max_length=10, null=True, index=True, description="学校层次（标准化）")
     degree = fields.CharField(max_length=50, null=True, description="学历")
     major = fields.CharField(max_length=100, null=True, description="专业")
     graduation_time = fields.CharField(max_length=50, null=True, description="毕业时间/年份")
@@ -47,3 +53,12 @@ class Resume(models.Model):
     class Meta:
         table = "resumes" # 数据库里的表名
         ordering = ["-created_at"] # 默认按时间倒序排（最新的在前面）
+        # 对应 ResumeService 的查询：列表按时间倒序（+状态过滤）翻页，按姓名/邮箱/手机号删除
+        # InnoDB 二级索引自带主键，(is_deleted, created_at) 即可覆盖 ORDER BY created_at, id 的游标翻页
+        indexes = (
+            ("is_deleted", "created_at"),
+            ("is_deleted", "status", "created_at"),
+            ("name", "is_deleted"),
+            ("email", "is_deleted"),
+            ("phone", "is_deleted"),
+        )
@@ -0,0 +1,21 @@
+from tortoise import fields, models
+
+
+class ResumeTerm(models.Model):
+    """倒排索引：一行 = 某份简历的某个字段里出现过某个词（中文按双字切分）"""
+
+    id = fields.BigIntField(pk=True)
+    resume = fields.ForeignKeyField(
+        "models.Resume",
+        related_name="terms",
+        description="关联简历",
+    )
+    # name / email / phone / major / university / skills / text
+    field = fields.CharField(max_length=16, description="来源字段")
+    term = fields.CharField(max_length=8, description="词")
+    weight = fields.IntField(default=1, description="排序权重")
+
+    class Meta:
+        table = "resume_terms"
+        # 带上 resume_id，按词查候选 + GROUP BY resume_id 只走索引
+        indexes = (("term", "field", "resume_id"),)
@@ -1,5 +1,6 @@
+import re
 from enum import Enum
-from typing import Optional, Iterable, List, Set
+from typing import Optional, Iterable, List, Set, Tuple
 
 
 SCHOOL_ALIASES = {
@@ -275,25 +276,65 @@ def expand_university_query(university: Optional[str]) -> List[str]:
     return [term for term in terms if term]
 
 
-def _strip_suffixes(name: str, suffixes: Iterable[str]) -> str:
-    for suffix in suffixes:
-        if name.endswith(suffix):
-            return name[: -len(suffix)]
-    return name
+# 按名单匹配时认的后缀："XX学院" / "XX学校" / "XX分校" 都能对上名单里的 "XX大学" / "XX学院"
+SCHOOL_NAME_SUFFIXES = ("大学", "学院", "学校", "分校")
 
 
-def _matches_school_set(name: str, school_set: Set[str]) -> bool:
-    if name in school_set:
-        return True
-    base = _strip_suffixes(name, ("大学", "学院", "学校", "分校"))
-    if base and base != name:
-        if base in school_set:
-            return True
-        if f"{base}大学" in school_set:
-            return True
-        if f"{base}学院" in school_set:
-            return True
-    return False
+class SchoolTierMatcher:
+    """
+    学校层次推断（预编译）：三份名单连同去后缀、换后缀的写法在构造时展开成一张 "学校名 → 层次" 的表，
+    推断时一次字典查找代替逐个名单的多次集合探测；专科 / 本科关键字各编译成一个正则，一次扫描
+    判断顺序不变：名字里带 985 / 211 > 985 名单 > 211 名单 > 双一流名单 > 专科关键字 > 本科关键字
+    """
+
+    def __init__(self, tier_sets, junior_keywords: Iterable[str], ordinary_keywords: Iterable[str]):
+        # tier_sets 按优先级从高到低；低的先写，高的覆盖
+        self._by_name = {}
+        for tier, schools in reversed(tier_sets):
+            for name in self._variants(schools):
+                self._by_name[name] = tier
+        self._junior = re.compile("|".join(map(re.escape, junior_keywords)))
+        self._ordinary = re.compile("|".join(map(re.escape, ordinary_keywords)))
+
+    @staticmethod
+    def _variants(schools: Set[str]) -> Set[str]:
+        # 能匹配上名单的写法：名单本身，以及 "词干 + 任一后缀"，
+        # 词干是名单里的名字本身或去掉 "大学" / "学院" 后的部分
+        stems = set(schools)
+        for school in schools:
+            for suffix in ("大学", "学院"):
+                if school.endswith(suffix) and len(school) > len(suffix):
+                    stems.add(school[: -len(suffix)])
+        names = set(schools)
+        for stem in stems:
+            names.update(stem + suffix for suffix in SCHOOL_NAME_SUFFIXES)
+        return names
+
+    def infer(self, normalized: str) -> Optional[SchoolTier]:
+        """normalized 是 normalize_university_name 之后的学校名"""
+        if "985" in normalized:
+            return SchoolTier.c985
+        if "211" in normalized:
+            return SchoolTier.c211
+        tier = self._by_name.get(normalized)
+        if tier is not None:
+            return tier
+        if self._junior.search(normalized):
+            return SchoolTier.junior
+        if self._ordinary.search(normalized):
+            return SchoolTier.ordinary
+        return None
+
+
+SCHOOL_TIER_MATCHER = SchoolTierMatcher(
+    [
+        (SchoolTier.c985, SCHOOL_TIER_985),
+        (SchoolTier.c211, SCHOOL_TIER_211),
+        (SchoolTier.first_class, SCHOOL_TIER_DOUBLE_FIRST),
+    ],
+    JUNIOR_KEYWORDS,
+    ORDINARY_KEYWORDS,
+)
 
 
 def infer_school_tier(university: Optional[str]) -> Optional[SchoolTier]:
@@ -302,18 +343,65 @@ def infer_school_tier(university: Optional[str]) -> Optional[SchoolTier]:
     normalized = normalize_university_name(university)
     if not normalized:
         return None
-    if "985" in normalized:
-        return SchoolTier.c985
-    if "211" in normalized:
-        return SchoolTier.c211
-    if _matches_school_set(normalized, SCHOOL_TIER_985):
-        return SchoolTier.c985
-    if _matches_school_set(normalized, SCHOOL_TIER_211):
-        return SchoolTier.c211
-    if _matches_school_set(normalized, SCHOOL_TIER_DOUBLE_FIRST):
-        return SchoolTier.first_class
-    if any(keyword in normalized for keyword in JUNIOR_KEYWORDS):
-        return SchoolTier.junior
-    if any(keyword in normalized for keyword in ORDINARY_KEYWORDS):
-        return SchoolTier.ordinary
-    return None
+    return SCHOOL_TIER_MATCHER.infer(normalized)
+
+
+def infer_school_tiers(universities: Iterable[Optional[str]]) -> List[Optional[SchoolTier]]:
+    """
+    批量推断（回填 / 批量解析用），可以传 list、生成器、numpy / pandas 的字符串数组
+    同一批里学校名大量重复，相同的名字只算一次
+    """
+    memo = {}
+    result = []
+    for university in universities:
+        if university in memo:
+            result.append(memo[university])
+            continue
+        tier = memo[university] = infer_school_tier(university)
+        result.append(tier)
+    return result
+
+
+# 层次高低，用于合并"按学校推断"和"简历/LLM 给出"的两个结果
+SCHOOL_TIER_RANK = {
+    SchoolTier.c985: 5,
+    SchoolTier.c211: 4,
+    SchoolTier.first_class: 3,
+    SchoolTier.ordinary: 2,
+    SchoolTier.junior: 1,
+}
+
+# 按层次筛选时包含的取值：985 ⊂ 211 ⊂ 双一流（和 SCHOOL_TIER_211 包含 985 名单保持一致）
+SCHOOL_TIER_FILTER_VALUES = {
+    SchoolTier.c985: [SchoolTier.c985],
+    SchoolTier.c211: [SchoolTier.c985, SchoolTier.c211],
+    SchoolTier.first_class: [SchoolTier.c985, SchoolTier.c211, SchoolTier.first_class],
+    SchoolTier.ordinary: [SchoolTier.ordinary],
+    SchoolTier.junior: [SchoolTier.junior],
+    SchoolTier.null: [SchoolTier.null],
+}
+
+
+def resolve_school_tier(university: Optional[str], declared: Optional[object] = None) -> SchoolTier:
+    """写库时计算的学校层次：按学校名推断和声明值取较高者，都没有时为 null"""
+    candidates = [infer_school_tier(university), normalize_school_tier(declared)]
+    candidates = [t for t in candidates if t and t != SchoolTier.null]
+    if not candidates:
+        return SchoolTier.null
+    return max(candidates, key=lambda t: SCHOOL_TIER_RANK[t])
+
+
+def resolve_school_tiers(pairs: Iterable[Tuple[Optional[str], Optional[object]]]) -> List[SchoolTier]:
+    """批量版 resolve_school_tier：[(学校名, 声明的层次)]，相同的组合只算一次"""
+    memo = {}
+    result = []
+    for university, declared in pairs:
+        key = (university, declared.value if isinstance(declared, SchoolTier) else declared)
+        if key not in memo:
+            memo[key] = resolve_school_tier(university, declared)
+        result.append(memo[key])
+    return result
+
+
+def school_tier_filter_values(tier: SchoolTier) -> List[str]:
+    return [t.value for t in SCHOOL_TIER_FILTER_VALUES.get(tier, [tier])]
@@ -1,8 +1,13 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from tortoise.contrib.fastapi import RegisterTortoise
-from app.settings import TORTOISE_ORM
+from app.settings import TORTOISE_ORM, RUN_EMBEDDED_WORKER, DB_GENERATE_SCHEMAS
 from app.utils.minio_client import MinioClient  # 新增
+from app.services.skill_service import SkillService
+from app.services.run_service import RunService
+from app.worker import ResumeWorker
+from app.utils import metrics
 
 # 1. 引入路由
 from app.routers.resume import router as resume_router
@@ -12,19 +17,39 @@ from app.routers.prompt import router as prompt_router
 # 2. 使用 lifespan 上下文管理器（现代方式）
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # 初始化 MinIO（修复 Bug 2）
-    await MinioClient.init_bucket()
-    print("MinIO 桶已初始化")
+    # 初始化 MinIO（修复 Bug 2）：后台检查桶，不阻塞启动，结果进程内缓存，上传前会确认
+    bucket_check = MinioClient.start_bucket_check()
 
-    # 初始化数据库
+    # 初始化数据库（表结构由 python -m app.scripts.migrate 单独维护）
     async with RegisterTortoise(
         app=app,
         config=TORTOISE_ORM,
-        generate_schemas=True,
+        generate_schemas=DB_GENERATE_SCHEMAS,
         add_exception_handlers=True,
     ):
         print("数据库连接已建立")
+
+        # 技能位图索引：全量加载一次，之后定时增量同步
+        await SkillService.load_index()
+        SkillService.start_index_refresh()
+        print("技能索引已加载")
+
+        # 进程内 worker（独立部署 worker 时通过 RUN_EMBEDDED_WORKER=0 关闭）
+        worker = ResumeWorker() if RUN_EMBEDDED_WORKER else None
+        if worker:
+            worker.start()
+            print(f"解析 worker 已启动，并发 {worker.concurrency}")
+        else:
+            # 状态变化发生在独立的 worker 进程里，轮询任务表转发给本进程的 SSE 订阅者
+            RunService.start_event_relay()
+
         yield
+
+        if worker:
+            await worker.stop()
+        await RunService.stop_event_relay()
+        bucket_check.cancel()
+        await SkillService.stop_index_refresh()
         print("数据库连接已关闭")
 
 
@@ -42,4 +67,10 @@ app.include_router(prompt_router)
 
 @app.get("/")
 def read_root():
-    return {"message": "服务已启动，请访问 /docs 查看接口文档"}
\ No newline at end of file
+    return {"message": "服务已启动，请访问 /docs 查看接口文档"}
+
+
+# 5. 指标（Prometheus 文本格式）：各阶段耗时、LLM 延迟 / 用量 / 限流等待、队列深度、解析结果分布
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
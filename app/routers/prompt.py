@@ -47,6 +47,30 @@ async def activate_prompt(prompt_id: int):
     return {"message": "启用成功"}
 
 
+@router.put("/{prompt_id}/open", summary="开放 / 关闭岗位")
+async def set_prompt_open(
+    prompt_id: int,
+    is_open: bool = Query(True, description="是否参与多岗位评估"),
+):
+    """开放中的岗位和启用的提示词一起参与每份简历的评估"""
+    if not await PromptService.set_open(prompt_id, is_open):
+        raise HTTPException(404, "提示词不存在")
+    return {"message": "已开放" if is_open else "已关闭"}
+
+
+@router.get("/{prompt_id}/ranking", summary="岗位候选人排名")
+async def prompt_ranking(
+    prompt_id: int,
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(20, ge=1, le=100, description="每页数量"),
+    qualified_only: bool = Query(False, description="只看合格的候选人"),
+):
+    """按该岗位的评估分数从高到低排列候选人"""
+    if not await PromptService.get_prompt_by_id(prompt_id):
+        raise HTTPException(404, "提示词不存在")
+    return await PromptService.get_ranking(prompt_id, page, page_size, qualified_only)
+
+
 @router.delete("/{prompt_id}", summary="删除提示词")
 async def delete_prompt(prompt_id: int):
     """删除提示词"""
@@ -1,17 +1,32 @@
 # app/routers/resume.py - 优化版（代码量减少约 30%）
+import asyncio
+import json
+import posixpath
 import uuid
-from fastapi import APIRouter, UploadFile, File, BackgroundTasks, HTTPException, Query, Form
+import zipfile
+from functools import partial
+from typing import List
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Form, Request
+from fastapi.responses import StreamingResponse
 from app.services.resume_service import ResumeService
-from app.utils.minio_client import MinioClient
+from app.services.job_service import JobService
+from app.services.run_service import RunService, TOPIC_RESUMES, run_topic
+from app.utils.events import event_bus
+from app.utils.minio_client import MinioClient, UploadTooLarge
 from app.db.resume_table import Resume
 from app.enums.education import SchoolTier, Degree
+from app.settings import (
+    PDF_MAX_BYTES,
+    UPLOAD_BATCH_CONCURRENCY,
+    UPLOAD_BATCH_MAX_FILES,
+    EVENT_PROGRESS_INTERVAL,
+)
 
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
 
 
 @router.post("/upload", summary="上传简历（PDF）")
 async def upload_resume(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="PDF 格式简历文件"),
 ):
     """上传简历"""
@@ -21,12 +36,15 @@ async def upload_resume(
     object_name = f"resumes/{uuid.uuid4()}.pdf"
 
     try:
-        file_url = await MinioClient.upload_file(file, object_name)
+        uploaded = await MinioClient.upload_stream(file, object_name, max_size=PDF_MAX_BYTES)
+    except UploadTooLarge as e:
+        raise HTTPException(413, str(e))
     except Exception as e:
         raise HTTPException(500, f"上传失败: {e}")
 
-    resume = await ResumeService.create_resume_record(file_url)
-    background_tasks.add_task(ResumeService.process_resume_workflow, resume.id)
+    file_url = uploaded["url"]
+    resume = await ResumeService.create_resume_record(file_url, uploaded["sha256"])
+    await JobService.enqueue(resume.id)
 
     return {
         "code": 200,
@@ -35,6 +53,93 @@ async def upload_resume(
     }
 
 
+def _rewind(file: UploadFile):
+    file.file.seek(0)
+    return file.file
+
+
+def _collect_batch_entries(files: List[UploadFile]) -> list:
+    """
+    展开批量上传的文件：PDF 直接上传，ZIP 展开里面的 PDF
+    返回按输入顺序排列的条目，每条要么带 open_fn（待上传），要么带 error
+    """
+    entries = []
+    for file in files:
+        name = file.filename or ""
+        lower = name.lower()
+        if lower.endswith(".pdf"):
+            entries.append({"filename": name, "open_fn": partial(_rewind, file), "close": False})
+        elif lower.endswith(".zip"):
+            try:
+                archive = zipfile.ZipFile(file.file)
+            except zipfile.BadZipFile:
+                entries.append({"filename": name, "error": "ZIP 文件损坏"})
+                continue
+            for info in archive.infolist():
+                member = info.filename
+                if info.is_dir() or not member.lower().endswith(".pdf"):
+                    continue
+                if member.startswith("__MACOSX/") or posixpath.basename(member).startswith("._"):
+                    continue
+                filename = f"{name}/{member}"
+                if info.file_size > PDF_MAX_BYTES:
+                    entries.append({"filename": filename, "error": "文件过大"})
+                    continue
+                entries.append({"filename": filename, "open_fn": partial(archive.open, info), "close": True})
+        else:
+            entries.append({"filename": name, "error": "仅支持 PDF 或 ZIP 文件"})
+    return entries
+
+
+@router.post("/upload/batch", summary="批量上传简历（多个 PDF 或 ZIP）")
+async def upload_resume_batch(
+    files: List[UploadFile] = File(..., description="多个 PDF 文件，或包含 PDF 的 ZIP 压缩包"),
+):
+    """批量上传：并发写 MinIO，一次 bulk_create 建档，整批加入解析队列"""
+    entries = _collect_batch_entries(files)
+    pending = [e for e in entries if "open_fn" in e]
+    if len(pending) > UPLOAD_BATCH_MAX_FILES:
+        raise HTTPException(400, f"单次最多上传 {UPLOAD_BATCH_MAX_FILES} 份简历")
+
+    semaphore = asyncio.Semaphore(UPLOAD_BATCH_CONCURRENCY)
+
+    async def _upload(entry):
+        object_name = f"resumes/{uuid.uuid4()}.pdf"
+        async with semaphore:
+            try:
+                uploaded = await MinioClient.upload_fileobj(
+                    entry.pop("open_fn"),
+                    object_name,
+                    "application/pdf",
+                    max_size=PDF_MAX_BYTES,
+                    close=entry.pop("close"),
+                )
+            except UploadTooLarge:
+                entry["error"] = "文件过大"
+                return
+            except Exception as e:
+                entry["error"] = f"上传失败: {e}"
+                return
+        entry["file_url"] = uploaded["url"]
+        entry["file_hash"] = uploaded["sha256"]
+
+    await asyncio.gather(*[_upload(e) for e in pending])
+
+    uploaded = [e for e in pending if "file_url" in e]
+    id_by_url = await ResumeService.create_resume_records(uploaded)
+    await JobService.enqueue_many(id_by_url[e["file_url"]] for e in uploaded)
+
+    for e in uploaded:
+        e["resume_id"] = id_by_url.get(e["file_url"])
+        e.pop("file_hash", None)
+
+    return {
+        "code": 200,
+        "message": f"成功上传 {len(uploaded)} 份，失败 {len(entries) - len(uploaded)} 份，正在后台解析",
+        "data": entries,
+    }
+
+
 @router.post(
     "/manual",
     summary="手动录入简历",
@@ -74,25 +179,126 @@ async def create_manual_resume(
 
 
 @router.post("/{resume_id}/analyze", summary="重新分析单份简历")
-async def reanalyze_one(resume_id: int, background_tasks: BackgroundTasks):
+async def reanalyze_one(
+    resume_id: int,
+    reextract: bool = Query(False, description="是否重新抽取结构化信息（默认只按当前提示词重新评估）"),
+):
     """重新分析单份简历"""
     resume = await Resume.get_or_none(id=resume_id)
     if not resume:
         raise HTTPException(404, "简历不存在")
 
-    background_tasks.add_task(ResumeService.process_resume_workflow, resume.id)
+    if reextract:
+        await Resume.filter(id=resume.id).update(parse_result=None)
+    await JobService.enqueue(resume.id)
     return {"code": 200, "message": "已重新加入解析队列"}
 
 
 @router.post("/reanalyze/all", summary="批量重新分析所有简历")
-async def reanalyze_all(background_tasks: BackgroundTasks):
-    """批量重新筛选所有简历"""
-    ids = await ResumeService.get_all_resume_ids()
-    if not ids:
+async def reanalyze_all():
+    """批量重新筛选所有简历（由 worker 按滑动窗口分段入队，可暂停 / 继续 / 取消）"""
+    run = await ResumeService.batch_reanalyze_resumes()
+    if not run:
         return {"code": 200, "message": "简历库为空"}
 
-    background_tasks.add_task(ResumeService.batch_reanalyze_resumes, ids)
-    return {"code": 200, "message": f"已触发 {len(ids)} 份简历重测"}
+    return {
+        "code": 200,
+        "message": f"已触发 {run.total} 份简历重测",
+        "data": {"run_id": run.id, "total": run.total},
+    }
+
+
+@router.post("/reanalyze/{run_id}/pause", summary="暂停批量重测")
+async def pause_reanalyze(run_id: int):
+    if not await RunService.pause(run_id):
+        raise HTTPException(409, "批量重测不存在或不在进行中")
+    return {"code": 200, "message": "已暂停"}
+
+
+@router.post("/reanalyze/{run_id}/resume", summary="继续批量重测")
+async def resume_reanalyze(run_id: int):
+    if not await RunService.resume(run_id):
+        raise HTTPException(409, "批量重测不存在或未暂停")
+    return {"code": 200, "message": "已继续"}
+
+
+@router.post("/reanalyze/{run_id}/cancel", summary="取消批量重测")
+async def cancel_reanalyze(run_id: int):
+    if not await RunService.cancel(run_id):
+        raise HTTPException(409, "批量重测不存在或已结束")
+    return {"code": 200, "message": "已取消"}
+
+
+@router.get("/reanalyze/{run_id}", summary="批量重测进度")
+async def reanalyze_progress(run_id: int):
+    """进度快照：各状态数量、吞吐、预计剩余时间"""
+    snapshot = await RunService.snapshot(run_id)
+    if not snapshot:
+        raise HTTPException(404, "批量重测不存在")
+    return {"code": 200, "data": snapshot}
+
+
+@router.get("/reanalyze/{run_id}/events", summary="批量重测进度推送（SSE）")
+async def reanalyze_events(run_id: int, request: Request):
+    """
+    Server-Sent Events：每份简历的状态变化（event: status）、
+    定时的进度快照（event: progress），全部结束后发 event: done 并关闭
+    """
+    if not await RunService.snapshot(run_id):
+        raise HTTPException(404, "批量重测不存在")
+    return StreamingResponse(
+        _event_stream(request, run_topic(run_id), run_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/events", summary="简历状态变化推送（SSE）")
+async def resume_events(request: Request):
+    """
+    所有简历的状态变化（上传解析 + 重测），event: status
+    worker 独立部署时由 API 进程轮询任务表转发，有 EVENT_RELAY_INTERVAL 的延迟，且轮询间隔内的中间状态会合并
+    """
+    return StreamingResponse(
+        _event_stream(request, TOPIC_RESUMES),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def _event_stream(request: Request, topic: str, run_id: int = None):
+    queue = event_bus.subscribe(topic)
+    try:
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=EVENT_PROGRESS_INTERVAL)
+                yield _sse(event["type"], event)
+                # 积压的事件一次发完再去看进度
+                while not queue.empty():
+                    event = queue.get_nowait()
+                    yield _sse(event["type"], event)
+            except asyncio.TimeoutError:
+                if run_id is None:
+                    yield ": keep-alive\n\n"
+
+            if run_id is not None:
+                snapshot = await RunService.snapshot(run_id)
+                yield _sse("progress", snapshot)
+                if snapshot["done"]:
+                    yield _sse("done", snapshot)
+                    return
+    finally:
+        event_bus.unsubscribe(topic, queue)
+
+
+@router.get("/pipeline/stats", summary="解析流水线各阶段状态")
+async def pipeline_stats():
+    """各阶段队列深度 / 忙碌数 / 并发配置，用于调整各阶段并发"""
+    return {"code": 200, "data": ResumeService.pipeline_stats()}
 
 
 @router.get("/", summary="多维度搜索简历")
@@ -103,13 +309,16 @@ async def list_resumes(
     phone: str = Query(None, description="手机号"),
     university: str = Query(None, description="学校名称（支持别名）"),
     major: str = Query(None, description="专业"),
-    skill: str = Query(None, description="技能关键字"),
+    skill: str = Query(None, description="技能：逗号分隔取交集，| 取并集，- 开头排除，如 python,java|go,-php"),
     schooltier: SchoolTier = Query(None, description="学校层次"),
     degree: Degree = Query(None, description="学历"),
     date_from: str = Query(None, description="起始日期，支持 YYYY 或 YYYY-MM-DD"),
     date_to: str = Query(None),
+    keyword: str = Query(None, description="关键字全文检索（姓名/学校/专业/技能/简历原文），按相关度排序"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
+    cursor: str = Query(None, description="游标（上一页返回的 next_cursor），传入时忽略 page"),
+    with_total: bool = Query(True, description="是否返回总数（总数会短时间缓存）"),
 ):
     """
     多维度搜索简历
@@ -132,8 +341,11 @@ async def list_resumes(
             degree=degree,
             date_from=date_from,
             date_to=date_to,
+            keyword=keyword,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            with_total=with_total,
         )
     except ValueError as e:
         raise HTTPException(400, str(e))
@@ -0,0 +1,46 @@
+# 回填标准化学校名和学校层次：python -m app.scripts.backfill_school_tier
+# 需先完成数据库迁移（resumes 表已有 university_canonical / school_tier 列）
+import asyncio
+
+from tortoise import Tortoise
+
+from app.db.resume_table import Resume
+from app.enums.education import normalize_university_name, resolve_school_tiers
+from app.settings import TORTOISE_ORM
+
+
+async def backfill(batch_size: int = 1000) -> int:
+    """按 ID 分批重算（批量推断，同一批里相同的学校只算一次），每批一次 bulk_update"""
+    count = 0
+    last_id = 0
+    while True:
+        batch = (
+            await Resume.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .only("id", "university", "schooltier", "university_canonical", "school_tier")
+        )
+        if not batch:
+            return count
+        tiers = resolve_school_tiers((r.university, r.schooltier) for r in batch)
+        for resume, tier in zip(batch, tiers):
+            # 与 ResumeService.apply_school_fields 相同
+            resume.university_canonical = normalize_university_name(resume.university)
+            resume.school_tier = tier
+        await Resume.bulk_update(batch, fields=["university_canonical", "school_tier"])
+        count += len(batch)
+        last_id = batch[-1].id
+        print(f"已回填 {count} 份")
+
+
+async def main():
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        count = await backfill()
+        print(f"回填完成，共 {count} 份简历")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+# 建表 / 升级表结构：python -m app.scripts.migrate
+# 部署时在启动服务和 worker 之前单独执行一次（服务启动时不再建表，见 DB_GENERATE_SCHEMAS）
+# MySQL 按 migrations/ 下的迁移升级（等同 aerich upgrade）；迁移脚本是 MySQL 语法，其他数据库（本地 SQLite）直接按模型建表
+import asyncio
+
+from tortoise import Tortoise
+
+from app.settings import DB_URL, TORTOISE_ORM
+
+
+async def main():
+    if DB_URL.startswith("mysql"):
+        from aerich import Command
+
+        command = Command(tortoise_config=TORTOISE_ORM, app="models", location="./migrations")
+        await command.init()
+        try:
+            applied = await command.upgrade(run_in_transaction=True)
+        finally:
+            await command.close()
+        print(f"已执行 {len(applied)} 个迁移" + (f"：{', '.join(applied)}" if applied else "，表结构已是最新"))
+        return
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        await Tortoise.generate_schemas(safe=True)
+        print("已按模型建表（已存在的表不变）")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,20 @@
+# 重建简历检索索引：python -m app.scripts.rebuild_search_index
+import asyncio
+
+from tortoise import Tortoise
+
+from app.services.search_service import SearchService
+from app.settings import TORTOISE_ORM
+
+
+async def main():
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        count = await SearchService.rebuild()
+        print(f"已重建 {count} 份简历的检索索引")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,171 @@
+from datetime import timedelta
+from typing import Iterable, List, Optional
+
+from tortoise import timezone
+from tortoise.expressions import F, Q
+
+from app.db.resume_job_table import ResumeJob
+from app.db.resume_table import Resume
+from app.settings import (
+    JOB_LEASE_SECONDS,
+    JOB_MAX_ATTEMPTS,
+    JOB_RETRY_BACKOFF_SECONDS,
+)
+
+JOB_PENDING = 0
+JOB_RUNNING = 1
+JOB_DONE = 2
+JOB_FAILED = 3
+JOB_PAUSED = 4
+JOB_CANCELLED = 5
+# 同一份简历同时只能有一个进行中的任务，否则两个 worker 会同时处理它（重复调用 LLM、并发写同一行）
+JOB_ACTIVE = [JOB_PENDING, JOB_RUNNING]
+
+# 新上传 / 手动重新分析的简历优先于批量重测
+JOB_PRIORITY_UPLOAD = 10
+JOB_PRIORITY_REANALYZE = 0
+
+
+class JobService:
+    """
+    简历解析任务队列（基于数据库表，支持多副本 / 多 worker 并发领取）
+    状态都用带条件的 UPDATE 修改，queryset 的 update() 不会自动刷新 auto_now 字段，
+    改状态时要显式带上 updated_at：其他进程按它增量同步（见 SkillService.refresh_index）
+    """
+
+    @staticmethod
+    def _claimable_q(now) -> Q:
+        # 待处理且已过退避时间，或者处理中但租约已过期（worker 崩溃 / 重启）
+        return Q(status=JOB_PENDING, available_at__lte=now) | Q(
+            status=JOB_RUNNING,
+            locked_until__lt=now,
+            attempts__lt=JOB_MAX_ATTEMPTS,
+        )
+
+    @staticmethod
+    async def enqueue(resume_id: int, priority: int = JOB_PRIORITY_UPLOAD) -> ResumeJob:
+        """加入解析队列；同一简历已有待处理 / 处理中的任务时直接复用（待处理的提到更高的优先级）"""
+        active = await ResumeJob.filter(resume_id=resume_id, status__in=JOB_ACTIVE).order_by("-status").first()
+        if active:
+            if active.status == JOB_PENDING and active.priority < priority:
+                active.priority = priority
+                await active.save(update_fields=["priority"])
+            return active
+        return await ResumeJob.create(resume_id=resume_id, available_at=timezone.now(), priority=priority)
+
+    @staticmethod
+    async def enqueue_many(
+        resume_ids: Iterable[int],
+        run_id: Optional[int] = None,
+        priority: int = JOB_PRIORITY_UPLOAD,
+    ) -> int:
+        """批量入队，一次 INSERT；已有待处理 / 处理中任务的简历不再入队，这些任务归到本次批量重测名下"""
+        ids = list(dict.fromkeys(resume_ids))
+        if not ids:
+            return 0
+        active = set(
+            await ResumeJob.filter(resume_id__in=ids, status__in=JOB_ACTIVE).values_list(
+                "resume_id", flat=True
+            )
+        )
+        if active and run_id is not None:
+            await ResumeJob.filter(resume_id__in=list(active), status__in=JOB_ACTIVE).update(run_id=run_id)
+        now = timezone.now()
+        jobs = [
+            ResumeJob(resume_id=rid, available_at=now, run_id=run_id, priority=priority)
+            for rid in ids
+            if rid not in active
+        ]
+        if jobs:
+            await ResumeJob.bulk_create(jobs)
+        return len(jobs)
+
+    @classmethod
+    async def claim(cls, worker_id: str, limit: int = 1) -> List[ResumeJob]:
+        """
+        领取任务（租约）
+        先查候选，再用带条件的 UPDATE 抢占，UPDATE 影响 0 行说明被别的 worker 抢走了
+        优先级高的先领，同优先级先进先出
+        """
+        now = timezone.now()
+        candidate_ids = (
+            await ResumeJob.filter(cls._claimable_q(now))
+            .order_by("-priority", "id")
+            .limit(limit * 4)
+            .values_list("id", flat=True)
+        )
+
+        claimed = []
+        for job_id in candidate_ids:
+            updated = await ResumeJob.filter(Q(id=job_id) & cls._claimable_q(now)).update(
+                status=JOB_RUNNING,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=JOB_LEASE_SECONDS),
+                attempts=F("attempts") + 1,
+                updated_at=now,
+            )
+            if updated:
+                claimed.append(job_id)
+                if len(claimed) >= limit:
+                    break
+
+        if not claimed:
+            return []
+        return await ResumeJob.filter(id__in=claimed).order_by("-priority", "id")
+
+    @staticmethod
+    async def extend_lease(job: ResumeJob, worker_id: str) -> bool:
+        """心跳续租，返回 False 表示租约已经丢失"""
+        updated = await ResumeJob.filter(
+            id=job.id, status=JOB_RUNNING, locked_by=worker_id
+        ).update(locked_until=timezone.now() + timedelta(seconds=JOB_LEASE_SECONDS))
+        return bool(updated)
+
+    @staticmethod
+    async def complete(job: ResumeJob, worker_id: str) -> None:
+        await ResumeJob.filter(id=job.id, locked_by=worker_id).update(
+            status=JOB_DONE, locked_until=None, last_error=None, updated_at=timezone.now()
+        )
+
+    @staticmethod
+    def _backoff_seconds(attempts: int) -> int:
+        return min(JOB_RETRY_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0)), 3600)
+
+    @classmethod
+    async def fail(cls, job: ResumeJob, worker_id: str, error: str) -> None:
+        """失败：未达上限则指数退避后重新入队，否则标记为最终失败"""
+        if job.attempts >= JOB_MAX_ATTEMPTS:
+            await ResumeJob.filter(id=job.id, locked_by=worker_id).update(
+                status=JOB_FAILED, locked_until=None, last_error=error, updated_at=timezone.now()
+            )
+            return
+
+        retry_at = timezone.now() + timedelta(seconds=cls._backoff_seconds(job.attempts))
+        await ResumeJob.filter(id=job.id, locked_by=worker_id).update(
+            status=JOB_PENDING,
+            available_at=retry_at,
+            locked_by=None,
+            locked_until=None,
+            last_error=error,
+            updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    async def reap_expired() -> int:
+        """租约过期且重试耗尽的任务（worker 反复崩溃）标记失败，简历置为 4"""
+        now = timezone.now()
+        resume_ids = await ResumeJob.filter(
+            status=JOB_RUNNING,
+            locked_until__lt=now,
+            attempts__gte=JOB_MAX_ATTEMPTS,
+        ).values_list("resume_id", flat=True)
+        if not resume_ids:
+            return 0
+
+        await ResumeJob.filter(
+            status=JOB_RUNNING,
+            locked_until__lt=now,
+            attempts__gte=JOB_MAX_ATTEMPTS,
+        ).update(status=JOB_FAILED, locked_until=None, last_error="租约超时", updated_at=now)
+        await Resume.filter(id__in=resume_ids, status=1).update(status=4)
+        return len(resume_ids)
@@ -1,12 +1,120 @@
+import asyncio
+import time
 from app.db.prompt_table import Prompt
+from app.db.resume_evaluation_table import ResumeEvaluation
+from app.db.resume_table import Resume
+from tortoise import timezone
+from tortoise.expressions import Q
+from tortoise.functions import Count, Max
 from tortoise.transactions import in_transaction
 from typing import List, Optional
+from app.settings import PROMPT_CACHE_CHECK_SECONDS
 
 class PromptService:
+    # 参与评估的提示词缓存：每份简历解析都要用，不再每次查库
+    # 本进程修改时直接失效；其他进程的修改通过 (行数, 最大 updated_at) 版本号发现，最多每 PROMPT_CACHE_CHECK_SECONDS 查一次
+    _prompts: Optional[List[Prompt]] = None
+    _version = None
+    _checked_at = 0.0
+    _lock = None
+    # 本进程内的失效代数：加载期间发生了修改，加载结果就不能放进缓存
+    _generation = 0
+
+    @classmethod
+    def _invalidate(cls) -> None:
+        cls._generation += 1
+        cls._prompts = None
+        cls._version = None
+
     @staticmethod
-    async def get_active_prompt() -> Optional[Prompt]:
+    async def _db_version():
+        row = await Prompt.all().annotate(n=Count("id"), v=Max("updated_at")).first().values("n", "v")
+        return (row["n"], row["v"]) if row else (0, None)
+
+    @classmethod
+    async def get_active_prompt(cls) -> Optional[Prompt]:
         """获取当前启用的提示词 (必须未被删除)"""
-        return await Prompt.get_or_none(is_active=True, is_deleted=0)
+        prompts = await cls.get_evaluation_prompts()
+        return prompts[0] if prompts and prompts[0].is_active else None
+
+    @classmethod
+    async def get_evaluation_prompts(cls) -> List[Prompt]:
+        """一次解析要评估的全部提示词：启用的 + 开放中的岗位，启用的排在最前（调用方不要修改返回的列表）"""
+        now = time.monotonic()
+        if cls._prompts is not None and now - cls._checked_at < PROMPT_CACHE_CHECK_SECONDS:
+            return cls._prompts
+
+        # 并发的解析同时发现过期时只查一次
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if cls._prompts is not None and time.monotonic() - cls._checked_at < PROMPT_CACHE_CHECK_SECONDS:
+                return cls._prompts
+            generation = cls._generation
+            version = await cls._db_version()
+            if cls._prompts is not None and version == cls._version:
+                cls._checked_at = time.monotonic()
+                return cls._prompts
+
+            prompts = await Prompt.filter(Q(is_active=True) | Q(is_open=True), is_deleted=0).order_by(
+                "-is_active", "id"
+            )
+            if generation == cls._generation:
+                cls._prompts, cls._version = prompts, version
+                cls._checked_at = time.monotonic()
+            return prompts
+
+    @staticmethod
+    def snapshot(prompts: List[Prompt]) -> List[dict]:
+        """提示词快照（存进批量重测记录，整个批次按它评估）"""
+        return [
+            {"id": p.id, "name": p.name, "content": p.content, "is_active": p.is_active, "is_open": p.is_open}
+            for p in prompts
+        ]
+
+    @staticmethod
+    def from_snapshot(snapshot: List[dict]) -> List[Prompt]:
+        return [Prompt(**item) for item in snapshot]
+
+    @staticmethod
+    async def set_open(prompt_id: int, is_open: bool) -> bool:
+        """开放 / 关闭岗位（是否参与多岗位评估）"""
+        updated = await Prompt.filter(id=prompt_id, is_deleted=0).update(
+            is_open=is_open, updated_at=timezone.now()
+        )
+        PromptService._invalidate()
+        return bool(updated)
+
+    @staticmethod
+    async def get_ranking(prompt_id: int, page: int = 1, page_size: int = 20, qualified_only: bool = False) -> dict:
+        """按岗位给候选人排名（走 (prompt_id, score) 索引），分数相同按评估 ID 倒序"""
+        query = ResumeEvaluation.filter(prompt_id=prompt_id)
+        if qualified_only:
+            query = query.filter(is_qualified=True)
+
+        total = await query.count()
+        evaluations = await query.order_by("-score", "-id").offset((page - 1) * page_size).limit(page_size)
+        resumes = await Resume.filter(id__in=[e.resume_id for e in evaluations], is_deleted=0)
+        by_id = {r.id: r for r in resumes}
+
+        items = []
+        for rank, evaluation in enumerate(evaluations, start=(page - 1) * page_size + 1):
+            resume = by_id.get(evaluation.resume_id)
+            if not resume:
+                continue
+            items.append({
+                "rank": rank,
+                "resume_id": resume.id,
+                "name": resume.name,
+                "university": resume.university,
+                "degree": resume.degree,
+                "major": resume.major,
+                "score": evaluation.score,
+                "is_qualified": evaluation.is_qualified,
+                "reason": evaluation.reason,
+                "evaluated_at": evaluation.evaluated_at,
+            })
+        return {"items": items, "total": total, "page": page, "page_size": page_size}
 
     @staticmethod
     async def activate_prompt(prompt_id: int) -> bool:
@@ -20,21 +128,24 @@ class PromptService:
                 return False
 
             # 2. 把所有提示词设为 False (这里不需要过滤 is_deleted，全停即可，比较安全)
-            await Prompt.all().update(is_active=False)
+            await Prompt.filter(is_active=True).update(is_active=False, updated_at=timezone.now())
             
             # 3. 启用目标
             prompt.is_active = True
             await prompt.save()
-            return True
+        PromptService._invalidate()
+        return True
 
     @staticmethod
     async def create_prompt(name: str, content: str, is_active: bool = False) -> Prompt:
         """创建新提示词"""
         async with in_transaction():
             if is_active:
-                await Prompt.all().update(is_active=False)
+                await Prompt.filter(is_active=True).update(is_active=False, updated_at=timezone.now())
             # 默认 is_deleted=0
-            return await Prompt.create(name=name, content=content, is_active=is_active)
+            prompt = await Prompt.create(name=name, content=content, is_active=is_active)
+        PromptService._invalidate()
+        return prompt
     
     @staticmethod
     async def get_prompt_by_id(prompt_id: int) -> Optional[Prompt]:
@@ -60,6 +171,7 @@ class PromptService:
             prompt.content = content
         
         await prompt.save()
+        PromptService._invalidate()
         return prompt
     
     @staticmethod
@@ -73,9 +185,11 @@ class PromptService:
         prompt.is_deleted = 1
         prompt.is_active = False 
         await prompt.save()
+        PromptService._invalidate()
         return True
     
     @staticmethod
     async def deactivate_all() -> None:
         """禁用所有提示词"""
-        await Prompt.all().update(is_active=False)
+        await Prompt.filter(is_active=True).update(is_active=False, updated_at=timezone.now())
+        PromptService._invalidate()
@@ -1,39 +1,93 @@
 # app/services/resume_service.py - 修复学校层次查询 Bug
 import asyncio
+import base64
+import json
+import time
+import uuid
 from datetime import datetime
 from app.db.resume_table import Resume
 from app.db.resume_evaluation_table import ResumeEvaluation
 from app.services.prompt_service import PromptService
 from app.services.skill_service import SkillService
+from app.services.search_service import SearchService
+from app.services.run_service import RunService
+from app.services.resume_writer import ResumeWriter
 from app.utils.minio_client import MinioClient
-from app.utils.llm_client import LLMClient
+from app.utils.llm_client import LLMClient, PROFILE_FIELDS, PROFILE_VERSION
 from app.utils.pdf_parser import PdfParser
 from app.utils.helpers import normalize_skills
+from app.utils.pipeline import Pipeline, Stage
+from app.utils.cache import TTLCache, sha256_hex
+from app.utils import metrics
 from app.enums.education import (
     normalize_school_tier,
-    infer_school_tier,
+    normalize_university_name,
+    resolve_school_tier,
+    school_tier_filter_values,
     expand_university_query,
-    SCHOOL_TIER_985,
-    SCHOOL_TIER_211,
-    SCHOOL_TIER_DOUBLE_FIRST,
 )
 from tortoise.expressions import Q
-from app.settings import MINIO_BUCKET_NAME
+from app.settings import (
+    MINIO_BUCKET_NAME,
+    PIPELINE_QUEUE_SIZE,
+    PIPELINE_DOWNLOAD_CONCURRENCY,
+    PIPELINE_PARSE_WORKERS,
+    PIPELINE_LLM_CONCURRENCY,
+    PIPELINE_WRITE_CONCURRENCY,
+    PIPELINE_WRITE_BATCH_SIZE,
+    PARSE_CACHE_MAX_ITEMS,
+    PARSE_CACHE_TTL,
+    RESUME_COUNT_CACHE_TTL,
+    SEARCH_MAX_CANDIDATES,
+    LLM_BATCH_SIZE,
+)
+
+RESUME_DOWNLOAD_SECONDS = metrics.histogram("resume_download_seconds", "从 MinIO 下载简历 PDF 的耗时")
+RESUME_WORKFLOW_SECONDS = metrics.histogram(
+    "resume_workflow_seconds", "单份简历从开始处理到写库完成的耗时", ["status"]
+)
+RESUME_OUTCOMES = metrics.counter("resume_outcomes_total", "解析结束时的简历状态（2=合格 3=不合格 4=失败）", ["status"])
 
 
 class ResumeService:
-    _semaphore = asyncio.Semaphore(3)
+    _pipeline = None
+    # 文件 SHA-256 → (文本, 头像)，重复上传 / 重跑时跳过下载和解析
+    _parsed_cache = TTLCache("parsed_pdf", PARSE_CACHE_MAX_ITEMS, PARSE_CACHE_TTL)
+    # 列表查询条件 → 总数
+    _count_cache = TTLCache("resume_count", 1000, RESUME_COUNT_CACHE_TTL)
 
     # ==================== 核心流程（保持不变）====================
 
     @staticmethod
-    async def create_resume_record(file_url):
-        return await Resume.create(file_url=file_url, status=0)
+    async def create_resume_record(file_url, file_hash=None):
+        return await Resume.create(file_url=file_url, file_hash=file_hash, status=0)
+
+    @staticmethod
+    async def create_resume_records(records):
+        """
+        批量建档：一次 bulk_create 写入所有简历
+        records: [{"file_url": ..., "file_hash": ...}]，返回 {file_url: resume_id}
+        （MySQL 下 bulk_create 不回填主键，file_url 唯一，按它回查 ID）
+        """
+        if not records:
+            return {}
+
+        await Resume.bulk_create(
+            [Resume(file_url=r["file_url"], file_hash=r.get("file_hash"), status=0) for r in records],
+            batch_size=500,
+        )
+
+        urls = [r["file_url"] for r in records]
+        id_by_url = {}
+        for i in range(0, len(urls), 1000):
+            rows = await Resume.filter(file_url__in=urls[i:i + 1000]).values_list("file_url", "id")
+            id_by_url.update(rows)
+        return id_by_url
 
     @staticmethod
     async def create_manual_resume(**payload):
         skills = normalize_skills(payload.get("skills"))
-        return await Resume.create(
+        resume = Resume(
             file_url=payload["file_url"],
             status=2,
             name=payload.get("name"),
@@ -48,79 +102,276 @@ class ResumeService:
             work_experience=payload.get("work_experience"),
             projects=payload.get("projects"),
         )
+        ResumeService.apply_school_fields(resume)
+        await resume.save()
+        await SearchService.index_resume(resume)
+        return resume
 
     @classmethod
-    async def process_resume_workflow(cls, resume_id):
-        async with cls._semaphore:
-            resume = await Resume.get_or_none(id=resume_id, is_deleted=0)
-            if not resume:
-                return
-
-            if resume.file_url.startswith("manual://"):
-                if resume.status != 2:
-                    resume.status = 2
-                    await resume.save()
-                return
-
-            resume.status = 1
-            await resume.save()
-
-            try:
-                await cls._parse_and_save(resume)
-            except Exception as e:
-                print(f"简历 {resume_id} 解析失败: {e}")
-                resume.status = 4
+    async def process_resume_workflow(cls, resume_id, run_id=None):
+        """
+        解析单份简历，由任务队列的 worker 调用（并发度由 worker 控制）
+        失败时置为 4 并抛出异常，交给任务队列决定是否重试
+        每次状态变化都发布到进程内事件（SSE 推送），run_id 是所属的批量重测
+        """
+        resume = await Resume.get_or_none(id=resume_id, is_deleted=0)
+        if not resume:
+            return
+
+        if resume.file_url.startswith("manual://"):
+            if resume.status != 2:
+                RunService.publish_status(resume.id, resume.status, 2, run_id)
+                resume.status = 2
                 await resume.save()
+            return
+
+        profile = cls.stored_profile(resume)
+        RunService.publish_status(resume.id, resume.status, 1, run_id)
+        resume.status = 1
+        await resume.save(update_fields=["status"])
+
+        started = time.perf_counter()
+        try:
+            await cls._parse_and_save(resume, profile, run_id)
+        except Exception as e:
+            print(f"简历 {resume_id} 解析失败: {e}")
+            resume.status = 4
+            await resume.save(update_fields=["status"])
+            RunService.publish_status(resume.id, 1, 4, run_id, error=str(e))
+            raise
+        finally:
+            RESUME_WORKFLOW_SECONDS.observe(time.perf_counter() - started, status=resume.status)
+            RESUME_OUTCOMES.inc(status=resume.status)
+        RunService.publish_status(resume.id, 1, resume.status, run_id)
+
+    # ==================== 解析流水线 ====================
+    # 下载 → PDF 解析 → LLM 抽取 → LLM 评估 → 入库，各阶段独立并发，阶段之间是有界队列，
+    # 这样 LLM 等待时下载和解析可以继续推进，不再串行占着一个并发名额
+    # 已经抽取过结构化信息的简历（换了提示词重测）跳过前三个阶段，只跑评估
+    # 一次运行评估全部参与评估的提示词（启用的 + 开放中的岗位），各提示词的请求并发发出
+
+    @classmethod
+    def get_pipeline(cls) -> Pipeline:
+        if cls._pipeline is None:
+            cls._pipeline = Pipeline(
+                [
+                    Stage("download", cls._stage_download, PIPELINE_DOWNLOAD_CONCURRENCY),
+                    Stage("parse", cls._stage_parse, PIPELINE_PARSE_WORKERS),
+                    Stage("extract", cls._stage_extract, PIPELINE_LLM_CONCURRENCY, batch_size=LLM_BATCH_SIZE),
+                    Stage("evaluate", cls._stage_evaluate, PIPELINE_LLM_CONCURRENCY, batch_size=LLM_BATCH_SIZE),
+                    Stage(
+                        "write",
+                        cls._stage_write,
+                        PIPELINE_WRITE_CONCURRENCY,
+                        batch_size=PIPELINE_WRITE_BATCH_SIZE,
+                    ),
+                ],
+                queue_size=PIPELINE_QUEUE_SIZE,
+            )
+        return cls._pipeline
+
+    @classmethod
+    async def shutdown_pipeline(cls):
+        if cls._pipeline is not None:
+            await cls._pipeline.close()
+            cls._pipeline = None
+        PdfParser.shutdown_pool()
+
+    @classmethod
+    def pipeline_stats(cls) -> dict:
+        return {
+            "stages": cls._pipeline.stats() if cls._pipeline is not None else {},
+            "caches": {
+                "parsed_pdf": cls._parsed_cache.stats(),
+                "llm_result": LLMClient.cache_stats(),
+            },
+            "llm": LLMClient.rate_stats(),
+            "skill_index": SkillService.index_stats(),
+        }
 
     @classmethod
-    async def _parse_and_save(cls, resume):
-        prompt = await PromptService.get_active_prompt()
-        if not prompt:
+    async def _parse_and_save(cls, resume, profile=None, run_id=None):
+        # 提示词在这里取一次、随条目走完整条流水线；批量重测用创建时固定的那一版
+        prompts = await RunService.pinned_prompts(run_id) if run_id is not None else None
+        if prompts is None:
+            prompts = await PromptService.get_evaluation_prompts()
+        if not prompts:
             raise ValueError("未配置 Prompt")
 
+        # 结构化信息不变时，提示词内容也没改过的评估直接沿用
+        existing = {}
+        if profile is not None:
+            rows = await ResumeEvaluation.filter(
+                resume_id=resume.id, prompt_id__in=[p.id for p in prompts]
+            ).values_list("prompt_id", "criteria_hash", "is_qualified")
+            existing = {pid: (criteria_hash, qualified) for pid, criteria_hash, qualified in rows}
+
+        todo = [p for p in prompts if existing.get(p.id, (None,))[0] != sha256_hex(p.content)]
+        await cls.get_pipeline().submit({
+            "resume": resume,
+            "prompts": todo,
+            "status_prompt": prompts[0] if prompts[0].is_active else None,
+            "known_qualified": {pid: qualified for pid, (_, qualified) in existing.items()},
+            "profile": profile,
+            "evaluations": {},
+        })
+
+    @staticmethod
+    def stored_profile(resume):
+        """
+        已存的结构化信息，版本不对或没有时返回 None（需要重新抽取）
+        拆分抽取 / 评估之前解析的简历，parse_result 里本来就有这些字段，直接沿用
+        """
+        data = resume.parse_result
+        if not isinstance(data, dict) or resume.status not in (2, 3):
+            return None
+        version = data.get("profile_version")
+        if version is not None and version != PROFILE_VERSION:
+            return None
+        # 旧版本 LLM 调用失败时写入的占位结果
+        if version is None and str(data.get("reason") or "").startswith("解析失败"):
+            return None
+        return {k: data.get(k) for k in PROFILE_FIELDS}
+
+    @classmethod
+    async def _stage_download(cls, ctx):
+        resume = ctx["resume"]
+        if ctx["profile"] is not None:
+            return
+        # 已知文件哈希且解析结果还在缓存里，就不用再下载了
+        # 命中的结果直接放进 ctx：解析阶段再查一次可能已经过期 / 被挤出，那时手里又没有文件
+        cached = cls._parsed_cache.get(resume.file_hash) if resume.file_hash else None
+        if cached is not None:
+            ctx["parsed"] = cached
+            return
+
         file_bytes = await cls._download_pdf(resume.file_url)
-        text, avatar_data = PdfParser.parse_pdf(file_bytes)
+        resume.file_hash = sha256_hex(file_bytes)
+        ctx["file_bytes"] = file_bytes
+
+    @classmethod
+    async def _stage_parse(cls, ctx):
+        resume = ctx["resume"]
+        if ctx["profile"] is not None:
+            return
+        cached = ctx.pop("parsed", None)
+        if cached is not None:
+            text, avatar_data = cached
+            # 同一文件重跑时头像已经传过了
+            if resume.avatar_url:
+                avatar_data = None
+        else:
+            text, avatar_data = await PdfParser.parse_pdf_async(ctx.pop("file_bytes"))
+            cls._parsed_cache.set(resume.file_hash, (text, avatar_data))
+
         if not text or len(text.strip()) < 10:
             raise ValueError("PDF 内容为空")
+        ctx["text"] = text
+        ctx["avatar_data"] = avatar_data
 
-        result = await LLMClient.parse_resume(text, prompt.content)
+    @staticmethod
+    def _raise_first(results):
+        # 有条目失败就让整批失败，流水线会逐条重试，成功的条目命中 LLM 缓存不会重复请求
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
-        for k in ["name", "phone", "email", "university", "schooltier", "degree", "major"]:
-            setattr(resume, k, result.get(k))
-
-        resume.graduation_time = result.get("graduation_year")
-        resume.skills = normalize_skills(result.get("skills", []))
-        resume.work_experience = result.get("work_experience")
-        resume.projects = result.get("projects")
-        resume.parse_result = result
-        resume.status = 2 if result.get("is_qualified") else 3
-        await resume.save()
+    @classmethod
+    async def _stage_extract(cls, batch):
+        todo = [ctx for ctx in batch if ctx["profile"] is None]
+        if not todo:
+            return
+        profiles = await LLMClient.extract_profiles([ctx["text"] for ctx in todo])
+        cls._raise_first(profiles)
+        for ctx, profile in zip(todo, profiles):
+            ctx["profile"] = profile
+            ctx["extracted"] = True
 
-        skills = await SkillService.get_or_create_skills(resume.skills or [])
-        await resume.skill_tags.clear()
-        if skills:
-            await resume.skill_tags.add(*skills)
-
-        if avatar_data:
-            import uuid
-            ext = avatar_data["ext"]
-            filename = f"avatars/{uuid.uuid4()}.{ext}"
-            avatar_url = await MinioClient.upload_bytes(
-                avatar_data["bytes"], filename, f"image/{ext}"
-            )
-            resume.avatar_url = avatar_url
-            await resume.save()
-
-        await ResumeEvaluation.update_or_create(
-            defaults={
-                "score": result.get("score"),
-                "is_qualified": result.get("is_qualified", False),
-                "reason": result.get("reason"),
-                "evaluated_at": datetime.utcnow(),
-            },
-            resume=resume,
-            prompt=prompt,
+    @classmethod
+    async def _stage_evaluate(cls, batch):
+        # 同一提示词的简历打包成一次请求（LLM_BATCH_SIZE=1 时就是逐份调用），不同提示词并发
+        by_prompt = {}
+        for ctx in batch:
+            for prompt in ctx["prompts"]:
+                by_prompt.setdefault(prompt.id, (prompt, []))[1].append(ctx)
+
+        async def _evaluate(prompt, group):
+            evaluations = await LLMClient.evaluate_profiles([ctx["profile"] for ctx in group], prompt.content)
+            cls._raise_first(evaluations)
+            for ctx, evaluation in zip(group, evaluations):
+                ctx["evaluations"][prompt.id] = evaluation
+
+        results = await asyncio.gather(
+            *[_evaluate(prompt, group) for prompt, group in by_prompt.values()],
+            return_exceptions=True,
+        )
+        cls._raise_first(results)
+
+    @classmethod
+    async def _stage_write(cls, batch):
+        # 头像上传是网络 IO，先并发传完，再把整批结果交给 ResumeWriter 一个事务写完
+        await asyncio.gather(*[cls._upload_avatar(ctx) for ctx in batch])
+        writer = ResumeWriter()
+        for ctx in batch:
+            resume = ctx["resume"]
+            if ctx.get("extracted"):
+                cls.apply_profile(resume, ctx["profile"], ctx.get("avatar_url"))
+                writer.add_profile(resume, ctx.get("text"))
+            cls._collect_evaluations(writer, resume, ctx)
+        skill_links = await writer.flush()
+        # 事务提交后再更新进程内技能索引
+        SkillService.index_resume_skills(skill_links)
+
+    @staticmethod
+    async def _upload_avatar(ctx):
+        # 上传成功后才从 ctx 里拿掉：失败时流水线逐条重试还要再传，已经传过的重试时不会重复上传
+        avatar_data = ctx.get("avatar_data")
+        if not avatar_data:
+            return
+        ext = avatar_data["ext"]
+        filename = f"avatars/{uuid.uuid4()}.{ext}"
+        ctx["avatar_url"] = await MinioClient.upload_bytes(
+            avatar_data["bytes"], filename, f"image/{ext}"
         )
+        ctx.pop("avatar_data", None)
+
+    @staticmethod
+    def apply_school_fields(resume):
+        """根据 university / schooltier 计算标准化学校名和层次（写库前调用）"""
+        resume.university_canonical = normalize_university_name(resume.university)
+        resume.school_tier = resolve_school_tier(resume.university, resume.schooltier)
+
+    @staticmethod
+    def apply_profile(resume, profile, avatar_url=None):
+        """把抽取出的结构化信息设置到简历上（不写库，由 ResumeWriter 批量写入）"""
+        for k in ["name", "phone", "email", "university", "schooltier", "degree", "major"]:
+            setattr(resume, k, profile.get(k))
+        ResumeService.apply_school_fields(resume)
+
+        resume.graduation_time = profile.get("graduation_year")
+        resume.skills = normalize_skills(profile.get("skills", []))
+        resume.work_experience = profile.get("work_experience")
+        resume.projects = profile.get("projects")
+        resume.parse_result = dict(profile, profile_version=PROFILE_VERSION)
+        if avatar_url:
+            resume.avatar_url = avatar_url
+
+    @staticmethod
+    def _collect_evaluations(writer, resume, ctx):
+        """
+        本次各提示词的评估结果（每个 (简历, 提示词) 一行）
+        简历状态跟随启用的提示词；没有启用的提示词时，任一开放岗位合格即为合格
+        """
+        for prompt in ctx["prompts"]:
+            writer.add_evaluation(resume, prompt, ctx["evaluations"][prompt.id])
+
+        qualified = dict(ctx["known_qualified"])
+        qualified.update({pid: e.get("is_qualified", False) for pid, e in ctx["evaluations"].items()})
+        if ctx["status_prompt"] is not None:
+            is_qualified = qualified.get(ctx["status_prompt"].id, False)
+        else:
+            is_qualified = any(qualified.values())
+        writer.set_status(resume, 2 if is_qualified else 3)
 
     @staticmethod
     async def _download_pdf(file_url):
@@ -129,7 +380,8 @@ class ResumeService:
         else:
             object_name = file_url.split("/")[-1]
 
-        file_bytes = await MinioClient.get_file_bytes(object_name)
+        with RESUME_DOWNLOAD_SECONDS.time():
+            file_bytes = await MinioClient.get_file_bytes(object_name)
         if not file_bytes:
             raise ValueError("文件下载失败")
         return file_bytes
@@ -174,33 +426,6 @@ class ResumeService:
 
         return result if result else None
 
-    @staticmethod
-    def _build_school_tier_filter(schooltier_value):
-        """
-        【修复 Bug 3】
-        构建学校层次的数据库查询条件，避免内存过滤
-        """
-        if not schooltier_value:
-            return None
-
-        tier_name = schooltier_value.value
-
-        # 构建 Q 查询条件
-        q = Q(schooltier__icontains=tier_name)
-
-        # 如果是具体层次，添加对应学校名单
-        if tier_name == "985":
-            for school in SCHOOL_TIER_985:
-                q |= Q(university__icontains=school)
-        elif tier_name == "211":
-            for school in SCHOOL_TIER_211:
-                q |= Q(university__icontains=school)
-        elif tier_name == "双一流":
-            for school in SCHOOL_TIER_DOUBLE_FIRST:
-                q |= Q(university__icontains=school)
-
-        return q
-
     @staticmethod
     async def get_resumes(
         status=None,
@@ -214,13 +439,29 @@ class ResumeService:
         skill=None,
         date_from=None,
         date_to=None,
+        keyword=None,
         page=1,
         page_size=20,
+        cursor=None,
+        with_total=True,
     ):
-        """【修复 Bug 3】多维度搜索 - 使用数据库过滤"""
+        """
+        【修复 Bug 3】多维度搜索 - 使用数据库过滤
+        文本条件先查倒排索引缩小到候选 ID，再在候选集上做精确过滤，避免 LIKE '%x%' 全表扫描
+        传 cursor 时按 (created_at, id) 游标翻页，不再 OFFSET；总数可关闭，开启时短时间缓存
+        """
+        count_key = (
+            status, name, email, phone, university, str(schooltier), str(degree),
+            major, skill, date_from, date_to, keyword,
+        )
         query = Resume.filter(is_deleted=0)
         offset = (page - 1) * page_size
-        use_distinct = False
+        candidate_ids = None
+
+        def _narrow(ids):
+            nonlocal candidate_ids
+            if ids is not None:
+                candidate_ids = set(ids) if candidate_ids is None else candidate_ids & set(ids)
 
         # 状态过滤
         status_list = ResumeService._parse_status(status)
@@ -236,12 +477,14 @@ class ResumeService:
         }
         for field, value in text_filters.items():
             if value:
+                _narrow(await SearchService.match_field(field, value.strip()))
                 query = query.filter(**{f"{field}__icontains": value.strip()})
 
         # 学校过滤
         if university:
             terms = expand_university_query(university)
             if terms:
+                _narrow(await SearchService.match_any("university", terms))
                 q = Q(university__icontains=terms[0])
                 for term in terms[1:]:
                     q |= Q(university__icontains=term)
@@ -261,28 +504,123 @@ class ResumeService:
             query = query.filter(created_at__lte=date_to_val)
 
         # 【修复 Bug 7】技能过滤（多对多） - 统一小写
+        # 先在进程内技能位图上求交并差，结果够小就只按 ID 取行，不再每个技能 JOIN 一次
+        skill_groups, skill_excluded, skill_matched = [], [], None
         if skill:
-            skill_terms = [s.strip().lower() for s in skill.replace("，", ",").split(",") if s.strip()]
-            for term in skill_terms:
-                # 技能在数据库中是小写存储的，直接用 = 即可
-                query = query.filter(skill_tags__name=term)
-            use_distinct = True
+            skill_groups, skill_excluded = SkillService.parse_query(skill)
+            skill_matched = await SkillService.match(skill_groups, skill_excluded)
 
-        # 【修复】学校层次过滤 - 使用数据库查询
+        # 学校层次过滤 - 写库时已算好 school_tier，走索引等值查询
         schooltier_value = normalize_school_tier(schooltier)
         if schooltier_value:
-            tier_q = ResumeService._build_school_tier_filter(schooltier_value)
-            if tier_q:
-                query = query.filter(tier_q)
+            query = query.filter(school_tier__in=school_tier_filter_values(schooltier_value))
+
+        # 关键字全文检索：按相关度排序；走不了索引（单字 / 命中太多）时按 LIKE 过滤、按时间排序
+        ranked = None
+        if keyword and keyword.strip():
+            ranked = await SearchService.rank(keyword.strip())
+            if ranked is None:
+                kw = keyword.strip()
+                query = query.filter(
+                    Q(name__icontains=kw) | Q(university__icontains=kw) | Q(major__icontains=kw)
+                )
+            else:
+                _narrow(rid for rid, _ in ranked)
+
+        if skill_matched is not None and (candidate_ids is not None or len(skill_matched) <= SEARCH_MAX_CANDIDATES):
+            _narrow([rid for rid in candidate_ids if rid in skill_matched] if candidate_ids is not None else skill_matched)
+        elif skill_groups or skill_excluded:
+            query = query.filter(SkillService.sql_filter(skill_groups, skill_excluded))
+
+        if candidate_ids is not None:
+            if not candidate_ids:
+                return {"items": [], "total": 0, "page": page, "page_size": page_size, "next_cursor": None}
+            query = query.filter(id__in=list(candidate_ids))
+
+        if ranked is not None:
+            if cursor:
+                offset = ResumeService._decode_cursor(cursor, ranked=True)["o"]
+            return await ResumeService._ranked_page(query, ranked, offset, page, page_size)
+
+        total = await ResumeService._cached_count(query, count_key) if with_total else None
+
+        # 游标翻页：WHERE (created_at, id) < 上一页最后一条，代价和第几页无关
+        if cursor:
+            cursor_value = ResumeService._decode_cursor(cursor, ranked=False)
+            created_at, last_id = cursor_value["t"], cursor_value["i"]
+            query = query.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id))
+            offset = 0
+
+        results_query = query.prefetch_related("skill_tags").order_by("-created_at", "-id")
+        items = list(await results_query.offset(offset).limit(page_size + 1))
+
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            next_cursor = ResumeService._encode_cursor({"t": last.created_at.isoformat(), "i": last.id})
+
+        return {
+            "items": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    def _encode_cursor(value: dict) -> str:
+        raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, ranked: bool) -> dict:
+        """
+        相关度排序的游标是 {"o": 偏移}，时间排序的是 {"t": 创建时间, "i": ID}
+        两种不能混用（比如关键字换了一个走不了索引的），和当前查询对不上时同样报 cursor 无效
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            value = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if ranked:
+                if set(value) != {"o"}:
+                    raise ValueError
+                return {"o": max(int(value["o"]), 0)}
+            if set(value) != {"t", "i"}:
+                raise ValueError
+            return {"t": datetime.fromisoformat(value["t"]), "i": int(value["i"])}
+        except Exception:
+            raise ValueError("cursor 无效")
 
-        # 执行查询
-        total = await query.count()
-        results_query = query.prefetch_related("skill_tags").order_by("-created_at")
-        if use_distinct:
-            results_query = results_query.distinct()
-        items = await results_query.offset(offset).limit(page_size)
+    @classmethod
+    async def _cached_count(cls, query, count_key):
+        """总数短时间缓存：翻页 / 轮询时同一组条件不用每次都 COUNT"""
+        total = cls._count_cache.get(count_key)
+        if total is None:
+            total = await query.count()
+            cls._count_cache.set(count_key, total)
+        return total
 
-        return {"items": items, "total": total, "page": page, "page_size": page_size}
+    @staticmethod
+    async def _ranked_page(query, ranked, offset, page, page_size):
+        """相关度排序的分页：候选集已经被索引限制在 SEARCH_MAX_CANDIDATES 以内，在内存里排"""
+        matched = set(await query.values_list("id", flat=True))
+        ordered = [rid for rid, _ in ranked if rid in matched]
+
+        page_ids = ordered[offset:offset + page_size]
+        rows = await Resume.filter(id__in=page_ids).prefetch_related("skill_tags")
+        by_id = {r.id: r for r in rows}
+        items = [by_id[rid] for rid in page_ids if rid in by_id]
+
+        next_offset = offset + page_size
+        next_cursor = ResumeService._encode_cursor({"o": next_offset}) if next_offset < len(ordered) else None
+        return {
+            "items": items,
+            "total": len(ordered),
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
 
     # ==================== 删除和批量（保持不变）====================
 
@@ -305,21 +643,26 @@ class ResumeService:
         if count > 0:
             await Resume.filter(id__in=ids).update(is_deleted=1)
             await ResumeEvaluation.filter(resume_id__in=ids).delete()
+            await SearchService.remove(ids)
+            SkillService.remove_resumes(ids)
 
         return count
 
-    @classmethod
-    async def batch_reanalyze_resumes(cls, resume_ids):
-        """【修复 Bug 4】批量重新解析 - 分批处理避免死锁"""
-        batch_size = 10  # 每批处理10个
-        for i in range(0, len(resume_ids), batch_size):
-            batch = resume_ids[i:i + batch_size]
-            tasks = [cls.process_resume_workflow(rid) for rid in batch]
-            await asyncio.gather(*tasks, return_exceptions=True)
-            # 每批之间稍微延迟，避免数据库压力
-            if i + batch_size < len(resume_ids):
-                await asyncio.sleep(0.5)
-
     @staticmethod
-    async def get_all_resume_ids():
-        return await Resume.filter(is_deleted=0).values_list("id", flat=True)
\ No newline at end of file
+    async def batch_reanalyze_resumes():
+        """
+        批量重新解析全部简历：只建一个批量重测记录，由 worker 的调度协程按滑动窗口分段入队
+        简历库为空时返回 None
+        """
+        return await RunService.create_run()
+
+
+def _stage_gauge(key):
+    def collect():
+        stages = ResumeService._pipeline.stats() if ResumeService._pipeline is not None else {}
+        return {(name,): stats[key] for name, stats in stages.items()}
+    return collect
+
+
+metrics.gauge("pipeline_queue_depth", "流水线各阶段入口队列里等待的条目数", _stage_gauge("queue_depth"), ["stage"])
+metrics.gauge("pipeline_busy", "流水线各阶段正在处理的批次数", _stage_gauge("busy"), ["stage"])
@@ -0,0 +1,131 @@
+# app/services/resume_writer.py - 解析结果的批量写库（工作单元：先收集，提交时一个事务写完）
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pypika_tortoise import Table
+from tortoise.transactions import in_transaction
+
+from app.db.resume_table import Resume
+from app.db.resume_evaluation_table import ResumeEvaluation
+from app.services.search_service import SearchService
+from app.services.skill_service import SkillService
+from app.utils.cache import sha256_hex
+from app.utils import metrics
+
+DB_WRITE_SECONDS = metrics.histogram("resume_db_write_seconds", "一批解析结果写库的耗时（含技能名解析和事务提交）")
+DB_WRITE_ROWS = metrics.counter("resume_db_write_resumes_total", "批量写库的简历数", ["kind"])
+
+# 抽取出结构化信息的简历要写回的字段（状态单独算，所有简历都要写）
+PROFILE_UPDATE_FIELDS = [
+    "name", "phone", "email",
+    "university", "schooltier", "university_canonical", "school_tier",
+    "degree", "major", "graduation_time",
+    "skills", "work_experience", "projects",
+    "parse_result", "avatar_url", "file_hash",
+]
+EVALUATION_UPDATE_FIELDS = ["score", "is_qualified", "reason", "criteria_hash", "evaluated_at"]
+
+
+class ResumeWriter:
+    """
+    一批简历的写库操作
+    以前每份简历要 save 两三次、查两次技能、clear + add 关联、逐个提示词 update_or_create，约十次往返；
+    现在整批合并成：技能查询 / 补建、简历 CASE WHEN 批量更新、关联表一次删除 + 插入、评估一次 UPSERT，
+    提交后再把倒排索引一次删除 + 插入
+    """
+
+    def __init__(self):
+        self._profiles: Dict[int, Resume] = {}
+        self._texts: Dict[int, Optional[str]] = {}
+        self._statuses: Dict[int, Resume] = {}
+        self._evaluations: List[ResumeEvaluation] = []
+
+    def add_profile(self, resume: Resume, text: Optional[str] = None) -> None:
+        """结构化字段已经设置到 resume 上（ResumeService.apply_profile）"""
+        self._profiles[resume.id] = resume
+        self._texts[resume.id] = text
+
+    def add_evaluation(self, resume: Resume, prompt, evaluation: dict) -> None:
+        self._evaluations.append(ResumeEvaluation(
+            resume_id=resume.id,
+            prompt_id=prompt.id,
+            score=evaluation.get("score"),
+            is_qualified=evaluation.get("is_qualified", False),
+            reason=evaluation.get("reason"),
+            criteria_hash=sha256_hex(prompt.content),
+            evaluated_at=datetime.utcnow(),
+        ))
+
+    def set_status(self, resume: Resume, status: int) -> None:
+        resume.status = status
+        self._statuses[resume.id] = resume
+
+    async def flush(self) -> Dict[int, List[int]]:
+        """
+        一个事务写完整批，返回 {简历 ID: [技能 ID]}
+        技能索引由调用方在这里返回之后（事务已提交）再更新，回滚的数据不能进索引
+        """
+        started = time.perf_counter()
+        try:
+            return await self._flush()
+        finally:
+            DB_WRITE_SECONDS.observe(time.perf_counter() - started)
+            DB_WRITE_ROWS.inc(len(self._profiles), kind="profile")
+            DB_WRITE_ROWS.inc(len(self._statuses.keys() - self._profiles.keys()), kind="status_only")
+
+    async def _flush(self) -> Dict[int, List[int]]:
+        skill_links: Dict[int, List[int]] = {}
+        profiles = list(self._profiles.values())
+        if profiles:
+            names = {name for resume in profiles for name in (resume.skills or [])}
+            skill_ids = await SkillService.resolve_skill_ids(names)
+            skill_links = {
+                resume.id: list(dict.fromkeys(skill_ids[n] for n in (resume.skills or []) if n in skill_ids))
+                for resume in profiles
+            }
+
+        async with in_transaction() as conn:
+            if profiles:
+                await Resume.bulk_update(
+                    profiles, fields=PROFILE_UPDATE_FIELDS + ["status"], using_db=conn
+                )
+                await self._replace_skill_links(conn, skill_links)
+
+            status_only = [r for rid, r in self._statuses.items() if rid not in self._profiles]
+            if status_only:
+                await Resume.bulk_update(status_only, fields=["status"], using_db=conn)
+
+            if self._evaluations:
+                await ResumeEvaluation.bulk_create(
+                    self._evaluations,
+                    on_conflict=["resume_id", "prompt_id"],
+                    update_fields=EVALUATION_UPDATE_FIELDS,
+                    using_db=conn,
+                )
+
+        # 倒排索引是派生数据，放在事务外写，不拉长写库事务；失败只影响关键字检索（可用 SearchService.rebuild 补）
+        if profiles:
+            try:
+                await SearchService.index_resumes([(r, self._texts[r.id]) for r in profiles])
+            except Exception as e:
+                print(f"倒排索引更新失败: {e}")
+        return skill_links
+
+    @staticmethod
+    async def _replace_skill_links(conn, skill_links: Dict[int, List[int]]) -> None:
+        """简历-技能关联表：整批先删后插（相当于逐份 clear + add，但只有两条语句）"""
+        field = Resume._meta.fields_map["skill_tags"]
+        table = Table(field.through)
+        resume_col, skill_col = table[field.backward_key], table[field.forward_key]
+
+        delete = conn.query_class.from_(table).where(resume_col.isin(list(skill_links))).delete()
+        await conn.execute_query(*delete.get_parameterized_sql())
+
+        pairs = [(rid, sid) for rid, sids in skill_links.items() for sid in sids]
+        if not pairs:
+            return
+        insert = conn.query_class.into(table).columns(resume_col, skill_col)
+        for rid, sid in pairs:
+            insert = insert.insert(rid, sid)
+        await conn.execute_query(*insert.get_parameterized_sql())
@@ -0,0 +1,308 @@
+import asyncio
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Dict, Optional
+
+from tortoise import timezone
+from tortoise.functions import Count
+from tortoise.transactions import in_transaction
+
+from app.db.reanalysis_run_table import ReanalysisRun
+from app.db.resume_job_table import ResumeJob
+from app.db.resume_table import Resume
+from app.services.prompt_service import PromptService
+from app.services.job_service import (
+    JobService,
+    JOB_PENDING,
+    JOB_RUNNING,
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_PAUSED,
+    JOB_CANCELLED,
+    JOB_PRIORITY_REANALYZE,
+)
+from app.utils.cache import TTLCache
+from app.utils.events import event_bus
+from app.settings import EVENT_PROGRESS_INTERVAL, EVENT_RELAY_BATCH, EVENT_RELAY_INTERVAL, RUN_WINDOW_SIZE
+
+RUN_RUNNING = 0
+RUN_FINISHED = 1
+RUN_PAUSED = 2
+RUN_CANCELLED = 3
+
+# 事件 topic：全部简历的状态变化 / 某次批量重测
+TOPIC_RESUMES = "resumes"
+
+# 转发时往回多看的秒数，容忍各进程之间的时钟偏差和未提交的事务
+_RELAY_SLACK_SECONDS = 5
+
+
+def run_topic(run_id: int) -> str:
+    return f"run:{run_id}"
+
+
+class RunService:
+    """
+    批量重测：按简历 ID 分段喂进任务队列（滑动窗口），支持暂停 / 继续 / 取消，checkpoint_id 即断点
+    进度：状态变化走进程内事件，汇总进度按任务表聚合（多个订阅者共用一份快照）
+    worker 独立部署时事件发生在别的进程，API 进程轮询任务表的变化转发到本进程的事件总线（relay_job_events）
+    """
+
+    _snapshots = TTLCache("run_progress", 1000, EVENT_PROGRESS_INTERVAL)
+    # run_id → 固定下来的提示词（快照创建后不会变，缓存到进程结束或被挤出）
+    _pinned_prompts = TTLCache("run_prompts", 100)
+    # run_id → 最近的 (时间, 已结束数)，用来算最近一段时间的吞吐
+    # 结束 / 取消时删除；暂停后再没人看的批次一小时没有快照就过期，条目数也有上限
+    _samples = TTLCache("run_samples", 1000, 3600)
+    # 转发状态：上次轮询到的位置、已转发过的 任务 ID → (状态, updated_at)、后台任务
+    _relayed_at = None
+    _relayed: Dict[int, tuple] = {}
+    _relay_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    async def create_run() -> Optional[ReanalysisRun]:
+        """
+        重测当前全部简历：只记下 ID 上界和总数，不把 ID 读进内存
+        之后上传的简历有自己的解析任务，不算在这次重测里；简历库为空时返回 None
+        同时固定下当前参与评估的提示词，整个批次都按这一版评估
+        """
+        last_id = await Resume.filter(is_deleted=0).order_by("-id").limit(1).values_list("id", flat=True)
+        if not last_id:
+            return None
+        total = await Resume.filter(is_deleted=0, id__lte=last_id[0]).count()
+        prompts = PromptService.snapshot(await PromptService.get_evaluation_prompts())
+        return await ReanalysisRun.create(total=total, max_resume_id=last_id[0], prompts=prompts)
+
+    @classmethod
+    async def pinned_prompts(cls, run_id: int) -> Optional[list]:
+        """批量重测固定的提示词；旧记录没有快照时返回 None（按当前提示词评估）"""
+        prompts = cls._pinned_prompts.get(run_id)
+        if prompts is None:
+            snapshot = await ReanalysisRun.filter(id=run_id).values_list("prompts", flat=True)
+            if not snapshot or snapshot[0] is None:
+                return None
+            prompts = PromptService.from_snapshot(snapshot[0])
+            cls._pinned_prompts.set(run_id, prompts)
+        return prompts
+
+    @staticmethod
+    async def feed() -> int:
+        """
+        给进行中的批量重测补任务：每个批次在队列里（待处理 + 处理中）最多 RUN_WINDOW_SIZE 个，
+        空出半个窗口以上才补一段，worker 就一直有活干，又不会一次塞进十万行任务
+        多个 worker 同时补时用 checkpoint_id 做乐观锁，同一段只会入队一次；返回入队数
+        """
+        fed = 0
+        for run in await ReanalysisRun.filter(status=RUN_RUNNING):
+            if run.checkpoint_id >= run.max_resume_id:
+                continue
+            outstanding = await ResumeJob.filter(run_id=run.id, status__in=[JOB_PENDING, JOB_RUNNING]).count()
+            room = RUN_WINDOW_SIZE - outstanding
+            if room < max(RUN_WINDOW_SIZE // 2, 1):
+                continue
+
+            ids = await (
+                Resume.filter(is_deleted=0, id__gt=run.checkpoint_id, id__lte=run.max_resume_id)
+                .order_by("id")
+                .limit(room)
+                .values_list("id", flat=True)
+            )
+            checkpoint = ids[-1] if len(ids) == room else run.max_resume_id
+            async with in_transaction():
+                updated = await ReanalysisRun.filter(
+                    id=run.id, status=RUN_RUNNING, checkpoint_id=run.checkpoint_id
+                ).update(checkpoint_id=checkpoint)
+                if updated and ids:
+                    await JobService.enqueue_many(ids, run_id=run.id, priority=JOB_PRIORITY_REANALYZE)
+                    fed += len(ids)
+        return fed
+
+    @staticmethod
+    async def pause(run_id: int) -> bool:
+        """暂停：不再补任务，已入队还没开始的任务挂起；正在处理的跑完"""
+        async with in_transaction():
+            updated = await ReanalysisRun.filter(id=run_id, status=RUN_RUNNING).update(status=RUN_PAUSED)
+            if updated:
+                await ResumeJob.filter(run_id=run_id, status=JOB_PENDING).update(
+                    status=JOB_PAUSED, updated_at=timezone.now()
+                )
+        return bool(updated)
+
+    @staticmethod
+    async def resume(run_id: int) -> bool:
+        async with in_transaction():
+            updated = await ReanalysisRun.filter(id=run_id, status=RUN_PAUSED).update(status=RUN_RUNNING)
+            if updated:
+                now = timezone.now()
+                await ResumeJob.filter(run_id=run_id, status=JOB_PAUSED).update(
+                    status=JOB_PENDING, available_at=now, updated_at=now
+                )
+        return bool(updated)
+
+    @staticmethod
+    async def cancel(run_id: int) -> bool:
+        """取消：还没开始的任务全部取消，正在处理的跑完"""
+        async with in_transaction():
+            updated = await ReanalysisRun.filter(id=run_id, status__in=[RUN_RUNNING, RUN_PAUSED]).update(
+                status=RUN_CANCELLED, finished_at=timezone.now()
+            )
+            if updated:
+                await ResumeJob.filter(run_id=run_id, status__in=[JOB_PENDING, JOB_PAUSED]).update(
+                    status=JOB_CANCELLED, updated_at=timezone.now()
+                )
+        return bool(updated)
+
+    @staticmethod
+    def publish_status(resume_id: int, old_status, new_status, run_id: Optional[int] = None, error: str = None):
+        """简历状态变化（0→1→2/3/4），由 process_resume_workflow 调用"""
+        event = {
+            "type": "status",
+            "resume_id": resume_id,
+            "from": old_status,
+            "to": new_status,
+            "run_id": run_id,
+            "error": error,
+            "ts": time.time(),
+        }
+        event_bus.publish(TOPIC_RESUMES, event)
+        if run_id is not None:
+            event_bus.publish(run_topic(run_id), event)
+
+    @classmethod
+    async def relay_job_events(cls) -> int:
+        """
+        把其他进程（独立部署的 worker）造成的状态变化转成 status 事件发布到本进程，返回发布的条数
+        按任务表的 updated_at 增量读取（状态变化时都会刷新它）；两次轮询之间的中间状态会被合并，
+        比如 1 秒内领取又完成的任务只推一条完成事件。第一次调用只记下起点，不回放历史
+        """
+        now = timezone.now()
+        if cls._relayed_at is None:
+            cls._relayed_at = now
+            return 0
+
+        since = cls._relayed_at - timedelta(seconds=_RELAY_SLACK_SECONDS)
+        rows = await ResumeJob.filter(
+            updated_at__gte=since, status__in=[JOB_RUNNING, JOB_DONE, JOB_FAILED, JOB_PENDING]
+        ).order_by("updated_at", "id").limit(EVENT_RELAY_BATCH).values(
+            "id", "resume_id", "run_id", "status", "last_error", "updated_at", "resume__status"
+        )
+
+        published = 0
+        for row in rows:
+            key = (row["status"], row["updated_at"])
+            if cls._relayed.get(row["id"]) == key:
+                continue
+            cls._relayed[row["id"]] = key
+            # 新入队的任务简历状态没变；失败后等待重试的任务简历已经是解析失败
+            if row["status"] == JOB_PENDING and not row["last_error"]:
+                continue
+            # 刚领取时 worker 可能还没把简历改成解析中，按任务状态算
+            new_status = 1 if row["status"] == JOB_RUNNING else row["resume__status"]
+            old_status = None if row["status"] == JOB_RUNNING else 1
+            error = row["last_error"] if row["status"] != JOB_DONE else None
+            cls.publish_status(row["resume_id"], old_status, new_status, row["run_id"], error)
+            published += 1
+
+        # 一次没读完就从读到的位置接着读，否则从这次轮询开始的时刻接着读
+        cls._relayed_at = rows[-1]["updated_at"] if len(rows) >= EVENT_RELAY_BATCH else now
+        cutoff = cls._relayed_at - timedelta(seconds=_RELAY_SLACK_SECONDS)
+        cls._relayed = {job_id: key for job_id, key in cls._relayed.items() if key[1] >= cutoff}
+        return published
+
+    @classmethod
+    def start_event_relay(cls) -> None:
+        if cls._relay_task is None or cls._relay_task.done():
+            cls._relay_task = asyncio.create_task(cls._relay_loop())
+
+    @classmethod
+    async def stop_event_relay(cls) -> None:
+        if cls._relay_task:
+            cls._relay_task.cancel()
+            await asyncio.gather(cls._relay_task, return_exceptions=True)
+            cls._relay_task = None
+
+    @classmethod
+    async def _relay_loop(cls):
+        while True:
+            await asyncio.sleep(EVENT_RELAY_INTERVAL)
+            # 没人订阅时不查库；下次有人订阅时从那一刻开始转发
+            if not event_bus.has_subscribers():
+                cls._relayed_at = None
+                cls._relayed.clear()
+                continue
+            try:
+                await cls.relay_job_events()
+            except Exception as e:
+                print(f"状态事件转发失败: {e}")
+
+    @classmethod
+    async def snapshot(cls, run_id: int) -> Optional[dict]:
+        cached = cls._snapshots.get(run_id)
+        if cached is not None:
+            return cached
+
+        run = await ReanalysisRun.get_or_none(id=run_id)
+        if not run:
+            return None
+
+        rows = await ResumeJob.filter(run_id=run_id).annotate(n=Count("id")).group_by("status").values("status", "n")
+        jobs = {row["status"]: row["n"] for row in rows}
+        outcome_rows = (
+            await ResumeJob.filter(run_id=run_id, status=JOB_DONE)
+            .annotate(n=Count("id"))
+            .group_by("resume__status")
+            .values("resume__status", "n")
+        )
+        outcomes = {row["resume__status"]: row["n"] for row in outcome_rows}
+
+        finished = jobs.get(JOB_DONE, 0) + jobs.get(JOB_FAILED, 0)
+        now = time.monotonic()
+        samples = cls._samples.get(run_id)
+        if samples is None:
+            samples = deque(maxlen=30)
+        samples.append((now, finished))
+        cls._samples.set(run_id, samples)  # 每次都写回，刷新过期时间
+        oldest_ts, oldest_finished = samples[0]
+        if now - oldest_ts > 0:
+            throughput = (finished - oldest_finished) / (now - oldest_ts)
+        else:
+            elapsed = max((timezone.now() - run.created_at).total_seconds(), 1e-6)
+            throughput = finished / elapsed
+
+        remaining = max(run.total - finished, 0) if run.status != RUN_CANCELLED else 0
+        in_queue = jobs.get(JOB_PENDING, 0) + jobs.get(JOB_RUNNING, 0)
+        if run.status == RUN_RUNNING and run.checkpoint_id >= run.max_resume_id and not in_queue:
+            # 全部入队过且都处理完了（期间被删除的简历不会入队，所以不能只比较 total）
+            await ReanalysisRun.filter(id=run_id, status=RUN_RUNNING).update(
+                status=RUN_FINISHED, finished_at=timezone.now()
+            )
+            run.status = RUN_FINISHED
+        done = run.status == RUN_FINISHED or (run.status == RUN_CANCELLED and not jobs.get(JOB_RUNNING, 0))
+        # 结束或取消后不再算 ETA（取消时剩余数记为 0），采样可以删了
+        if run.status in (RUN_FINISHED, RUN_CANCELLED):
+            cls._samples.pop(run_id)
+
+        snapshot = {
+            "type": "progress",
+            "run_id": run_id,
+            "total": run.total,
+            "pending": jobs.get(JOB_PENDING, 0),
+            "running": jobs.get(JOB_RUNNING, 0),
+            "finished": finished,
+            "qualified": outcomes.get(2, 0),
+            "unqualified": outcomes.get(3, 0),
+            "failed": jobs.get(JOB_FAILED, 0),
+            "paused": jobs.get(JOB_PAUSED, 0),
+            "cancelled": jobs.get(JOB_CANCELLED, 0),
+            "status": run.status,
+            "checkpoint_id": run.checkpoint_id,
+            "max_resume_id": run.max_resume_id,
+            "prompt_ids": [p["id"] for p in run.prompts or []],
+            "throughput": round(throughput, 3),
+            "eta_seconds": round(remaining / throughput, 1) if throughput > 0 and remaining else None,
+            "done": done,
+            "created_at": run.created_at.isoformat(),
+        }
+        cls._snapshots.set(run_id, snapshot)
+        return snapshot
@@ -0,0 +1,145 @@
+# app/services/search_service.py - 简历全文检索（自建倒排索引，兼容 MySQL / SQLite）
+from typing import List, Optional, Tuple
+
+from tortoise.functions import Count, Sum
+
+from app.db.resume_table import Resume
+from app.db.resume_term_table import ResumeTerm
+from app.utils.tokenizer import tokenize, query_tokens
+from app.settings import SEARCH_MAX_CANDIDATES, SEARCH_MAX_TERMS_PER_FIELD
+
+# 命中不同字段的排序权重
+FIELD_WEIGHTS = {
+    "name": 10,
+    "phone": 8,
+    "email": 8,
+    "university": 6,
+    "major": 6,
+    "skills": 5,
+    "experience": 2,
+    "text": 1,
+}
+
+
+def _join(value) -> str:
+    if not value:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return "\n".join(str(v) for v in value if v)
+    return str(value)
+
+
+class SearchService:
+    @staticmethod
+    def _documents(resume: Resume, text: Optional[str] = None) -> dict:
+        docs = {
+            "name": resume.name,
+            "phone": resume.phone,
+            "email": resume.email,
+            "university": resume.university,
+            "major": resume.major,
+            "skills": _join(resume.skills),
+            "experience": _join(resume.work_experience) + "\n" + _join(resume.projects),
+        }
+        if text is not None:
+            docs["text"] = text
+        return docs
+
+    @staticmethod
+    async def index_resume(resume: Resume, text: Optional[str] = None) -> None:
+        """
+        增量更新一份简历的索引（先删后插）
+        text=None 表示没有原文（手动录入 / 回填），保留已有的原文索引
+        """
+        await SearchService.index_resumes([(resume, text)])
+
+    @staticmethod
+    async def index_resumes(items: List[Tuple[Resume, Optional[str]]]) -> None:
+        """批量更新索引：[(简历, 原文)]，整批一次删除 + 一次插入"""
+        rows = []
+        with_text, without_text = [], []
+        for resume, text in items:
+            for field, value in SearchService._documents(resume, text).items():
+                terms = tokenize(value)[:SEARCH_MAX_TERMS_PER_FIELD]
+                weight = FIELD_WEIGHTS[field]
+                rows.extend(ResumeTerm(resume_id=resume.id, field=field, term=t, weight=weight) for t in terms)
+            (without_text if text is None else with_text).append(resume.id)
+
+        if with_text:
+            await ResumeTerm.filter(resume_id__in=with_text).delete()
+        if without_text:
+            await ResumeTerm.filter(resume_id__in=without_text).exclude(field="text").delete()
+        if rows:
+            await ResumeTerm.bulk_create(rows, batch_size=1000)
+
+    @staticmethod
+    async def remove(resume_ids: List[int]) -> None:
+        await ResumeTerm.filter(resume_id__in=resume_ids).delete()
+
+    @staticmethod
+    async def match_field(field: str, value: str) -> Optional[List[int]]:
+        """
+        某字段包含 value 的候选简历 ID（所有 bigram 都命中）
+        返回 None 表示索引帮不上忙（单字查询 / 候选太多），调用方直接交给数据库过滤
+        """
+        tokens = query_tokens(value)
+        if not tokens:
+            return None
+        ids = (
+            await ResumeTerm.filter(field=field, term__in=tokens)
+            .annotate(matched=Count("term", distinct=True))
+            .group_by("resume_id")
+            .filter(matched=len(tokens))
+            .limit(SEARCH_MAX_CANDIDATES + 1)
+            .values_list("resume_id", flat=True)
+        )
+        if len(ids) > SEARCH_MAX_CANDIDATES:
+            return None
+        return list(ids)
+
+    @staticmethod
+    async def match_any(field: str, values: List[str]) -> Optional[List[int]]:
+        """多个候选值（比如学校别名）任一命中"""
+        result = set()
+        for value in values:
+            ids = await SearchService.match_field(field, value)
+            if ids is None:
+                return None
+            result.update(ids)
+        return list(result)
+
+    @staticmethod
+    async def rank(keyword: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        全文检索：所有词都命中的简历，按命中字段权重之和排序
+        返回 [(resume_id, score)]；None 表示索引帮不上忙（关键字太短 / 命中超过 SEARCH_MAX_CANDIDATES），
+        和 match_field 一样交给数据库过滤，截断后的结果总数和分页都不对
+        """
+        tokens = query_tokens(keyword)
+        if not tokens:
+            return None
+        rows = (
+            await ResumeTerm.filter(term__in=tokens)
+            .annotate(matched=Count("term", distinct=True), score=Sum("weight"))
+            .group_by("resume_id")
+            .filter(matched=len(tokens))
+            .order_by("-score")
+            .limit(SEARCH_MAX_CANDIDATES + 1)
+            .values_list("resume_id", "score")
+        )
+        if len(rows) > SEARCH_MAX_CANDIDATES:
+            return None
+        return [(rid, int(score or 0)) for rid, score in rows]
+
+    @staticmethod
+    async def rebuild(batch_size: int = 500) -> int:
+        """按 ID 分批重建全部简历的结构化字段索引（原文索引只能在解析时写入）"""
+        count = 0
+        last_id = 0
+        while True:
+            batch = await Resume.filter(id__gt=last_id, is_deleted=0).order_by("id").limit(batch_size)
+            if not batch:
+                return count
+            await SearchService.index_resumes([(resume, None) for resume in batch])
+            count += len(batch)
+            last_id = batch[-1].id
@@ -1,23 +1,237 @@
+import asyncio
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tortoise import timezone
+from tortoise.expressions import Q, Subquery
+
+from app.db.resume_job_table import ResumeJob
+from app.db.resume_table import Resume
 from app.db.skill_table import Skill
+from app.services.job_service import JOB_DONE
+from app.utils.bitmap import Bitmap
 from app.utils.helpers import normalize_skills
+from app.settings import SKILL_INDEX_LOAD_BATCH, SKILL_INDEX_REFRESH_SECONDS, SKILL_NAME_CACHE_MAX_ITEMS
 
 
 class SkillService:
-    @staticmethod
-    async def get_or_create_skills(skills: list[str]) -> list[Skill]:
-        normalized = normalize_skills(skills)
-        if not normalized:
-            return []
+    # 进程内技能索引：技能 ID → 简历 ID 位图，技能名 → 技能 ID
+    # 启动时全量加载，本进程写技能时同步更新，其他进程（独立 worker）写的通过任务表定时增量同步
+    _ids_by_name: Dict[str, int] = {}
+    _name_hits = 0
+    _name_misses = 0
+    _postings: Dict[int, Bitmap] = {}
+    _loaded = False
+    _synced_at = None
+    _refresh_task: Optional[asyncio.Task] = None
 
-        existing_skills = await Skill.filter(name__in=normalized)
-        existing_by_name = {skill.name: skill for skill in existing_skills}
-        missing = [name for name in normalized if name not in existing_by_name]
+    @classmethod
+    async def resolve_skill_ids(cls, skills: Iterable[str]) -> Dict[str, int]:
+        """
+        技能名 → 技能 ID（不存在的先建），返回 {标准化后的技能名: ID}
+        技能表只增不改，名字和 ID 的对应一旦建立就不会变，所以缓存不需要失效；全部命中时不查库
+        """
+        normalized = normalize_skills(list(skills))
+        if not normalized:
+            return {}
 
+        ids = {name: cls._ids_by_name[name] for name in normalized if name in cls._ids_by_name}
+        missing = [name for name in normalized if name not in ids]
+        cls._name_hits += len(ids)
+        cls._name_misses += len(missing)
         if missing:
-            await Skill.bulk_create(
-                [Skill(name=name) for name in missing],
-                ignore_conflicts=True,
-            )
-            existing_skills = await Skill.filter(name__in=normalized)
+            # 可能是别的进程刚建的，先查一次；还没有的再建
+            found = dict(await Skill.filter(name__in=missing).values_list("name", "id"))
+            new = [name for name in missing if name not in found]
+            if new:
+                await Skill.bulk_create([Skill(name=name) for name in new], ignore_conflicts=True)
+                found.update(await Skill.filter(name__in=new).values_list("name", "id"))
+            cls._remember(found)
+            ids.update(found)
+        return ids
+
+    @classmethod
+    def _remember(cls, ids_by_name: Dict[str, int]) -> None:
+        # 有上限：技能表异常膨胀时不再往缓存里加，超出的名字每次查库
+        room = SKILL_NAME_CACHE_MAX_ITEMS - len(cls._ids_by_name)
+        if room <= 0:
+            return
+        for name, skill_id in list(ids_by_name.items())[:room]:
+            cls._ids_by_name[name] = skill_id
+
+    @classmethod
+    async def load_names(cls) -> None:
+        """预热技能名缓存（独立 worker 不加载位图索引，只需要这个）"""
+        rows = await Skill.all().order_by("id").limit(SKILL_NAME_CACHE_MAX_ITEMS).values_list("name", "id")
+        cls._ids_by_name = {}
+        cls._remember(dict(rows))
+
+    # ==================== 技能索引 ====================
+
+    @classmethod
+    async def load_index(cls) -> None:
+        """全量加载（按简历 ID 分段读取，避免一次拉出整张关联表）"""
+        synced_at = timezone.now()
+        await cls.load_names()
+        postings: Dict[int, Bitmap] = {}
+
+        last_id = await Resume.all().order_by("-id").limit(1).values_list("id", flat=True)
+        max_id = last_id[0] if last_id else 0
+        for start in range(0, max_id, SKILL_INDEX_LOAD_BATCH):
+            rows = await Resume.filter(
+                is_deleted=0, id__gt=start, id__lte=start + SKILL_INDEX_LOAD_BATCH
+            ).values_list("id", "skill_tags__id")
+            for resume_id, skill_id in rows:
+                if skill_id is not None:
+                    postings.setdefault(skill_id, Bitmap()).add(resume_id)
+
+        cls._postings = postings
+        cls._synced_at = synced_at
+        cls._loaded = True
+
+    @classmethod
+    async def refresh_index(cls) -> int:
+        """增量同步：上次同步以来完成解析的简历重新读取技能，返回更新的简历数"""
+        if not cls._loaded:
+            await cls.load_index()
+            return 0
+
+        # 往前多看几秒，避免和正在提交的事务擦肩而过
+        since = cls._synced_at - timedelta(seconds=5)
+        synced_at = timezone.now()
+
+        # 技能 ID 自增，本进程见过的最大 ID 就是缓存的版本号，只拉比它新的
+        known_max = max(cls._ids_by_name.values(), default=0)
+        cls._remember(dict(await Skill.filter(id__gt=known_max).values_list("name", "id")))
+
+        resume_ids = list(
+            set(await ResumeJob.filter(status=JOB_DONE, updated_at__gte=since).values_list("resume_id", flat=True))
+        )
+        for i in range(0, len(resume_ids), 1000):
+            chunk = resume_ids[i:i + 1000]
+            links = {rid: [] for rid in chunk}
+            rows = await Resume.filter(id__in=chunk, is_deleted=0).values_list("id", "skill_tags__id")
+            for resume_id, skill_id in rows:
+                if skill_id is not None:
+                    links[resume_id].append(skill_id)
+            cls.index_resume_skills(links)
+
+        cls._synced_at = synced_at
+        return len(resume_ids)
+
+    @classmethod
+    def start_index_refresh(cls) -> None:
+        if cls._refresh_task is None or cls._refresh_task.done():
+            cls._refresh_task = asyncio.create_task(cls._refresh_loop())
+
+    @classmethod
+    async def stop_index_refresh(cls) -> None:
+        if cls._refresh_task:
+            cls._refresh_task.cancel()
+            await asyncio.gather(cls._refresh_task, return_exceptions=True)
+            cls._refresh_task = None
+
+    @classmethod
+    async def _refresh_loop(cls):
+        while True:
+            await asyncio.sleep(SKILL_INDEX_REFRESH_SECONDS)
+            try:
+                await cls.refresh_index()
+            except Exception as e:
+                print(f"技能索引同步失败: {e}")
+
+    @classmethod
+    def index_resume_skills(cls, links: Dict[int, Iterable[int]]) -> None:
+        """
+        用最新的技能覆盖这些简历在索引中的位置（{简历 ID: [技能 ID]}）
+        必须在写库事务提交之后调用，回滚的数据不能进索引
+        """
+        if not cls._loaded or not links:
+            return
+        cls.remove_resumes(links.keys())
+        for resume_id, skill_ids in links.items():
+            for skill_id in skill_ids:
+                cls._postings.setdefault(skill_id, Bitmap()).add(resume_id)
+
+    @classmethod
+    def remove_resumes(cls, resume_ids: Iterable[int]) -> None:
+        if not cls._loaded:
+            return
+        removed = Bitmap(resume_ids)
+        for posting in cls._postings.values():
+            posting.difference_update(removed)
+
+    @staticmethod
+    def parse_query(skill: str) -> Tuple[List[List[str]], List[str]]:
+        """
+        技能查询语法：逗号分隔的条件取交集，条件内用 | 取并集，- 开头表示排除
+        例如 "python,java|go,-php" 表示 python 且 (java 或 go) 且不含 php
+        返回 (必须满足的条件组, 排除的技能)
+        """
+        groups, excluded = [], []
+        for part in skill.replace("，", ",").split(","):
+            part = part.strip().lower()
+            if not part:
+                continue
+            if part.startswith("-"):
+                name = part[1:].strip()
+                if name:
+                    excluded.append(name)
+                continue
+            names = [n.strip() for n in part.split("|") if n.strip()]
+            if names:
+                groups.append(names)
+        return groups, excluded
+
+    @classmethod
+    async def _resolve_names(cls, names: Iterable[str]) -> None:
+        # 别的进程新建的技能名，本进程还没同步到，查一次库
+        unknown = [n for n in set(names) if n not in cls._ids_by_name]
+        if unknown:
+            cls._remember(dict(await Skill.filter(name__in=unknown).values_list("name", "id")))
+
+    @classmethod
+    async def match(cls, groups: List[List[str]], excluded: List[str]) -> Optional[Bitmap]:
+        """
+        在索引上求满足技能条件的简历 ID 位图
+        索引未加载或只有排除条件（结果是几乎全部简历）时返回 None，由调用方走数据库
+        """
+        if not cls._loaded or not groups:
+            return None
+
+        await cls._resolve_names([n for group in groups for n in group] + excluded)
+        empty = Bitmap()
+        result = None
+        for group in sorted(groups, key=len):
+            union = Bitmap()
+            for name in group:
+                union = union | cls._postings.get(cls._ids_by_name.get(name), empty)
+            result = union if result is None else result & union
+            if not result:
+                return result
+
+        for name in excluded:
+            result = result - cls._postings.get(cls._ids_by_name.get(name), empty)
+        return result
+
+    @staticmethod
+    def sql_filter(groups: List[List[str]], excluded: List[str]) -> Q:
+        """索引不可用或结果太多时的数据库条件（每个条件一个子查询，不用 DISTINCT）"""
+        q = Q()
+        for group in groups:
+            q &= Q(id__in=Subquery(Resume.filter(skill_tags__name__in=group).values("id")))
+        for name in excluded:
+            q &= ~Q(id__in=Subquery(Resume.filter(skill_tags__name=name).values("id")))
+        return q
 
-        return existing_skills
+    @classmethod
+    def index_stats(cls) -> dict:
+        return {
+            "loaded": cls._loaded,
+            "skills": len(cls._ids_by_name),
+            "name_cache_hits": cls._name_hits,
+            "name_cache_misses": cls._name_misses,
+            "postings": sum(len(p) for p in cls._postings.values()),
+            "memory_bytes": sum(p.memory_bytes() for p in cls._postings.values()),
+            "synced_at": cls._synced_at.isoformat() if cls._synced_at else None,
+        }
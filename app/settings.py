@@ -18,12 +18,18 @@ TORTOISE_ORM = {
                     "app.db.resume_table",
                     "app.db.prompt_table", 
                     "app.db.resume_evaluation_table",
-                    "app.db.skill_table"
+                    "app.db.skill_table",
+                    "app.db.resume_job_table",
+                    "app.db.resume_term_table",
+                    "app.db.reanalysis_run_table",
                     ],
             "default_connection": "default",
         }
     },
 }
+# 表结构由 python -m app.scripts.migrate 单独建立 / 升级，服务启动时不再建表；
+# 本地开发用 SQLite 图省事时可以设为 1
+DB_GENERATE_SCHEMAS = os.getenv("DB_GENERATE_SCHEMAS", "0") == "1"
 
 
 # --- MinIO 配置 ---
@@ -32,6 +38,16 @@ MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
 MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "minioadmin")
 MINIO_BUCKET_NAME = "resumes"  # 你的桶名字
 MINIO_SECURE = False  # 如果是 https 设为 True
+# 流式上传的分片大小（minio 要求 >= 5MB），每个上传最多占用这么多内存
+MINIO_PART_SIZE = int(os.getenv("MINIO_PART_SIZE", str(5 * 1024 * 1024)))
+# 连接池和超时：SDK 默认只有 10 个连接、5 分钟超时，并发下载会在池子上排队
+MINIO_MAX_CONNECTIONS = int(os.getenv("MINIO_MAX_CONNECTIONS", "64"))
+MINIO_THREADS = int(os.getenv("MINIO_THREADS", str(MINIO_MAX_CONNECTIONS)))  # MinIO 阻塞调用专用线程数，不占默认线程池
+MINIO_CONNECT_TIMEOUT = float(os.getenv("MINIO_CONNECT_TIMEOUT", "5"))
+MINIO_READ_TIMEOUT = float(os.getenv("MINIO_READ_TIMEOUT", "60"))  # 单次读取（不是整个请求）的超时
+MINIO_MAX_RETRIES = int(os.getenv("MINIO_MAX_RETRIES", "3"))  # 连接错误 / 5xx 的重试次数
+UPLOAD_BATCH_CONCURRENCY = int(os.getenv("UPLOAD_BATCH_CONCURRENCY", "16"))  # 批量上传时同时写 MinIO 的文件数
+UPLOAD_BATCH_MAX_FILES = int(os.getenv("UPLOAD_BATCH_MAX_FILES", "5000"))  # 单次批量上传最多文件数（含 ZIP 内文件）
 
 
 # --- 大模型配置 (这里以 OpenAI 兼容接口为例，比如 DeepSeek 或 Moonshot) ---
@@ -40,3 +56,86 @@ LLM_BASE_URL = os.getenv("LLM_BASE_URL") # 示例地址
 LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME")
 if not LLM_API_KEY:
     raise ValueError("未配置 LLM_API_KEY")
+# 服务商配额：每分钟请求数 / 每分钟 token 数，0 表示不限制
+LLM_RPM = int(os.getenv("LLM_RPM", "0"))
+LLM_TPM = int(os.getenv("LLM_TPM", "0"))
+# 自适应并发：从 INITIAL 开始，成功时慢慢加、遇到 429 或延迟超标时减半
+LLM_CONCURRENCY_INITIAL = int(os.getenv("LLM_CONCURRENCY_INITIAL", "3"))
+LLM_CONCURRENCY_MIN = int(os.getenv("LLM_CONCURRENCY_MIN", "1"))
+LLM_CONCURRENCY_MAX = int(os.getenv("LLM_CONCURRENCY_MAX", "32"))
+# 连接池：连接数不低于并发上限，否则请求会在连接池里排队，自适应并发看到的延迟也不准
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", str(LLM_CONCURRENCY_MAX)))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", str(LLM_MAX_CONNECTIONS)))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))  # 空闲连接保留秒数
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "0") == "1"  # 需要安装 h2；服务商不支持时自动按 HTTP/1.1 协商
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "10"))
+LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "120"))  # 单次请求超时（SDK 默认 10 分钟）
+LLM_LATENCY_TARGET = float(os.getenv("LLM_LATENCY_TARGET", "60"))  # 单次请求超过这个秒数视为服务商过载，0 表示不看延迟
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))  # 429 / 超时 / 5xx 的重试次数
+LLM_RETRY_BACKOFF_SECONDS = float(os.getenv("LLM_RETRY_BACKOFF_SECONDS", "2"))  # 没有 Retry-After 时的退避基数
+# 批量模式：一次请求最多放几份简历（1 表示关闭），以及单次请求的简历总字数上限
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "5"))
+LLM_BATCH_MAX_CHARS = int(os.getenv("LLM_BATCH_MAX_CHARS", "30000"))
+LLM_OUTPUT_TOKENS_PER_RESUME = int(os.getenv("LLM_OUTPUT_TOKENS_PER_RESUME", "800"))  # 预估 TPM 用量时每份简历抽取的输出 token
+LLM_OUTPUT_TOKENS_PER_EVALUATION = int(os.getenv("LLM_OUTPUT_TOKENS_PER_EVALUATION", "150"))  # 每次岗位评估的输出 token
+
+
+# --- 解析任务队列配置 ---
+JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", "32"))  # 每个 worker 进程同时在流水线里的任务数
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))  # 租约（可见性超时）时长
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))  # 最多尝试次数，超过后标记失败
+JOB_RETRY_BACKOFF_SECONDS = int(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "10"))  # 重试退避基数（指数增长）
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))  # 队列为空时的轮询间隔
+# API 进程内是否同时启动 worker；独立部署 worker（python -m app.worker）时设为 0
+RUN_EMBEDDED_WORKER = os.getenv("RUN_EMBEDDED_WORKER", "1") == "1"
+# 独立 worker 暴露 /metrics 的端口（API 进程内的 worker 直接用 API 的 /metrics），0 表示不开
+WORKER_METRICS_PORT = int(os.getenv("WORKER_METRICS_PORT", "0"))
+# 批量重测的滑动窗口：每个批次同时在任务队列里的最大任务数（应不小于所有 worker 的并发之和）
+RUN_WINDOW_SIZE = int(os.getenv("RUN_WINDOW_SIZE", str(JOB_WORKER_CONCURRENCY * 2)))
+RUN_FEED_INTERVAL = float(os.getenv("RUN_FEED_INTERVAL", "1"))  # 检查是否需要补任务的间隔（秒）
+# 进度推送（SSE）：进度快照间隔（秒），每个订阅者最多积压的事件数（满了丢最旧的）
+EVENT_PROGRESS_INTERVAL = float(os.getenv("EVENT_PROGRESS_INTERVAL", "1"))
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+# 独立部署 worker 时（RUN_EMBEDDED_WORKER=0）状态变化发生在别的进程，API 进程按任务表的 updated_at 轮询转发：
+# 轮询间隔（秒）和每次最多读取的任务行数；没有订阅者时不轮询
+EVENT_RELAY_INTERVAL = float(os.getenv("EVENT_RELAY_INTERVAL", str(EVENT_PROGRESS_INTERVAL)))
+EVENT_RELAY_BATCH = int(os.getenv("EVENT_RELAY_BATCH", "1000"))
+
+
+# --- 解析流水线配置（各阶段独立并发）---
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "64"))  # 阶段之间的队列长度
+PIPELINE_DOWNLOAD_CONCURRENCY = int(os.getenv("PIPELINE_DOWNLOAD_CONCURRENCY", "16"))
+PIPELINE_PARSE_WORKERS = int(os.getenv("PIPELINE_PARSE_WORKERS", str(os.cpu_count() or 2)))  # PDF 解析进程数
+# LLM 阶段的协程数只是上限，实际并发由 LLMClient 的自适应限流决定
+PIPELINE_LLM_CONCURRENCY = int(os.getenv("PIPELINE_LLM_CONCURRENCY", str(LLM_CONCURRENCY_MAX)))
+PIPELINE_WRITE_CONCURRENCY = int(os.getenv("PIPELINE_WRITE_CONCURRENCY", "2"))
+PIPELINE_WRITE_BATCH_SIZE = int(os.getenv("PIPELINE_WRITE_BATCH_SIZE", "20"))  # 每个事务最多写入的简历数
+
+
+# --- PDF 解析配置（进程池）---
+PDF_PARSE_TIMEOUT = float(os.getenv("PDF_PARSE_TIMEOUT", "30"))  # 单份文档解析超时（秒）
+PDF_PARSE_RETRIES = int(os.getenv("PDF_PARSE_RETRIES", "2"))  # 进程池被其他文档超时连带结束后，换新进程池重新解析的次数
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "20"))  # 最多读取的页数，0 表示不限制
+PDF_MAX_BYTES = int(os.getenv("PDF_MAX_BYTES", str(20 * 1024 * 1024)))  # 单个 PDF 最大字节数
+PDF_PARSE_MAX_MEMORY_MB = int(os.getenv("PDF_PARSE_MAX_MEMORY_MB", "1024"))  # 解析子进程内存上限，0 表示不限制
+AVATAR_MAX_SIDE = int(os.getenv("AVATAR_MAX_SIDE", "256"))  # 头像缩略图最长边（像素），超过则缩小后转 JPEG，0 表示保留原图
+AVATAR_JPEG_QUALITY = int(os.getenv("AVATAR_JPEG_QUALITY", "85"))
+
+
+# --- 去重缓存配置（进程内 LRU，ttl 单位秒，0 表示不过期）---
+PARSE_CACHE_MAX_ITEMS = int(os.getenv("PARSE_CACHE_MAX_ITEMS", "2000"))  # 文件哈希 → 解析文本
+PARSE_CACHE_TTL = float(os.getenv("PARSE_CACHE_TTL", str(24 * 3600)))
+LLM_CACHE_MAX_ITEMS = int(os.getenv("LLM_CACHE_MAX_ITEMS", "10000"))  # (文本, 提示词, 模型, 系统提示词版本) → LLM 结果
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+PROMPT_CACHE_CHECK_SECONDS = float(os.getenv("PROMPT_CACHE_CHECK_SECONDS", "5"))  # 提示词缓存最多多久查一次库里的版本
+
+
+# --- 检索配置 ---
+SEARCH_MAX_CANDIDATES = int(os.getenv("SEARCH_MAX_CANDIDATES", "5000"))  # 索引返回的候选上限，超过则交给数据库过滤
+# 每个字段最多索引的词数（超出时保留先出现的）。一个词一行 resume_terms：结构化字段本身只有几十个词，
+# 主要是经历和原文两个字段，每份简历最多约 2 × 128 + 100 ≈ 350 行，50 万份约 1.8 亿行；原文只索引开头那一段
+SEARCH_MAX_TERMS_PER_FIELD = int(os.getenv("SEARCH_MAX_TERMS_PER_FIELD", "128"))
+RESUME_COUNT_CACHE_TTL = float(os.getenv("RESUME_COUNT_CACHE_TTL", "30"))  # 列表总数缓存时长（秒）
+SKILL_INDEX_REFRESH_SECONDS = float(os.getenv("SKILL_INDEX_REFRESH_SECONDS", "30"))  # 技能索引增量同步间隔（秒）
+SKILL_INDEX_LOAD_BATCH = int(os.getenv("SKILL_INDEX_LOAD_BATCH", "20000"))  # 全量加载时每次读取的简历 ID 区间
+SKILL_NAME_CACHE_MAX_ITEMS = int(os.getenv("SKILL_NAME_CACHE_MAX_ITEMS", "100000"))  # 技能名 → ID 缓存上限
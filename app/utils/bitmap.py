@@ -0,0 +1,98 @@
+# app/utils/bitmap.py - 分块压缩位图（roaring 思路：按高位分块，每块是一个 4096 位的整数位集）
+from typing import Dict, Iterable, Iterator
+
+CHUNK_BITS = 12
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+class Bitmap:
+    """
+    非负整数集合，用于存简历 ID
+    只存有数据的块，稀疏集合不会按最大 ID 占满内存；块内用 Python int 做位运算，交并差都是整块进行
+    """
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._chunks: Dict[int, int] = {}
+        for value in values:
+            self.add(value)
+
+    @classmethod
+    def _from_chunks(cls, chunks: Dict[int, int]) -> "Bitmap":
+        bitmap = cls()
+        bitmap._chunks = chunks
+        return bitmap
+
+    def add(self, value: int) -> None:
+        key = value >> CHUNK_BITS
+        self._chunks[key] = self._chunks.get(key, 0) | (1 << (value & CHUNK_MASK))
+
+    def discard(self, value: int) -> None:
+        key = value >> CHUNK_BITS
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            return
+        chunk &= ~(1 << (value & CHUNK_MASK))
+        if chunk:
+            self._chunks[key] = chunk
+        else:
+            del self._chunks[key]
+
+    def __contains__(self, value: int) -> bool:
+        return bool(self._chunks.get(value >> CHUNK_BITS, 0) >> (value & CHUNK_MASK) & 1)
+
+    def __len__(self) -> int:
+        return sum(chunk.bit_count() for chunk in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __iter__(self) -> Iterator[int]:
+        for key in sorted(self._chunks):
+            base = key << CHUNK_BITS
+            chunk = self._chunks[key]
+            while chunk:
+                low = chunk & -chunk
+                yield base + low.bit_length() - 1
+                chunk ^= low
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        small, large = (self, other) if len(self._chunks) <= len(other._chunks) else (other, self)
+        chunks = {}
+        for key, chunk in small._chunks.items():
+            merged = chunk & large._chunks.get(key, 0)
+            if merged:
+                chunks[key] = merged
+        return Bitmap._from_chunks(chunks)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        chunks = dict(self._chunks)
+        for key, chunk in other._chunks.items():
+            chunks[key] = chunks.get(key, 0) | chunk
+        return Bitmap._from_chunks(chunks)
+
+    def __sub__(self, other: "Bitmap") -> "Bitmap":
+        chunks = {}
+        for key, chunk in self._chunks.items():
+            remain = chunk & ~other._chunks.get(key, 0)
+            if remain:
+                chunks[key] = remain
+        return Bitmap._from_chunks(chunks)
+
+    def difference_update(self, other: "Bitmap") -> None:
+        for key, chunk in other._chunks.items():
+            current = self._chunks.get(key)
+            if current is None:
+                continue
+            current &= ~chunk
+            if current:
+                self._chunks[key] = current
+            else:
+                del self._chunks[key]
+
+    def copy(self) -> "Bitmap":
+        return Bitmap._from_chunks(dict(self._chunks))
+
+    def memory_bytes(self) -> int:
+        return sum((chunk.bit_length() + 7) // 8 for chunk in self._chunks.values())
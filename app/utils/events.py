@@ -0,0 +1,51 @@
+# app/utils/events.py - 进程内发布 / 订阅（给 SSE 推送用）
+# 只在本进程内广播；独立部署的 worker 发布的事件由 API 进程轮询任务表转发（见 RunService.relay_job_events）
+import asyncio
+from typing import Dict, Set
+
+from app.settings import EVENT_QUEUE_SIZE
+
+
+class EventBus:
+    """
+    按 topic 广播事件，每个订阅者一个有界队列
+    订阅者消费慢时丢掉最旧的事件，发布方永远不会被阻塞（解析流程不能被看板拖慢）
+    """
+
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self.dropped = 0
+
+    def subscribe(self, topic: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(topic, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, topic: str, queue: asyncio.Queue) -> None:
+        subscribers = self._subscribers.get(topic)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[topic]
+
+    def publish(self, topic: str, event: dict) -> None:
+        for queue in self._subscribers.get(topic, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def stats(self) -> dict:
+        return {
+            "topics": len(self._subscribers),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "dropped": self.dropped,
+        }
+
+
+event_bus = EventBus(EVENT_QUEUE_SIZE)
@@ -52,4 +52,30 @@ def extract_year(text):
             if year.startswith("19") or year.startswith("20"):
                 return year
 
-    return None
\ No newline at end of file
+    return None
+
+
+TRUE_WORDS = {"true", "yes", "y", "1", "是", "合格", "通过"}
+FALSE_WORDS = {"false", "no", "n", "0", "否", "不合格", "不通过"}
+
+
+def parse_bool(value, default=False):
+    """
+    解析模型返回的布尔值
+
+    模型有时把 true / false 写成字符串（"false"、"是"、"否"），
+    直接 bool() 会把 "false" 当成 True；认不出的值按 default 处理
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if value is None:
+        return default
+
+    s = str(value).strip().lower()
+    if s in TRUE_WORDS:
+        return True
+    if s in FALSE_WORDS:
+        return False
+    return default
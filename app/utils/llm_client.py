@@ -1,31 +1,157 @@
 # app/utils/llm_client.py - 修复异常处理
+import asyncio
+import copy
 import json
-from openai import AsyncOpenAI
-from app.settings import LLM_API_KEY, LLM_BASE_URL, LLM_MODEL_NAME
-from app.utils.helpers import normalize_skills, extract_year
+import time
+from typing import TYPE_CHECKING, List, Optional, Union
+from app.settings import (
+    LLM_API_KEY,
+    LLM_BASE_URL,
+    LLM_MODEL_NAME,
+    LLM_CACHE_MAX_ITEMS,
+    LLM_CACHE_TTL,
+    LLM_RPM,
+    LLM_TPM,
+    LLM_CONCURRENCY_INITIAL,
+    LLM_CONCURRENCY_MIN,
+    LLM_CONCURRENCY_MAX,
+    LLM_LATENCY_TARGET,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_HTTP2,
+    LLM_CONNECT_TIMEOUT,
+    LLM_REQUEST_TIMEOUT,
+    LLM_MAX_RETRIES,
+    LLM_RETRY_BACKOFF_SECONDS,
+    LLM_BATCH_SIZE,
+    LLM_BATCH_MAX_CHARS,
+    LLM_OUTPUT_TOKENS_PER_RESUME,
+    LLM_OUTPUT_TOKENS_PER_EVALUATION,
+)
+from app.utils.helpers import normalize_skills, extract_year, parse_bool
+from app.utils.cache import TTLCache, sha256_hex
+from app.utils.rate_limit import AIMDLimiter, TokenBucket
+from app.utils import metrics
 from app.enums.education import infer_school_tier, normalize_school_tier
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+# 修改系统提示词 / _normalize_profile / _normalize_evaluation 的输出格式时递增，让旧的缓存结果失效
+SYSTEM_PROMPT_VERSION = "2"
+
+# 和岗位无关的结构化信息（抽取一次，存在 Resume.parse_result）
+# 抽取的字段 / 格式变化时递增 PROFILE_VERSION，已存的结构化信息会在下次重测时重新抽取
+PROFILE_VERSION = "1"
+PROFILE_FIELDS = (
+    "name", "phone", "email", "university", "schooltier", "degree", "major",
+    "graduation_year", "skills", "work_experience", "projects",
+)
+# 评估时不发给模型的字段（和岗位匹配无关）
+_PRIVATE_FIELDS = ("name", "phone", "email")
+
+TASK_EXTRACT = "extract"
+TASK_EVALUATE = "evaluate"
+
+
+def _http2_available() -> bool:
+    if not LLM_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("LLM_HTTP2=1 但未安装 h2，按 HTTP/1.1 连接")
+        return False
+    return True
+
+
+def create_client(base_url: str = LLM_BASE_URL, api_key: str = LLM_API_KEY) -> "AsyncOpenAI":
+    """
+    连接池按并发上限配置（SDK 默认 1000 连接 / 10 分钟超时，限流和超时都不可控）
+    重试由 _call_api 自己做，这样 429 能反馈给自适应并发，而不是被 SDK 默默重试掉
+    """
+    # openai SDK 导入要半秒左右，放到第一次请求时，不拖慢服务和 worker 启动
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DEFAULT_CONNECTION_LIMITS, Timeout
+
+    # 不直接 import httpx：SDK 依赖的 httpx 发行版由 SDK 决定，Limits / Timeout 用 SDK 自己的类
+    limits_class = type(DEFAULT_CONNECTION_LIMITS)
+    http_client = DefaultAsyncHttpxClient(
+        limits=limits_class(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        ),
+        timeout=Timeout(LLM_REQUEST_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+        http2=_http2_available(),
+    )
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0, http_client=http_client)
+
 
-client = AsyncOpenAI(
-    api_key=LLM_API_KEY,
-    base_url=LLM_BASE_URL
+# 第一次请求时创建（get_client）；压测等场景可以直接赋值替换
+client: Optional["AsyncOpenAI"] = None
+
+
+def get_client() -> "AsyncOpenAI":
+    global client
+    if client is None:
+        client = create_client()
+    return client
+
+
+def _retryable_errors() -> tuple:
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+    return (RateLimitError, APIConnectionError, InternalServerError)
+
+
+LLM_WAIT_SECONDS = metrics.histogram(
+    "llm_wait_seconds", "LLM 请求发出前在限流处的等待时间（rpm / tpm 令牌桶，concurrency 自适应并发）", ["gate"]
+)
+LLM_REQUEST_SECONDS = metrics.histogram("llm_request_seconds", "LLM 接口请求耗时", ["task", "outcome"])
+LLM_TOKENS = metrics.counter("llm_tokens_total", "LLM 实际用量（接口返回的 usage）", ["task", "kind"])
+LLM_RETRIES = metrics.counter("llm_retries_total", "LLM 请求因限流 / 连接错误 / 5xx 重试的次数", ["reason"])
+LLM_JSON_RECOVERY = metrics.counter(
+    "llm_json_recovery_total", "LLM 返回的不是纯 JSON，截取花括号之间的内容再解析", ["result"]
+)
+LLM_FALLBACKS = metrics.counter(
+    "llm_batch_fallback_total", "打包请求里退回逐条请求的条目数", ["task"]
 )
 
 
 class LLMClient:
+    # (任务, 输入哈希, 提示词哈希, 模型, 系统提示词版本) → 结果；只缓存成功的结果
+    _result_cache = TTLCache("llm_result", LLM_CACHE_MAX_ITEMS, LLM_CACHE_TTL)
+    # 服务商配额和自适应并发，进程内所有 LLM 请求共用
+    _rpm = TokenBucket(LLM_RPM)
+    _tpm = TokenBucket(LLM_TPM)
+    _limiter = AIMDLimiter(
+        LLM_CONCURRENCY_INITIAL,
+        minimum=LLM_CONCURRENCY_MIN,
+        maximum=LLM_CONCURRENCY_MAX,
+        latency_target=LLM_LATENCY_TARGET,
+    )
 
     @staticmethod
-    def _build_system_prompt() -> str:
-        return """你是一个专业的招聘助手，负责解析简历并输出结构化结果。
+    def cache_stats() -> dict:
+        return LLMClient._result_cache.stats()
 
-【输出要求】
-1. 只返回 JSON 对象，不要任何 Markdown 标记或解释文字
-2. 缺失字段填 null，列表字段缺失返回空数组 []
-3. 不要编造简历中不存在的信息
+    @staticmethod
+    def rate_stats() -> dict:
+        return {
+            "concurrency": LLMClient._limiter.stats(),
+            "rpm": LLMClient._rpm.stats(),
+            "tpm": LLMClient._tpm.stats(),
+        }
 
-【JSON 结构】
-{
-  "is_qualified": true,
+    # ==================== 提示词 ====================
+    # 抽取：简历原文 → 结构化信息，和岗位无关，每份简历只做一次
+    # 评估：结构化信息 + 岗位筛选标准 → 分数，输入只有精简后的 JSON，换岗位 / 改提示词时只重跑这一步
+
+    @staticmethod
+    def _system_prompt(task: str, batch: bool) -> str:
+        if task == TASK_EXTRACT:
+            role = "负责从简历中抽取结构化信息"
+            schema = """{
   "name": "张三",
   "phone": "13800138000",
   "email": "zhangsan@example.com",
@@ -35,42 +161,138 @@ class LLMClient:
   "graduation_year": "2024",
   "skills": ["python", "java", "mysql"],
   "work_experience": ["工作经历1", "工作经历2"],
-  "projects": ["项目1", "项目2"],
-  "score": 85,
-  "reason": "符合要求的简短理由"
-}
-
-【特别注意】
+  "projects": ["项目1", "项目2"]
+}"""
+            notes = """
 - skills 必须是字符串数组，每个元素是单一技能，全部小写
 - 不要包含"精通"、"熟悉"等描述词
 - graduation_year 只填4位数字年份"""
+        else:
+            role = "负责根据岗位筛选标准评估候选人"
+            schema = """{
+  "is_qualified": true,
+  "score": 85,
+  "reason": "符合要求的简短理由"
+}"""
+            notes = """
+- score 为 0-100 的整数
+- 只依据给出的候选人信息评估，不要臆测缺失的经历"""
+
+        if not batch:
+            return f"""你是一个专业的招聘助手，{role}。
+
+【输出要求】
+1. 只返回 JSON 对象，不要任何 Markdown 标记或解释文字
+2. 缺失字段填 null，列表字段缺失返回空数组 []
+3. 不要编造简历中不存在的信息
+
+【JSON 结构】
+{schema}
+
+【特别注意】{notes}"""
+
+        schema = schema.replace("{\n", '{\n  "index": 0,\n', 1)
+        return f"""你是一个专业的招聘助手，{role}，一次处理多位候选人。
+
+【输出要求】
+1. 只返回 JSON 对象 {{"results": [...]}}，不要任何 Markdown 标记或解释文字
+2. results 中每位候选人一个对象，index 填输入中【候选人 N】的编号 N，每位候选人都必须返回
+3. 各位候选人相互独立处理，缺失字段填 null，列表字段缺失返回空数组 []
+4. 不要编造简历中不存在的信息
+
+【results 中每位候选人的 JSON 结构】
+{schema}
+
+【特别注意】{notes}"""
 
     @staticmethod
-    def _build_user_prompt(criteria: str, resume_text: str) -> str:
-        return f"""【岗位筛选标准】
-{criteria}
+    def _user_prompt(task: str, criteria: str, payloads: List[str], batch: bool) -> str:
+        parts = []
+        if task == TASK_EVALUATE:
+            parts.append(f"【岗位筛选标准】\n{criteria}\n\n-------------------")
+        label = "候选人简历内容" if task == TASK_EXTRACT else "候选人信息"
+        if not batch:
+            parts.append(f"【{label}】\n{payloads[0]}")
+        else:
+            for index, payload in enumerate(payloads):
+                parts.append(f"【候选人 {index}】\n{payload}\n\n-------------------")
+        return "\n\n".join(parts)
 
--------------------
+    @staticmethod
+    def _output_tokens(task: str) -> int:
+        return LLM_OUTPUT_TOKENS_PER_RESUME if task == TASK_EXTRACT else LLM_OUTPUT_TOKENS_PER_EVALUATION
 
-【候选人简历内容】
-{resume_text}"""
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            if retry_after:
+                return min(float(retry_after), 60.0)
+        except ValueError:
+            pass
+        return LLM_RETRY_BACKOFF_SECONDS * (2 ** attempt)
 
     @staticmethod
-    async def _call_api(system_prompt: str, user_prompt: str) -> str:
-        response = await client.chat.completions.create(
-            model=LLM_MODEL_NAME,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.1,
-            response_format={"type": "json_object"}
-        )
+    async def _call_api(system_prompt: str, user_prompt: str, output_tokens: int, task: str = "") -> str:
+        """
+        发请求前先过 RPM / TPM 令牌桶和自适应并发
+        TPM 按字数粗估（中文约一字一 token），返回后按实际 usage 修正
+        """
+        estimated = len(system_prompt) + len(user_prompt) + output_tokens
+        limiter = LLMClient._limiter
+
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            waited = time.perf_counter()
+            await LLMClient._rpm.acquire(1)
+            now = time.perf_counter()
+            LLM_WAIT_SECONDS.observe(now - waited, gate="rpm")
+            await LLMClient._tpm.acquire(estimated)
+            waited, now = now, time.perf_counter()
+            LLM_WAIT_SECONDS.observe(now - waited, gate="tpm")
+            await limiter.acquire()
+            LLM_WAIT_SECONDS.observe(time.perf_counter() - now, gate="concurrency")
+            started = time.monotonic()
+            try:
+                response = await get_client().chat.completions.create(
+                    model=LLM_MODEL_NAME,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.1,
+                    response_format={"type": "json_object"},
+                    timeout=LLM_REQUEST_TIMEOUT,
+                )
+            except _retryable_errors() as e:
+                limiter.on_throttle()
+                LLM_REQUEST_SECONDS.observe(time.monotonic() - started, task=task, outcome=type(e).__name__)
+                if attempt >= LLM_MAX_RETRIES:
+                    raise
+                LLM_RETRIES.inc(reason=type(e).__name__)
+                delay = LLMClient._retry_delay(e, attempt)
+                print(f"LLM 请求被限流或失败（{type(e).__name__}），{delay:.1f} 秒后重试")
+                await asyncio.sleep(delay)
+                continue
+            except Exception as e:
+                LLM_REQUEST_SECONDS.observe(time.monotonic() - started, task=task, outcome=type(e).__name__)
+                raise
+            finally:
+                await limiter.release()
+
+            latency = time.monotonic() - started
+            limiter.on_success(latency)
+            LLM_REQUEST_SECONDS.observe(latency, task=task, outcome="ok")
+            usage = getattr(response, "usage", None)
+            if usage is not None and usage.total_tokens:
+                LLMClient._tpm.adjust(usage.total_tokens - estimated)
+                LLM_TOKENS.inc(usage.prompt_tokens or 0, task=task, kind="prompt")
+                LLM_TOKENS.inc(usage.completion_tokens or 0, task=task, kind="completion")
 
-        if not response.choices or not response.choices[0].message.content:
-            raise ValueError("LLM 返回内容为空")
+            if not response.choices or not response.choices[0].message.content:
+                raise ValueError("LLM 返回内容为空")
 
-        return response.choices[0].message.content
+            return response.choices[0].message.content
 
     @staticmethod
     def _parse_json(content: str) -> dict:
@@ -82,67 +304,175 @@ class LLMClient:
             start = clean.find("{")
             end = clean.rfind("}")
             if start != -1 and end > start:
-                return json.loads(clean[start:end + 1])
+                try:
+                    data = json.loads(clean[start:end + 1])
+                except json.JSONDecodeError:
+                    LLM_JSON_RECOVERY.inc(result="failed")
+                    raise
+                LLM_JSON_RECOVERY.inc(result="recovered")
+                return data
+            LLM_JSON_RECOVERY.inc(result="failed")
             raise ValueError("无法解析 LLM 返回的 JSON")
 
     @staticmethod
-    def _normalize_result(data: dict) -> dict:
-        """【修复 Bug 5】标准化 LLM 返回的结果"""
+    def _normalize_profile(data: dict) -> dict:
+        """【修复 Bug 5】标准化 LLM 抽取的结构化信息"""
+        profile = {k: data.get(k) for k in PROFILE_FIELDS}
+
         # 1. 技能标准化
-        if "skills" in data:
-            data["skills"] = normalize_skills(data["skills"])
+        profile["skills"] = normalize_skills(profile["skills"])
 
         # 2. 毕业年份提取
-        if "graduation_year" in data:
-            data["graduation_year"] = extract_year(data["graduation_year"])
+        profile["graduation_year"] = extract_year(profile["graduation_year"])
 
         # 3. 学校层次推断（确保一定有值）
-        tier = normalize_school_tier(data.get("schooltier"))
+        tier = normalize_school_tier(profile.get("schooltier"))
         if not tier or tier.value == "null":
-            tier = infer_school_tier(data.get("university"))
+            tier = infer_school_tier(profile.get("university"))
 
         # 【修复】如果还是 None，设置为 "null" 字符串而不是 None
         # 这样可以在数据库中明确表示"未知"
         if tier:
-            data["schooltier"] = tier.value
+            profile["schooltier"] = tier.value
         else:
-            data["schooltier"] = "null"
+            profile["schooltier"] = "null"
 
-        # 4. 确保必需字段存在
-        data.setdefault("is_qualified", False)
-        data.setdefault("score", 0)
+        return profile
 
-        return data
+    @staticmethod
+    def _normalize_evaluation(data: dict) -> dict:
+        try:
+            score = int(round(float(data.get("score") or 0)))
+        except (TypeError, ValueError):
+            score = 0
+        return {
+            "is_qualified": parse_bool(data.get("is_qualified")),
+            "score": max(0, min(100, score)),
+            "reason": data.get("reason"),
+        }
+
+    @staticmethod
+    def profile_payload(profile: dict) -> str:
+        """评估时发给模型的精简信息：去掉联系方式和空字段，紧凑 JSON"""
+        compact = {
+            k: v for k, v in profile.items()
+            if k in PROFILE_FIELDS and k not in _PRIVATE_FIELDS and v not in (None, "", [], "null")
+        }
+        return json.dumps(compact, ensure_ascii=False, separators=(",", ":"))
+
+    # ==================== 对外接口 ====================
+
+    @staticmethod
+    async def extract_profiles(resume_texts: List[str]) -> List[Union[dict, Exception]]:
+        """从简历原文抽取结构化信息；失败的条目返回异常对象（同 gather 的 return_exceptions）"""
+        return await LLMClient._run_task(TASK_EXTRACT, resume_texts, "")
+
+    @staticmethod
+    async def evaluate_profiles(profiles: List[dict], criteria: str) -> List[Union[dict, Exception]]:
+        """按岗位筛选标准评估结构化信息，返回 {is_qualified, score, reason}；失败的条目返回异常对象"""
+        payloads = [LLMClient.profile_payload(p) for p in profiles]
+        return await LLMClient._run_task(TASK_EVALUATE, payloads, criteria)
+
+    @staticmethod
+    def _cache_key(task: str, payload: str, criteria: str) -> tuple:
+        return (
+            task,
+            sha256_hex(payload),
+            sha256_hex(criteria or ""),
+            LLM_MODEL_NAME,
+            SYSTEM_PROMPT_VERSION,
+        )
 
     @staticmethod
-    async def parse_resume(resume_text: str, criteria: str) -> dict:
+    def _normalize(task: str, data: dict) -> dict:
+        if task == TASK_EXTRACT:
+            return LLMClient._normalize_profile(data)
+        return LLMClient._normalize_evaluation(data)
+
+    @staticmethod
+    async def _run_task(task: str, payloads: List[str], criteria: str) -> List[Union[dict, Exception]]:
         """
-        【修复 Bug 5】解析简历 - 改进异常处理
+        未命中缓存的条目按 LLM_BATCH_SIZE / LLM_BATCH_MAX_CHARS 打包，一次请求处理多条，
+        系统提示词和筛选标准只发一次；返回顺序和入参一致
         """
+        results: List[Union[dict, Exception, None]] = [None] * len(payloads)
+        pending = []
+        for i, payload in enumerate(payloads):
+            cached = LLMClient._result_cache.get(LLMClient._cache_key(task, payload, criteria))
+            if cached is not None:
+                results[i] = copy.deepcopy(cached)
+            else:
+                pending.append(i)
+
+        packs, current, chars = [], [], 0
+        for i in pending:
+            size = len(payloads[i])
+            if current and (len(current) >= LLM_BATCH_SIZE or chars + size > LLM_BATCH_MAX_CHARS):
+                packs.append(current)
+                current, chars = [], 0
+            current.append(i)
+            chars += size
+        if current:
+            packs.append(current)
+
+        async def _run(pack):
+            items = [payloads[i] for i in pack]
+            for i, data in zip(pack, await LLMClient._run_pack(task, items, criteria)):
+                results[i] = data
+
+        await asyncio.gather(*[_run(pack) for pack in packs])
+        return results
+
+    @staticmethod
+    async def _run_pack(task: str, payloads: List[str], criteria: str) -> List[Union[dict, Exception]]:
+        """一次请求处理一包；整包失败或个别条目缺失 / 不合法时，这些条目退回逐条请求"""
+        if len(payloads) == 1:
+            return [await LLMClient._run_one(task, payloads[0], criteria)]
+
+        by_index = {}
         try:
-            system_prompt = LLMClient._build_system_prompt()
-            user_prompt = LLMClient._build_user_prompt(criteria, resume_text)
-            content = await LLMClient._call_api(system_prompt, user_prompt)
-            data = LLMClient._parse_json(content)
-            data = LLMClient._normalize_result(data)
+            content = await LLMClient._call_api(
+                LLMClient._system_prompt(task, batch=True),
+                LLMClient._user_prompt(task, criteria, payloads, batch=True),
+                LLMClient._output_tokens(task) * len(payloads),
+                task,
+            )
+            items = LLMClient._parse_json(content).get("results")
+            for item in items if isinstance(items, list) else []:
+                index = item.get("index") if isinstance(item, dict) else None
+                if isinstance(index, int) and 0 <= index < len(payloads) and index not in by_index:
+                    by_index[index] = item
+        except Exception as e:
+            print(f"LLM 批量请求失败，改为逐条请求: {e}")
+
+        async def _one(index, payload):
+            item = by_index.get(index)
+            if item is None:
+                LLM_FALLBACKS.inc(task=task)
+                return await LLMClient._run_one(task, payload, criteria)
+            data = LLMClient._normalize(task, item)
+            LLMClient._result_cache.set(LLMClient._cache_key(task, payload, criteria), copy.deepcopy(data))
             return data
 
+        return list(await asyncio.gather(*[_one(i, p) for i, p in enumerate(payloads)]))
+
+    @staticmethod
+    async def _run_one(task: str, payload: str, criteria: str) -> Union[dict, Exception]:
+        """【修复 Bug 5】单条请求，出错时返回异常对象，由调用方决定重试还是记为失败"""
+        try:
+            content = await LLMClient._call_api(
+                LLMClient._system_prompt(task, batch=False),
+                LLMClient._user_prompt(task, criteria, [payload], batch=False),
+                LLMClient._output_tokens(task),
+                task,
+            )
+            data = LLMClient._normalize(task, LLMClient._parse_json(content))
         except Exception as e:
-            # 【修复】出错时也要确保 schooltier 有默认值
-            print(f"LLM 解析失败: {e}")
-            return {
-                "is_qualified": False,
-                "name": None,
-                "phone": None,
-                "email": None,
-                "university": None,
-                "schooltier": "null",  # 明确设置为 "null" 而不是 None
-                "degree": None,
-                "major": None,
-                "graduation_year": None,
-                "skills": [],
-                "work_experience": [],
-                "projects": [],
-                "score": 0,
-                "reason": f"解析失败: {str(e)}"
-            }
\ No newline at end of file
+            print(f"LLM 请求失败（{task}）: {e}")
+            return e
+        LLMClient._result_cache.set(LLMClient._cache_key(task, payload, criteria), copy.deepcopy(data))
+        return data
+
+
+metrics.gauge("llm_concurrency_limit", "LLM 自适应并发的当前上限", lambda: LLMClient._limiter.limit)
+metrics.gauge("llm_in_flight", "正在进行的 LLM 请求数", lambda: LLMClient._limiter.in_flight)
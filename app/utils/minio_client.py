@@ -1,33 +1,130 @@
 import io
+import os
 import asyncio
-from minio import Minio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from fastapi import UploadFile
 from app.settings import (
     MINIO_ENDPOINT, MINIO_ACCESS_KEY, MINIO_SECRET_KEY, 
-    MINIO_BUCKET_NAME, MINIO_SECURE
+    MINIO_BUCKET_NAME, MINIO_SECURE, MINIO_PART_SIZE,
+    MINIO_MAX_CONNECTIONS, MINIO_THREADS, MINIO_CONNECT_TIMEOUT, MINIO_READ_TIMEOUT, MINIO_MAX_RETRIES,
 )
+from app.utils import metrics
 
-class MinioClient:
-    client = Minio(
-        MINIO_ENDPOINT,
-        access_key=MINIO_ACCESS_KEY,
-        secret_key=MINIO_SECRET_KEY,
-        secure=MINIO_SECURE
+
+class UploadTooLarge(ValueError):
+    """上传文件超过大小限制"""
+
+
+class _HashingReader:
+    """包一层文件对象：边读边算 SHA-256 和大小，超过上限立即中断上传"""
+
+    def __init__(self, raw, max_size=None):
+        self.raw = raw
+        self.max_size = max_size
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+
+    def read(self, n=-1):
+        chunk = self.raw.read(n)
+        self.size += len(chunk)
+        if self.max_size and self.size > self.max_size:
+            raise UploadTooLarge(f"文件超过 {self.max_size // 1024 // 1024}MB 限制")
+        self._sha256.update(chunk)
+        return chunk
+
+    def hexdigest(self):
+        return self._sha256.hexdigest()
+
+
+def _http_client():
+    """和 SDK 默认的连接池一样（证书、5xx 重试），只是连接数和超时可配"""
+    import certifi
+    import urllib3
+
+    return urllib3.PoolManager(
+        num_pools=4,
+        maxsize=MINIO_MAX_CONNECTIONS,
+        block=False,
+        timeout=urllib3.Timeout(connect=MINIO_CONNECT_TIMEOUT, read=MINIO_READ_TIMEOUT),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(
+            total=MINIO_MAX_RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
     )
 
+
+class MinioClient:
+    # 第一次使用时创建（minio SDK 导入要一百多毫秒，不放在启动路径上）
+    client = None
+    _client_lock = threading.Lock()
+    # 桶检查：每个进程只做一次，并发的调用共用同一次
+    _bucket_task: Optional[asyncio.Future] = None
+    # SDK 是同步的：阻塞调用放到专用线程池，线程数和连接数对齐，
+    # 不和其他 to_thread 调用抢默认线程池（默认只有 CPU 数 + 4 个线程）
+    _executor = ThreadPoolExecutor(MINIO_THREADS, thread_name_prefix="minio")
+    _in_flight = 0
+
+    @classmethod
+    async def _run(cls, fn, *args):
+        cls._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(cls._executor, fn, *args)
+        finally:
+            cls._in_flight -= 1
+
+    @classmethod
+    def get_client(cls):
+        """在 MinIO 线程里调用，加锁避免并发创建两个连接池"""
+        if cls.client is None:
+            with cls._client_lock:
+                if cls.client is None:
+                    from minio import Minio
+
+                    cls.client = Minio(
+                        MINIO_ENDPOINT,
+                        access_key=MINIO_ACCESS_KEY,
+                        secret_key=MINIO_SECRET_KEY,
+                        secure=MINIO_SECURE,
+                        http_client=_http_client(),
+                    )
+        return cls.client
+
     @classmethod
     async def init_bucket(cls):
-        """初始化：确保桶存在"""
+        """确保桶存在：结果缓存在进程内，失败时下次调用重新检查"""
         def _ensure():
-            if not cls.client.bucket_exists(MINIO_BUCKET_NAME):
-                cls.client.make_bucket(MINIO_BUCKET_NAME)
-        await asyncio.to_thread(_ensure)
+            client = cls.get_client()
+            if not client.bucket_exists(MINIO_BUCKET_NAME):
+                client.make_bucket(MINIO_BUCKET_NAME)
+
+        task = cls._bucket_task
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = cls._bucket_task = asyncio.ensure_future(cls._run(_ensure))
+        await asyncio.shield(task)
+
+    @classmethod
+    def start_bucket_check(cls) -> asyncio.Task:
+        """服务启动时在后台检查桶，不阻塞启动；失败只打日志，第一次上传前会再检查"""
+        async def _check():
+            try:
+                await cls.init_bucket()
+                print("MinIO 桶已初始化")
+            except Exception as e:
+                print(f"MinIO 桶检查失败（上传前会重试）: {e}")
+
+        return asyncio.create_task(_check())
 
     @classmethod
     async def _upload_raw(cls, data: bytes, object_name: str, content_type: str) -> str:
         """[内部通用方法] 上传二进制数据"""
         def _put():
-            cls.client.put_object(
+            cls.get_client().put_object(
                 MINIO_BUCKET_NAME,
                 object_name,
                 io.BytesIO(data),
@@ -35,17 +132,66 @@ class MinioClient:
                 content_type=content_type
             )
 
-        await asyncio.to_thread(_put)
+        await cls.init_bucket()
+        await cls._run(_put)
+        return cls.object_url(object_name)
 
+    @staticmethod
+    def object_url(object_name: str) -> str:
         protocol = "https" if MINIO_SECURE else "http"
         return f"{protocol}://{MINIO_ENDPOINT}/{MINIO_BUCKET_NAME}/{object_name}"
 
+    @classmethod
+    async def upload_stream(cls, file: UploadFile, object_name: str, max_size: int = None) -> dict:
+        """
+        流式上传 FastAPI 文件对象：直接从 UploadFile 的临时文件按分片读给 put_object，
+        不把整个文件读进内存；同时算出 SHA-256 和大小
+        返回 {"url", "sha256", "size"}
+        """
+        if max_size and file.size and file.size > max_size:
+            raise UploadTooLarge(f"文件超过 {max_size // 1024 // 1024}MB 限制")
+
+        def _rewind():
+            file.file.seek(0)
+            return file.file
+
+        c_type = file.content_type or "application/octet-stream"
+        return await cls.upload_fileobj(_rewind, object_name, c_type, max_size)
+
+    @classmethod
+    async def upload_fileobj(
+        cls, open_fn, object_name: str, content_type: str, max_size: int = None, close: bool = False
+    ) -> dict:
+        """
+        流式上传任意可读文件对象（open_fn 在上传线程里调用，返回文件对象，比如 zip 里的成员）
+        close=True 时上传结束后关闭该文件对象
+        返回 {"url", "sha256", "size"}
+        """
+        def _put():
+            raw = open_fn()
+            try:
+                reader = _HashingReader(raw, max_size)
+                cls.get_client().put_object(
+                    MINIO_BUCKET_NAME,
+                    object_name,
+                    reader,
+                    length=-1,
+                    part_size=MINIO_PART_SIZE,
+                    content_type=content_type,
+                )
+                return reader
+            finally:
+                if close:
+                    raw.close()
+
+        await cls.init_bucket()
+        reader = await cls._run(_put)
+        return {"url": cls.object_url(object_name), "sha256": reader.hexdigest(), "size": reader.size}
+
     @classmethod
     async def upload_file(cls, file: UploadFile, object_name: str) -> str:
         """上传 FastAPI 文件对象"""
-        content = await file.read()
-        c_type = file.content_type or "application/octet-stream"
-        return await cls._upload_raw(content, object_name, c_type)
+        return (await cls.upload_stream(file, object_name))["url"]
 
     @classmethod
     async def upload_bytes(cls, data: bytes, object_name: str, content_type: str) -> str:
@@ -62,7 +208,7 @@ class MinioClient:
             response = None
             data = None
             try:
-                response = cls.client.get_object(MINIO_BUCKET_NAME, object_name)
+                response = cls.get_client().get_object(MINIO_BUCKET_NAME, object_name)
                 # 先读取数据
                 data = response.read()
                 return data
@@ -78,4 +224,8 @@ class MinioClient:
                     except Exception as cleanup_error:
                         print(f"资源清理异常: {cleanup_error}")
 
-        return await asyncio.to_thread(_get)
\ No newline at end of file
+        return await cls._run(_get)
+
+
+metrics.gauge("minio_threads", "MinIO 阻塞调用线程池大小", lambda: MINIO_THREADS)
+metrics.gauge("minio_in_flight", "进行中的 MinIO 调用（含在线程池排队的）", lambda: MinioClient._in_flight)
@@ -1,22 +1,193 @@
-import fitz  # PyMuPDF
-from typing import Optional, Dict, Tuple, Any
+import asyncio
+import multiprocessing
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from typing import TYPE_CHECKING, Optional, Dict, Tuple, Any
+
+from app.settings import (
+    PIPELINE_PARSE_WORKERS,
+    PDF_PARSE_TIMEOUT,
+    PDF_PARSE_RETRIES,
+    PDF_MAX_PAGES,
+    PDF_MAX_BYTES,
+    PDF_PARSE_MAX_MEMORY_MB,
+    AVATAR_MAX_SIDE,
+    AVATAR_JPEG_QUALITY,
+)
+from app.utils import metrics
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF（只在解析子进程里真正导入，见 _init_parse_worker / parse_pdf）
+
+PDF_PARSE_SECONDS = metrics.histogram(
+    "resume_pdf_parse_seconds", "PDF 解析耗时（含进程池排队）", ["outcome"]
+)
+
+# 头像评分满分 85；达到这个分数（位置、尺寸、比例都理想）就不再看后面的图片
+AVATAR_CONFIDENT_SCORE = 75
+# 浏览器能直接显示的格式，尺寸不超限时原样保存
+AVATAR_WEB_EXTS = ("jpeg", "jpg", "png")
+
+
+def _init_parse_worker(max_memory_mb: int):
+    """
+    子进程初始化：预先导入 PyMuPDF（主进程不需要它），
+    再限制地址空间，畸形 PDF 吃内存时只会让这个子进程 MemoryError
+    """
+    import fitz  # noqa: F401
+
+    if max_memory_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows 没有 resource 模块
+        return
+    limit = max_memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
 
 
 class PdfParser:
+    _pool: Optional[ProcessPoolExecutor] = None
+    # 因为超时被主动结束的进程池，上面其他任务收到的 BrokenProcessPool 不是它们自己的问题
+    _killed: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+
     @staticmethod
-    def parse_pdf(file_bytes: bytes) -> Tuple[str, Optional[Dict[str, Any]]]:
-        """解析 PDF：提取文本 + 头像"""
+    def parse_pdf(file_bytes: bytes, max_pages: int = 0) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """解析 PDF：提取文本 + 头像（max_pages > 0 时只读前 max_pages 页）"""
+        import fitz
+
         doc = fitz.open(stream=file_bytes, filetype="pdf")
         try:
-            text = "\n".join([p.get_text("text", sort=True) for p in doc])
+            pages = doc if max_pages <= 0 else (doc[i] for i in range(min(max_pages, doc.page_count)))
+            text = "\n".join([p.get_text("text", sort=True) for p in pages])
             avatar = PdfParser._extract_avatar(doc)
             return text, avatar
         finally:
             doc.close()
 
     @staticmethod
-    def _extract_avatar(doc: fitz.Document) -> Optional[Dict[str, Any]]:
-        """智能提取头像"""
+    def _new_pool(max_workers: int) -> ProcessPoolExecutor:
+        # spawn：不继承父进程的事件循环、数据库连接等状态
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parse_worker,
+            initargs=(PDF_PARSE_MAX_MEMORY_MB,),
+        )
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        if cls._pool is None:
+            cls._pool = cls._new_pool(PIPELINE_PARSE_WORKERS)
+        return cls._pool
+
+    @staticmethod
+    def _close_pool(pool: ProcessPoolExecutor, kill: bool = False):
+        if kill:
+            # 超时的任务没法取消，只能结束子进程
+            for process in list((getattr(pool, "_processes", None) or {}).values()):
+                process.terminate()
+        # 结束子进程时不取消排队的任务：取消会让等待方收到 CancelledError，
+        # 留着它们会收到 BrokenProcessPool，按上面的规则重试
+        pool.shutdown(wait=False, cancel_futures=not kill)
+
+    @classmethod
+    def _discard_pool(cls, pool: ProcessPoolExecutor, kill: bool = False):
+        """
+        只处理提交任务时用的那个进程池：它可能已经被别的任务换掉了，
+        不能连带结束新建的进程池（上面正跑着别的任务）；下次调用会重建
+        """
+        if cls._pool is pool:
+            cls._pool = None
+        if kill:
+            cls._killed.add(pool)
+        cls._close_pool(pool, kill)
+
+    @classmethod
+    def shutdown_pool(cls):
+        pool, cls._pool = cls._pool, None
+        if pool is not None:
+            cls._close_pool(pool)
+
+    @staticmethod
+    async def _run(pool: ProcessPoolExecutor, file_bytes: bytes):
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(pool, PdfParser.parse_pdf, file_bytes, PDF_MAX_PAGES)
+        return await asyncio.wait_for(future, PDF_PARSE_TIMEOUT)
+
+    @classmethod
+    async def _run_isolated(cls, file_bytes: bytes):
+        """单独起一个进程解析：再出问题也只影响这一份"""
+        pool = cls._new_pool(1)
+        try:
+            return await cls._run(pool, file_bytes)
+        finally:
+            cls._close_pool(pool, kill=True)
+
+    @classmethod
+    async def parse_pdf_async(cls, file_bytes: bytes) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        在进程池里解析 PDF，不阻塞事件循环
+        直接把 bytes 交给进程池（只有跨进程序列化这一次拷贝），不再包 BytesIO
+
+        一份超时只能结束整个进程池，同池其他正在解析的文档会连带收到 BrokenProcessPool：
+        - 进程池是因为别的文档超时被主动结束的：这些文档没问题，换新进程池重新解析
+        - 进程池自己崩了（多半是某份超出内存限制）：不知道是哪一份，各自单独起一个进程重试一次，
+          真正有问题的那份只会弄崩自己的进程
+        """
+        if len(file_bytes) > PDF_MAX_BYTES:
+            raise ValueError(f"PDF 文件过大（{len(file_bytes) // 1024 // 1024}MB）")
+
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            for _ in range(PDF_PARSE_RETRIES + 1):
+                pool = cls._get_pool()
+                try:
+                    result = await cls._run(pool, file_bytes)
+                except asyncio.TimeoutError:
+                    cls._discard_pool(pool, kill=True)
+                    raise
+                except BrokenProcessPool:
+                    if pool in cls._killed:
+                        continue
+                    cls._discard_pool(pool)
+                    result = await cls._run_isolated(file_bytes)
+                outcome = "ok"
+                return result
+            raise ValueError("PDF 解析多次被其他文档的超时打断")
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            raise ValueError(f"PDF 解析超时（>{PDF_PARSE_TIMEOUT}s）")
+        except BrokenProcessPool:
+            outcome = "crashed"
+            raise ValueError("PDF 解析进程异常退出（可能超出内存限制）")
+        except MemoryError:
+            outcome = "oom"
+            raise ValueError("PDF 解析超出内存限制")
+        finally:
+            PDF_PARSE_SECONDS.observe(time.perf_counter() - started, outcome=outcome)
+
+    @staticmethod
+    def _extract_avatar(doc: "fitz.Document") -> Optional[Dict[str, Any]]:
+        """智能提取头像：先按元数据挑出一张，只取这一张的图片数据"""
+        xref = PdfParser._pick_avatar(doc)
+        if xref is None:
+            return None
+        try:
+            return PdfParser._avatar_image(doc, xref)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _pick_avatar(doc: "fitz.Document") -> Optional[int]:
+        """
+        只用 get_images 的元数据（宽高）、图片位置和压缩流的长度打分，不解码任何图片，返回选中图片的 xref
+        分数足够高时提前结束
+        """
         if not doc:
             return None
 
@@ -24,23 +195,26 @@ class PdfParser:
         pw, ph = page.rect.width, page.rect.height
         best, best_score = None, 0
 
+        # (xref, smask, width, height, bpc, colorspace, alt. colorspace, name, filter, referencer)
         for img in page.get_images(full=True):
             try:
-                # 获取图片信息
-                rects = page.get_image_rects(img[0])
-                if not rects:
-                    continue
-                bbox = rects[0]
-
-                base = doc.extract_image(img[0])
-                w, h, size = base["width"], base["height"], len(base["image"])
+                xref, w, h = img[0], img[2], img[3]
                 ratio = w / h if h else 0
 
-                # 快速排除
-                if w < 30 or h < 30 or size < 1024:
+                # 快速排除（只看元数据：背景大图、细长的分隔线 / logo 不会再去取字节）
+                if w < 30 or h < 30:
                     continue
                 if ratio > 3 or ratio < 0.25 or w > 1200 or h > 1500:
                     continue
+                size = PdfParser._stream_length(doc, xref)
+                if size < 1024:
+                    continue
+
+                # 获取图片位置
+                rects = page.get_image_rects(xref)
+                if not rects:
+                    continue
+                bbox = rects[0]
 
                 # 评分：位置 + 尺寸 + 比例
                 score = 0
@@ -85,9 +259,52 @@ class PdfParser:
                 # 更新最佳
                 if score > best_score:
                     best_score = score
-                    best = {"bytes": base["image"], "ext": base["ext"]}
+                    best = xref
+                    if score >= AVATAR_CONFIDENT_SCORE:
+                        break
 
             except Exception:
                 continue
 
-        return best
\ No newline at end of file
+        return best
+
+    @staticmethod
+    def _stream_length(doc: "fitz.Document", xref: int) -> int:
+        """图片压缩流的字节数（读字典里的 /Length，不读流本身）；读不到时按 0 处理"""
+        kind, value = doc.xref_get_key(xref, "Length")
+        if kind == "int":
+            return int(value)
+        if kind == "xref":  # /Length 是间接对象：12 0 R
+            return int(doc.xref_object(int(value.split()[0])).strip())
+        return 0
+
+    @staticmethod
+    def _avatar_image(doc: "fitz.Document", xref: int) -> Dict[str, Any]:
+        """
+        取出选中的头像；最长边超过 AVATAR_MAX_SIDE 或不是网页能直接显示的格式时，
+        缩小后重新编码成 JPEG（在解析子进程里做，跨进程传递和对象存储的字节都变小）
+        重新编码失败时，网页能显示的原图照常返回，不能因此丢掉头像
+        """
+        import fitz
+
+        base = doc.extract_image(xref)
+        w, h, ext = base["width"], base["height"], base["ext"]
+        if ext in AVATAR_WEB_EXTS and (AVATAR_MAX_SIDE <= 0 or max(w, h) <= AVATAR_MAX_SIDE):
+            return {"bytes": base["image"], "ext": ext}
+
+        try:
+            pix = fitz.Pixmap(doc, xref)
+            if pix.alpha:
+                pix = fitz.Pixmap(pix, 0)  # JPEG 不支持透明通道
+            if pix.colorspace is None or pix.colorspace.n != 3:
+                pix = fitz.Pixmap(fitz.csRGB, pix)
+            if AVATAR_MAX_SIDE > 0 and max(w, h) > AVATAR_MAX_SIDE:
+                scale = AVATAR_MAX_SIDE / max(w, h)
+                pix = fitz.Pixmap(pix, max(1, round(w * scale)), max(1, round(h * scale)), None)
+            # 走到这里要么超过尺寸上限，要么浏览器显示不了，原图再小也不能直接用
+            return {"bytes": pix.tobytes("jpg", jpg_quality=AVATAR_JPEG_QUALITY), "ext": "jpeg"}
+        except Exception as e:
+            if ext not in AVATAR_WEB_EXTS:
+                raise
+            print(f"头像缩小失败，保留原图: {e}")
+            return {"bytes": base["image"], "ext": ext}
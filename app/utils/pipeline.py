@@ -0,0 +1,211 @@
+# app/utils/pipeline.py - 分阶段流水线（各阶段独立并发 + 有界队列）
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.utils import metrics
+
+STAGE_SECONDS = metrics.histogram("pipeline_stage_seconds", "流水线各阶段处理一批的耗时", ["stage"])
+STAGE_ITEMS = metrics.counter("pipeline_stage_items_total", "流水线各阶段处理的条目数", ["stage", "outcome"])
+
+
+class Stage:
+    """
+    流水线中的一个阶段
+    handler(item) 处理单个条目；batch_size > 1 时 handler(items) 一次处理一批
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[..., Awaitable[Any]],
+        concurrency: int = 1,
+        batch_size: int = 1,
+        batch_wait: float = 0.05,
+    ):
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.queue: Optional[asyncio.Queue] = None
+        self.busy = 0
+        self.processed = 0
+        self.failed = 0
+
+
+class Pipeline:
+    """
+    条目依次流过各阶段，阶段之间是有界队列（满了就反压上游）
+    submit() 返回时条目已经走完全部阶段，任何阶段抛错都会传回给 submit 的调用方
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 64):
+        self.stages = stages
+        self.queue_size = queue_size
+        self._tasks: List[asyncio.Task] = []
+        self._closing = False
+
+    def _ensure_started(self):
+        if self._tasks:
+            return
+        for index, stage in enumerate(self.stages):
+            stage.queue = asyncio.Queue(maxsize=self.queue_size)
+            for _ in range(stage.concurrency):
+                self._start_worker(index)
+
+    def _start_worker(self, index: int):
+        task = asyncio.create_task(self._run_stage(index))
+        task.add_done_callback(lambda t: self._on_worker_exit(index, t))
+        self._tasks.append(task)
+
+    def _on_worker_exit(self, index: int, task: asyncio.Task):
+        """阶段协程只会被 close() 取消；其他原因退出（BaseException）时立刻补一个，队列里的条目接着处理"""
+        if task in self._tasks:
+            self._tasks.remove(task)
+        if self._closing or task.cancelled():
+            return
+        print(f"流水线阶段 {self.stages[index].name} 异常退出，已重启: {task.exception()!r}")
+        self._start_worker(index)
+
+    async def submit(self, item: Any) -> Any:
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self.stages[0].queue.put((item, future))
+        return await future
+
+    async def close(self):
+        self._closing = True
+        try:
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._tasks = []
+            # 还在队列里的条目不会再有人处理，直接让提交方失败，不能一直等下去
+            for stage in self.stages:
+                while stage.queue is not None and not stage.queue.empty():
+                    self._fail(stage, [stage.queue.get_nowait()], RuntimeError("流水线已关闭"))
+        finally:
+            self._closing = False
+
+    async def _take_batch(self, stage: Stage, batch: list) -> None:
+        """从队列取一批放进 batch（原地追加：取到一半被取消时调用方也知道哪些条目已经出队）"""
+        batch.append(await stage.queue.get())
+        if stage.batch_size == 1:
+            return
+
+        # 攒批：等一小段时间，凑够 batch_size 或超时就出发
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + stage.batch_wait
+        while len(batch) < stage.batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(stage.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run_stage(self, index: int):
+        stage = self.stages[index]
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+
+        while True:
+            # 已出队、还没交给下一阶段的条目；出任何错都要让它们的 future 失败，否则提交方会一直等
+            batch = []
+            try:
+                await self._take_batch(stage, batch)
+                # 调用方已经放弃（被取消）的条目直接丢掉
+                batch[:] = [(item, fut) for item, fut in batch if not fut.done()]
+                if batch:
+                    await self._process(stage, next_stage, batch)
+            except asyncio.CancelledError:
+                self._fail(stage, batch, RuntimeError(f"流水线阶段 {stage.name} 被取消"))
+                # close() / 事件循环关闭时取消的是本协程，退出；handler 内部漏出来的取消只算这一批失败
+                if self._closing or asyncio.current_task().cancelling():
+                    raise
+            except BaseException as e:
+                # Exception 已经在 _handle 里按条目处理了，到这里的是 KeyboardInterrupt 之类，协程退出后由 _on_worker_exit 重启
+                self._fail(stage, batch, e)
+                raise
+
+    async def _process(self, stage: Stage, next_stage: Optional[Stage], batch: list) -> None:
+        """处理一批并交给下一阶段；交出去（或已结束）的条目从 batch 里移除"""
+        stage.busy += 1
+        try:
+            batch[:] = await self._handle(stage, batch)
+        finally:
+            stage.busy -= 1
+
+        while batch:
+            item, fut = batch[0]
+            if next_stage:
+                await next_stage.queue.put((item, fut))
+            elif not fut.done():
+                fut.set_result(item)
+            batch.pop(0)
+
+    @staticmethod
+    def _fail(stage: Stage, batch: list, error: BaseException) -> None:
+        if not isinstance(error, Exception):
+            error = RuntimeError(f"流水线阶段 {stage.name} 异常退出: {error!r}")
+        for _, fut in batch:
+            if not fut.done():
+                stage.failed += 1
+                STAGE_ITEMS.inc(stage=stage.name, outcome="failed")
+                fut.set_exception(error)
+
+    async def _handle(self, stage: Stage, batch: list) -> list:
+        """执行 handler，返回成功的条目；失败的条目直接把异常交给对应的 future"""
+        started = time.perf_counter()
+        try:
+            if stage.batch_size == 1:
+                await stage.handler(batch[0][0])
+            else:
+                await stage.handler([item for item, _ in batch])
+            stage.processed += len(batch)
+            STAGE_ITEMS.inc(len(batch), stage=stage.name, outcome="ok")
+            return batch
+        except Exception as e:
+            if len(batch) == 1:
+                stage.failed += 1
+                STAGE_ITEMS.inc(stage=stage.name, outcome="failed")
+                if not batch[0][1].done():
+                    batch[0][1].set_exception(e)
+                return []
+        finally:
+            STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage.name)
+
+        # 整批失败时逐条重试，避免一条坏数据拖垮同批的其他条目
+        done = []
+        for item, fut in batch:
+            started = time.perf_counter()
+            try:
+                await stage.handler([item])
+                stage.processed += 1
+                STAGE_ITEMS.inc(stage=stage.name, outcome="ok")
+                done.append((item, fut))
+            except Exception as e:
+                stage.failed += 1
+                STAGE_ITEMS.inc(stage=stage.name, outcome="failed")
+                if not fut.done():
+                    fut.set_exception(e)
+            finally:
+                STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage.name)
+        return done
+
+    def stats(self) -> Dict[str, dict]:
+        """各阶段的队列深度和忙碌情况，用于调整各阶段并发"""
+        return {
+            stage.name: {
+                "queue_depth": stage.queue.qsize() if stage.queue else 0,
+                "queue_size": self.queue_size,
+                "busy": stage.busy,
+                "concurrency": stage.concurrency,
+                "batch_size": stage.batch_size,
+                "processed": stage.processed,
+                "failed": stage.failed,
+            }
+            for stage in self.stages
+        }
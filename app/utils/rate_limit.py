@@ -0,0 +1,117 @@
+# app/utils/rate_limit.py - 令牌桶限速 + AIMD 自适应并发（用于调用外部 LLM 接口）
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    每分钟补充 rate_per_minute 个令牌，桶容量默认一分钟的量
+    rate_per_minute <= 0 表示不限速
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        if not self.enabled:
+            return
+        # 单次超过桶容量的请求按桶容量算，否则永远等不到
+        amount = min(amount, self.capacity)
+        # 加锁排队，先到先得，避免大请求一直被小请求插队饿死
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def adjust(self, delta: float) -> None:
+        """预估和实际用量的差额（正数表示多用了），允许透支成负数，后面的请求会等更久"""
+        if not self.enabled:
+            return
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+    def stats(self) -> dict:
+        if self.enabled:
+            self._refill()
+        return {
+            "rate_per_minute": round(self.rate * 60, 2),
+            "available": round(self.tokens, 2),
+        }
+
+
+class AIMDLimiter:
+    """
+    自适应并发上限：成功且延迟正常时加性增长（每满一轮并发 +1），
+    遇到限流（429）或延迟超过目标时乘性下降；同一个窗口内的多次下降只算一次
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 32,
+        backoff: float = 0.5,
+        latency_target: float = 0,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.backoff = backoff
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self.throttled = 0
+        self._cond = asyncio.Condition()
+        self._last_decrease = 0.0
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        if self.latency_target and latency > self.latency_target:
+            self._decrease(latency)
+            return
+        self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+    def on_throttle(self, window: float = 1.0) -> None:
+        self.throttled += 1
+        self._decrease(window)
+
+    def _decrease(self, window: float) -> None:
+        # 并发的请求几乎同时收到 429，只按一次处理，避免并发一下掉到底
+        now = time.monotonic()
+        if now - self._last_decrease < window:
+            return
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * self.backoff)
+
+    def stats(self) -> dict:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "min": self.minimum,
+            "max": self.maximum,
+            "throttled": self.throttled,
+        }
@@ -0,0 +1,46 @@
+# app/utils/tokenizer.py - 搜索索引分词（中英文统一按相邻两字切分，不依赖分词词典）
+
+
+def _runs(text):
+    """按非字母数字字符切段，中文字符也算字母数字"""
+    run = []
+    for ch in str(text).lower():
+        if ch.isalnum():
+            run.append(ch)
+        elif run:
+            yield "".join(run)
+            run = []
+    if run:
+        yield "".join(run)
+
+
+def tokenize(text):
+    """
+    建索引用：每段切成相邻两字（bigram），单字段保留单字，去重后按在文本中第一次出现的顺序返回
+    "张三丰" → ["张三", "三丰"]；"python" → ["py", "yt", "th", "ho", "on"]
+    词数超上限时调用方截掉的是文本靠后才第一次出现的词，不会偏向某一类字符
+    """
+    if not text:
+        return []
+    tokens = {}
+    for run in _runs(text):
+        if len(run) == 1:
+            tokens[run] = None
+        else:
+            tokens.update(dict.fromkeys(run[i:i + 2] for i in range(len(run) - 1)))
+    return list(tokens)
+
+
+def query_tokens(text):
+    """
+    查询用：返回必须同时命中的词列表
+    含有单字段（比如只搜"张"）时 bigram 索引覆盖不了子串语义，返回 None 让调用方走 LIKE
+    """
+    if not text:
+        return None
+    tokens = []
+    for run in _runs(text):
+        if len(run) < 2:
+            return None
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return list(dict.fromkeys(tokens)) or None
@@ -0,0 +1,168 @@
+# app/worker.py - 简历解析 worker（可独立部署：python -m app.worker）
+import asyncio
+import os
+import signal
+import socket
+import uuid
+
+from tortoise import Tortoise
+
+from app.services.job_service import JobService
+from app.services.resume_service import ResumeService
+from app.services.run_service import RunService
+from app.services.skill_service import SkillService
+from app.utils import metrics
+from app.settings import (
+    TORTOISE_ORM,
+    WORKER_METRICS_PORT,
+    JOB_WORKER_CONCURRENCY,
+    JOB_LEASE_SECONDS,
+    JOB_POLL_INTERVAL,
+    RUN_FEED_INTERVAL,
+)
+
+
+class ResumeWorker:
+    """
+    从任务表领取解析任务，最多 concurrency 个任务同时在解析流水线里，处理期间定时续租
+    每次按空闲名额批量领取，而不是每个名额各自轮询数据库
+    另有调度协程按滑动窗口给批量重测补任务（见 RunService.feed）
+    """
+
+    def __init__(self, concurrency: int = JOB_WORKER_CONCURRENCY):
+        self.concurrency = concurrency
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._stopping = asyncio.Event()
+        self._tasks = []
+        self._running = set()
+
+    def start(self):
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._loop()),
+            asyncio.create_task(self._reaper()),
+            asyncio.create_task(self._feeder()),
+        ]
+
+    async def stop(self):
+        """停止领取新任务，等待处理中的任务结束"""
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*self._running, return_exceptions=True)
+        self._tasks = []
+        await ResumeService.shutdown_pipeline()
+
+    async def _sleep(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _loop(self):
+        while not self._stopping.is_set():
+            free = self.concurrency - len(self._running)
+            if free <= 0:
+                await asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                jobs = await JobService.claim(self.worker_id, limit=free)
+            except Exception as e:
+                print(f"领取任务失败: {e}")
+                await self._sleep(JOB_POLL_INTERVAL)
+                continue
+
+            if not jobs:
+                await self._sleep(JOB_POLL_INTERVAL)
+                continue
+
+            for job in jobs:
+                task = asyncio.create_task(self._run_job(job))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+    async def _run_job(self, job):
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await ResumeService.process_resume_workflow(job.resume_id, run_id=job.run_id)
+        except Exception as e:
+            print(f"任务 {job.id}（简历 {job.resume_id}）第 {job.attempts} 次执行失败: {e}")
+            await JobService.fail(job, self.worker_id, str(e))
+        else:
+            await JobService.complete(job, self.worker_id)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job):
+        while True:
+            await asyncio.sleep(JOB_LEASE_SECONDS / 3)
+            if not await JobService.extend_lease(job, self.worker_id):
+                print(f"任务 {job.id} 租约已丢失")
+                return
+
+    async def _feeder(self):
+        while not self._stopping.is_set():
+            try:
+                await RunService.feed()
+            except Exception as e:
+                print(f"批量重测补任务失败: {e}")
+            await self._sleep(RUN_FEED_INTERVAL)
+
+    async def _reaper(self):
+        while not self._stopping.is_set():
+            try:
+                await JobService.reap_expired()
+            except Exception as e:
+                print(f"清理过期任务失败: {e}")
+            await self._sleep(JOB_LEASE_SECONDS)
+
+
+async def _serve_metrics(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """最简单的 HTTP 响应：不管请求路径，一律返回指标（只给 Prometheus 抓取用）"""
+    try:
+        await reader.readuntil(b"\r\n\r\n")
+        body = metrics.REGISTRY.render().encode("utf-8")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            + f"Content-Type: {metrics.CONTENT_TYPE}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def main():
+    await Tortoise.init(config=TORTOISE_ORM)
+    await SkillService.load_names()
+    worker = ResumeWorker()
+    worker.start()
+    print(f"worker {worker.worker_id} 已启动，并发 {worker.concurrency}")
+
+    metrics_server = None
+    if WORKER_METRICS_PORT:
+        metrics_server = await asyncio.start_server(_serve_metrics, "0.0.0.0", WORKER_METRICS_PORT)
+        print(f"指标端口 {WORKER_METRICS_PORT}")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    try:
+        await stop.wait()
+    finally:
+        if metrics_server:
+            metrics_server.close()
+        await worker.stop()
+        await Tortoise.close_connections()
+        print("worker 已停止")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,173 @@
+# benchmarks/avatar_extraction.py - 头像提取：逐张 extract_image 打分（旧实现）vs 元数据预筛 + 只取选中的一张 + 缩略图
+#
+# 用法（纯 CPU，不需要数据库）：
+#   python -m benchmarks.avatar_extraction --docs 200
+# 语料是第一页带整页背景图、横幅 logo、几张小图标和一张大尺寸证件照的简历；
+# 先核对新旧实现选中的是同一张图，再分别计时，并比较要上传的头像字节数
+# 结果写到 benchmarks/results/avatar_extraction_<时间>.json
+import argparse
+import json
+import os
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import fitz  # PyMuPDF
+
+from app.utils.pdf_parser import PdfParser
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+# ---- 旧实现（原样保留，作为对照和正确性基准）----
+
+def legacy_extract_avatar(doc: fitz.Document) -> Optional[Dict[str, Any]]:
+    if not doc:
+        return None
+
+    page = doc[0]
+    pw, ph = page.rect.width, page.rect.height
+    best, best_score = None, 0
+
+    for img in page.get_images(full=True):
+        try:
+            rects = page.get_image_rects(img[0])
+            if not rects:
+                continue
+            bbox = rects[0]
+
+            base = doc.extract_image(img[0])
+            w, h, size = base["width"], base["height"], len(base["image"])
+            ratio = w / h if h else 0
+
+            if w < 30 or h < 30 or size < 1024:
+                continue
+            if ratio > 3 or ratio < 0.25 or w > 1200 or h > 1500:
+                continue
+
+            score = 0
+            cy = (bbox.y0 + bbox.y1) / 2 / ph
+            cx = (bbox.x0 + bbox.x1) / 2 / pw
+            if cy < 0.15:
+                score += 20
+            elif cy < 0.35:
+                score += 15
+            elif cy < 0.5:
+                score += 10
+
+            if cx < 0.35 or cx > 0.65:
+                score += 15
+            else:
+                score += 10
+
+            if 100 <= min(w, h) <= 400:
+                score += 15
+            elif 50 <= min(w, h) <= 500:
+                score += 10
+
+            if 5 <= size / 1024 <= 500:
+                score += 10
+            elif 2 <= size / 1024 <= 800:
+                score += 5
+
+            for ideal in [1.0, 0.75, 0.8, 1.2]:
+                if abs(ratio - ideal) < 0.1:
+                    score += 25
+                    break
+                elif abs(ratio - ideal) < 0.25:
+                    score = max(score, 15)
+
+            if 0.5 <= ratio <= 1.6:
+                score = max(score, 10)
+
+            if score > best_score:
+                best_score = score
+                best = {"bytes": base["image"], "ext": base["ext"], "xref": img[0]}
+
+        except Exception:
+            continue
+
+    return best
+
+
+# ---- 语料 ----
+
+def _noise_png(rnd: random.Random, width: int, height: int) -> bytes:
+    return fitz.Pixmap(fitz.csRGB, width, height, rnd.randbytes(width * height * 3), False).tobytes("png")
+
+
+def _photo_jpeg(rnd: random.Random, width: int, height: int) -> bytes:
+    """四分之一分辨率的随机像素放大到原尺寸：有细节但过渡平滑，JPEG 大小和真实证件照相近"""
+    small = fitz.Pixmap(fitz.csRGB, width // 4, height // 4, rnd.randbytes(width // 4 * (height // 4) * 3), False)
+    return fitz.Pixmap(small, width, height, None).tobytes("jpg", jpg_quality=90)
+
+
+def make_pdf(index: int, seed: int = 42) -> bytes:
+    rnd = random.Random(seed * 1_000_003 + index)
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    # 整页背景（超出尺寸上限，旧实现也要先把字节取出来才知道）
+    page.insert_image(page.rect, stream=_noise_png(rnd, 1190, 1684))
+    # 横幅 logo 和几个小图标
+    page.insert_image(fitz.Rect(40, 20, 340, 70), stream=_noise_png(rnd, 600, 100))
+    for i in range(4):
+        page.insert_image(fitz.Rect(50, 200 + i * 30, 70, 220 + i * 30), stream=_noise_png(rnd, 24, 24))
+    # 证件照：右上角，600x800，比缩略图上限大
+    page.insert_image(fitz.Rect(440, 40, 530, 160), stream=_photo_jpeg(rnd, 600, 800))
+    page.insert_text((50, 120), f"候选人 #{index}", fontname="china-s", fontsize=12)
+    data = doc.tobytes(deflate=True)
+    doc.close()
+    return data
+
+
+def _time(fn, docs, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for doc in docs:
+            fn(doc)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    docs = [fitz.open(stream=make_pdf(i), filetype="pdf") for i in range(args.docs)]
+
+    # 正确性：选中同一张图
+    legacy = [legacy_extract_avatar(doc) for doc in docs]
+    picked = [PdfParser._pick_avatar(doc) for doc in docs]
+    assert [r and r["xref"] for r in legacy] == picked, "选中的头像与旧实现不一致"
+    current = [PdfParser._extract_avatar(doc) for doc in docs]
+    print("选中的头像与旧实现一致")
+
+    timings = {
+        "legacy": _time(legacy_extract_avatar, docs, args.repeat),
+        "prefilter": _time(PdfParser._extract_avatar, docs, args.repeat),
+    }
+    stored = {
+        "legacy": sum(len(r["bytes"]) for r in legacy if r),
+        "prefilter": sum(len(r["bytes"]) for r in current if r),
+    }
+    for label, seconds in timings.items():
+        print(
+            f"{label:>10}: {seconds * 1000 / len(docs):.2f}ms/份  加速 {timings['legacy'] / seconds:.1f}x  "
+            f"头像共 {stored[label] / 1024:.0f}KB"
+        )
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"avatar_extraction_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"docs": len(docs), "seconds": timings, "avatar_bytes": stored}, f, ensure_ascii=False, indent=2
+        )
+    print(f"结果已写入 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# benchmarks/fake_llm.py - 本地假 LLM 服务（OpenAI 兼容的 /chat/completions），压测时替代真实服务商
+#
+# 可配置延迟（固定 + 随机抖动）和 429 比例（带 Retry-After），返回格式和 LLMClient 的提示词约定一致：
+# 抽取任务按简历原文里能找到的内容填字段，评估任务按候选人信息的哈希给分，结果可复现
+# 也可以单独起一个给手动联调用：
+#   python -m benchmarks.fake_llm --port 8900 --latency 0.8 --rate-429 0.05
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import zlib
+from typing import Optional
+
+from benchmarks.corpus import DEGREES, MAJORS, SKILLS, UNIVERSITIES
+
+_CANDIDATE = re.compile(r"【候选人 (\d+)】\n(.*?)(?=\n\n-------------------|\Z)", re.S)
+_PHONE = re.compile(r"1\d{10}")
+_EMAIL = re.compile(r"[\w.]+@[\w.]+")
+_YEAR_RANGE = re.compile(r"\d{4}\.\d{2} - (\d{4})\.\d{2}")
+
+
+def _first(text: str, options) -> Optional[str]:
+    for option in options:
+        if option in text:
+            return option
+    return None
+
+
+def fake_profile(text: str) -> dict:
+    name = text.split("的个人简历", 1)[0].strip() if "的个人简历" in text else None
+    phone, email, year = _PHONE.search(text), _EMAIL.search(text), _YEAR_RANGE.search(text)
+    return {
+        "name": name,
+        "phone": phone.group(0) if phone else None,
+        "email": email.group(0) if email else None,
+        "university": _first(text, sorted(UNIVERSITIES, key=len, reverse=True)),
+        "degree": _first(text, DEGREES),
+        "major": _first(text, MAJORS),
+        "graduation_year": year.group(1) if year else None,
+        "skills": [s.lower() for s in SKILLS if s in text],
+        "work_experience": [line.strip() for line in text.splitlines() if "至今" in line][:4],
+        "projects": [line.strip() for line in text.splitlines() if "日均处理" in line][:3],
+    }
+
+
+def fake_evaluation(text: str) -> dict:
+    score = zlib.crc32(text.encode("utf-8")) % 101
+    return {"is_qualified": score >= 60, "score": score, "reason": f"压测假结果（{score} 分）"}
+
+
+def fake_content(system_prompt: str, user_prompt: str) -> str:
+    """按 LLMClient 的提示词判断任务和是否打包"""
+    respond = fake_profile if "抽取" in system_prompt else fake_evaluation
+    candidates = _CANDIDATE.findall(user_prompt)
+    if not candidates:
+        return json.dumps(respond(user_prompt), ensure_ascii=False)
+    results = [dict(respond(payload), index=int(index)) for index, payload in candidates]
+    return json.dumps({"results": results}, ensure_ascii=False)
+
+
+class FakeLLMServer:
+    """
+    只实现压测用得到的那一点 HTTP/1.1：keep-alive、Content-Length 请求体、JSON 响应
+    latency / jitter 单位秒；rate_429 是直接返回 429 的请求比例
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.5,
+        jitter: float = 0.2,
+        rate_429: float = 0.0,
+        retry_after: float = 1.0,
+        seed: int = 42,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._server = None
+        self._connections = {}  # writer → 处理该连接的协程
+        self.requests = 0
+        self.throttled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def start(self) -> "FakeLLMServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # keep-alive 连接要主动断开，并等处理协程退出，否则事件循环结束时它们会被强行取消
+            handlers = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "max_in_flight": self.max_in_flight,
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode("latin-1").split("\r\n")
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                status, extra, payload = await self._respond(lines[0], body)
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                header_lines = [
+                    f"HTTP/1.1 {status}",
+                    "Content-Type: application/json",
+                    f"Content-Length: {len(data)}",
+                    *extra,
+                ]
+                writer.write(("\r\n".join(header_lines) + "\r\n\r\n").encode("latin-1") + data)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def _respond(self, request_line: str, body: bytes):
+        if not request_line.startswith("POST ") or "/chat/completions" not in request_line:
+            return "404 Not Found", [], {"error": {"message": "not found"}}
+
+        self.requests += 1
+        if self._random.random() < self.rate_429:
+            self.throttled += 1
+            return (
+                "429 Too Many Requests",
+                [f"Retry-After: {self.retry_after:g}"],
+                {"error": {"message": "rate limited", "type": "rate_limit_error", "code": "rate_limit"}},
+            )
+
+        request = json.loads(body)
+        messages = request.get("messages") or []
+        system_prompt = next((m["content"] for m in messages if m["role"] == "system"), "")
+        user_prompt = next((m["content"] for m in messages if m["role"] == "user"), "")
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(max(self.latency + self._random.uniform(-self.jitter, self.jitter), 0))
+        finally:
+            self.in_flight -= 1
+
+        content = fake_content(system_prompt, user_prompt)
+        prompt_tokens = len(system_prompt) + len(user_prompt)
+        return "200 OK", [], {
+            "id": f"chatcmpl-bench-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model") or "bench",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(content),
+                "total_tokens": prompt_tokens + len(content),
+            },
+        }
+
+
+async def _serve(args):
+    server = await FakeLLMServer(
+        args.host, args.port, args.latency, args.jitter, args.rate_429, args.retry_after
+    ).start()
+    print(f"假 LLM 服务已启动：LLM_BASE_URL={server.base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
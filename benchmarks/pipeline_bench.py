@@ -0,0 +1,335 @@
+# benchmarks/pipeline_bench.py - 端到端压测：上传、解析流水线、多条件搜索、批量重测
+#
+# 外部依赖全部换成本地替身，单机即可运行：
+#   - MinIO：内存对象存储（benchmarks/fake_minio.py）
+#   - LLM：本地假服务，可配置延迟和 429 比例（benchmarks/fake_llm.py），走真实的 openai SDK 和 HTTP
+#   - 数据库：默认临时 SQLite 文件；设置 DB_URL 可以换成 MySQL（注意会在该库里建表写数据）
+#   - 语料：合成 PDF（benchmarks/corpus.py），搜索场景另外按同样的分布灌入结构化数据
+#
+# 用法：
+#   python -m benchmarks.pipeline_bench --resumes 200 --search-rows 20000 --llm-latency 0.8 --rate-429 0.02
+#   python -m benchmarks.pipeline_bench --compare benchmarks/results/pipeline_20261017_120000.json
+# 每个场景报告吞吐和 p50 / p99，结果写到 benchmarks/results/pipeline_<时间>.json，--compare 对比历史结果
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+os.environ.setdefault("DB_URL", f"sqlite://{os.path.join(tempfile.mkdtemp(prefix='resume_bench_'), 'bench.sqlite3')}")
+os.environ.setdefault("LLM_API_KEY", "bench")
+os.environ.setdefault("LLM_MODEL_NAME", "bench")
+
+import httpx  # noqa: E402
+from tortoise import Tortoise  # noqa: E402
+
+from app.settings import TORTOISE_ORM  # noqa: E402
+from app.db.resume_table import Resume  # noqa: E402
+from app.enums.education import Degree, SchoolTier  # noqa: E402
+from app.services.prompt_service import PromptService  # noqa: E402
+from app.services.resume_service import ResumeService  # noqa: E402
+from app.services.resume_writer import ResumeWriter  # noqa: E402
+from app.services.run_service import RunService, TOPIC_RESUMES, run_topic  # noqa: E402
+from app.services.skill_service import SkillService  # noqa: E402
+from app.utils import llm_client  # noqa: E402
+from app.utils.events import event_bus  # noqa: E402
+from app.utils.llm_client import LLMClient  # noqa: E402
+from app.worker import ResumeWorker  # noqa: E402
+from benchmarks.corpus import generate_corpus, resume_text  # noqa: E402
+from benchmarks.fake_llm import FakeLLMServer, fake_profile  # noqa: E402
+from benchmarks.fake_minio import InMemoryObjectStore  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+FINAL_STATUSES = (2, 3, 4)
+
+CRITERIA = "岗位：后端开发工程师。要求本科及以上学历，熟悉 Python 或 Java，有数据库使用经验。"
+
+# 搜索场景：每个过滤条件单独一组，再加几组常见的组合
+SEARCH_CASES = {
+    "none": {},
+    "status": {"status": "2"},
+    "name": {"name": "王"},
+    "university": {"university": "浙江大学"},
+    "schooltier": {"schooltier": SchoolTier.c985},
+    "degree": {"degree": Degree.master},
+    "major": {"major": "软件工程"},
+    "skill_and": {"skill": "python,mysql"},
+    "skill_or_not": {"skill": "java|go,-php"},
+    "date_range": {"date_from": "2020", "date_to": "2030"},
+    "keyword": {"keyword": "推荐系统"},
+    "university+degree": {"university": "浙江大学", "degree": Degree.bachelor},
+    "schooltier+skill": {"schooltier": SchoolTier.c211, "skill": "python|java"},
+    "keyword+skill": {"keyword": "订单", "skill": "mysql"},
+    "status+major+skill": {"status": "2,3", "major": "计算机科学与技术", "skill": "redis"},
+}
+
+
+def summarize(latencies, elapsed: float = None) -> dict:
+    """最近秩法取分位数；elapsed 给出时按它算吞吐（并发场景），否则按延迟之和（串行场景）"""
+    values = sorted(latencies)
+    if not values:
+        return {"count": 0}
+
+    def _pct(p):
+        return values[min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))]
+
+    elapsed = elapsed if elapsed is not None else sum(values)
+    return {
+        "count": len(values),
+        "throughput_per_s": round(len(values) / elapsed, 2) if elapsed > 0 else None,
+        "p50_ms": round(_pct(50) * 1000, 2),
+        "p99_ms": round(_pct(99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2),
+        "mean_ms": round(sum(values) / len(values) * 1000, 2),
+    }
+
+
+async def _collect_final(queue: asyncio.Queue, pending: set, started_at: dict, timeout: float) -> dict:
+    """从事件队列收集每份简历第一次到达终态的时间，返回 {简历 ID: (状态, 时间戳)}"""
+    done = {}
+    deadline = time.monotonic() + timeout
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print(f"等待超时，还有 {len(pending)} 份简历没有结束")
+            break
+        try:
+            event = await asyncio.wait_for(queue.get(), timeout=remaining)
+        except asyncio.TimeoutError:
+            continue
+        rid = event["resume_id"]
+        if event["to"] == 1 and rid not in started_at:
+            started_at[rid] = event["ts"]
+        if event["to"] in FINAL_STATUSES and rid in pending:
+            pending.discard(rid)
+            done[rid] = (event["to"], event["ts"])
+    return done
+
+
+async def bench_upload_and_parse(args, http: httpx.AsyncClient) -> dict:
+    """
+    上传：并发调用 POST /resumes/upload（流式写对象存储 + 建档 + 入队）
+    端到端：从发起上传到简历状态变为 合格 / 不合格 / 失败（worker 同时在跑，和线上一致）
+    """
+    corpus = generate_corpus(args.resumes, seed=args.seed, pages=args.pages)
+    queue = event_bus.subscribe(TOPIC_RESUMES)
+    semaphore = asyncio.Semaphore(args.upload_concurrency)
+    upload_latencies, submitted_at, failures = [], {}, 0
+
+    async def _upload(index, data):
+        nonlocal failures
+        async with semaphore:
+            started = time.time()
+            response = await http.post(
+                "/resumes/upload", files={"file": (f"resume_{index}.pdf", data, "application/pdf")}
+            )
+            upload_latencies.append(time.time() - started)
+            if response.status_code != 200:
+                failures += 1
+                return
+            submitted_at[response.json()["data"]["resume_id"]] = started
+
+    started = time.monotonic()
+    await asyncio.gather(*[_upload(i, data) for i, data in enumerate(corpus)])
+    upload_elapsed = time.monotonic() - started
+
+    try:
+        started_at = {}
+        done = await _collect_final(queue, set(submitted_at), started_at, args.timeout)
+    finally:
+        event_bus.unsubscribe(TOPIC_RESUMES, queue)
+    parse_elapsed = time.monotonic() - started
+
+    end_to_end = [ts - submitted_at[rid] for rid, (_, ts) in done.items()]
+    processing = [ts - started_at[rid] for rid, (_, ts) in done.items() if rid in started_at]
+    statuses = [status for status, _ in done.values()]
+    return {
+        "upload": dict(summarize(upload_latencies, upload_elapsed), failed=failures),
+        "parse_end_to_end": dict(
+            summarize(end_to_end, parse_elapsed),
+            qualified=statuses.count(2),
+            unqualified=statuses.count(3),
+            failed=statuses.count(4),
+            unfinished=len(submitted_at) - len(done),
+        ),
+        # 从 worker 开始处理（状态 0→1）到结束，不含排队
+        "parse_processing": summarize(processing, parse_elapsed),
+    }
+
+
+async def bench_reanalysis(args, prompt) -> dict:
+    """改提示词后批量重测全部简历：已抽取过的只重跑评估"""
+    await PromptService.update_prompt(prompt.id, content=CRITERIA + f"\n（重测 {datetime.now():%H:%M:%S}）")
+    run = await RunService.create_run()
+    if run is None:
+        return {"count": 0}
+
+    queue = event_bus.subscribe(run_topic(run.id))
+    started = time.monotonic()
+    try:
+        started_at = {}
+        ids = await Resume.filter(is_deleted=0, id__lte=run.max_resume_id).values_list("id", flat=True)
+        done = await _collect_final(queue, set(ids), started_at, args.timeout)
+    finally:
+        event_bus.unsubscribe(run_topic(run.id), queue)
+    elapsed = time.monotonic() - started
+
+    snapshot = await RunService.snapshot(run.id)
+    latencies = [ts - started_at[rid] for rid, (_, ts) in done.items() if rid in started_at]
+    return dict(
+        summarize(latencies, elapsed),
+        total=run.total,
+        elapsed_s=round(elapsed, 2),
+        failed=snapshot["failed"] if snapshot else None,
+    )
+
+
+async def seed_search_rows(count: int, seed: int, batch_size: int = 500) -> None:
+    """按语料的分布灌入已解析完成的简历（结构化字段 + 原文索引 + 技能关联），不走 LLM"""
+    rnd = random.Random(seed)
+    for start in range(0, count, batch_size):
+        prefix = f"bench://seed/{seed}/{start}/"
+        size = min(batch_size, count - start)
+        await Resume.bulk_create([Resume(file_url=f"{prefix}{i}", status=0) for i in range(size)])
+        resumes = await Resume.filter(file_url__startswith=prefix)
+
+        writer = ResumeWriter()
+        for resume in resumes:
+            text = "\n".join(resume_text(start + int(resume.file_url.rsplit("/", 1)[1]), rnd))
+            ResumeService.apply_profile(resume, LLMClient._normalize_profile(fake_profile(text)))
+            writer.add_profile(resume, text)
+            writer.set_status(resume, 2 if rnd.random() < 0.4 else 3)
+        SkillService.index_resume_skills(await writer.flush())
+
+
+async def bench_search(args) -> dict:
+    """每组条件先预热一次，再串行执行 search_repeat 次（翻第一页，带总数，和前端默认请求一致）"""
+    results = {}
+    for label, filters in SEARCH_CASES.items():
+        await ResumeService.get_resumes(**filters)
+        latencies, total = [], None
+        for _ in range(args.search_repeat):
+            started = time.perf_counter()
+            data = await ResumeService.get_resumes(**filters)
+            latencies.append(time.perf_counter() - started)
+            total = data.get("total") if isinstance(data, dict) else None
+        results[label] = dict(summarize(latencies), matched=total)
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return ""
+
+
+def compare(current: dict, baseline: dict, prefix: str = "") -> None:
+    """逐项打印和历史结果的差异（p50 / p99 / 吞吐）"""
+    for key, value in current.items():
+        old = baseline.get(key) if isinstance(baseline, dict) else None
+        if not isinstance(value, dict) or not isinstance(old, dict):
+            continue
+        if "p50_ms" in value and "p50_ms" in old:
+            parts = []
+            for metric in ("throughput_per_s", "p50_ms", "p99_ms"):
+                if value.get(metric) and old.get(metric):
+                    parts.append(f"{metric} {old[metric]} → {value[metric]} ({value[metric] / old[metric]:.2f}x)")
+            print(f"{prefix}{key:>24}: " + "  ".join(parts))
+        else:
+            compare(value, old, f"{prefix}{key}.")
+
+
+async def run(args) -> dict:
+    store = InMemoryObjectStore(args.storage_latency).install()
+    llm = await FakeLLMServer(
+        latency=args.llm_latency, jitter=args.llm_jitter, rate_429=args.rate_429, seed=args.seed
+    ).start()
+    llm_client.client = llm_client.create_client(base_url=llm.base_url, api_key="bench")
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    await Tortoise.generate_schemas()
+    from app.main import app  # 导入路由；不走 lifespan，初始化都在上面做了
+
+    results = {}
+    worker = ResumeWorker(args.worker_concurrency)
+    try:
+        prompt = await PromptService.create_prompt("压测岗位", CRITERIA, is_active=True)
+        await SkillService.load_index()
+        worker.start()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            print(f"上传 + 解析 {args.resumes} 份 ...")
+            results.update(await bench_upload_and_parse(args, http))
+
+        print("批量重测 ...")
+        results["reanalysis"] = await bench_reanalysis(args, prompt)
+        await worker.stop()
+        worker = None
+
+        print(f"灌入 {args.search_rows} 份搜索数据 ...")
+        await seed_search_rows(args.search_rows, args.seed)
+        print("搜索 ...")
+        results["search"] = await bench_search(args)
+    finally:
+        if worker is not None:
+            await worker.stop()
+        await ResumeService.shutdown_pipeline()
+        await Tortoise.close_connections()
+        await llm_client.client.close()
+        await llm.close()
+        store.uninstall()
+
+    results["fake_llm"] = llm.stats()
+    results["object_store"] = store.stats()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=200, help="上传并解析的 PDF 份数")
+    parser.add_argument("--pages", type=int, default=1)
+    parser.add_argument("--upload-concurrency", type=int, default=16)
+    parser.add_argument("--worker-concurrency", type=int, default=32)
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="假 LLM 单次请求延迟（秒）")
+    parser.add_argument("--llm-jitter", type=float, default=0.2)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="假 LLM 返回 429 的比例")
+    parser.add_argument("--storage-latency", type=float, default=0.0, help="对象存储单次读写延迟（秒）")
+    parser.add_argument("--search-rows", type=int, default=20000)
+    parser.add_argument("--search-repeat", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=600, help="解析 / 重测场景最长等待（秒）")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--compare", help="历史结果 JSON，打印对比")
+    args = parser.parse_args()
+
+    started = datetime.now()
+    results = asyncio.run(run(args))
+    report = {
+        "started_at": started.isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "db": os.environ["DB_URL"].split("://", 1)[0],
+        "args": {k: v for k, v in vars(args).items() if k != "compare"},
+        "results": results,
+    }
+    print(json.dumps(report["results"], ensure_ascii=False, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f).get("results", {}))
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"pipeline_{started:%Y%m%d_%H%M%S}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"结果已写入 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# benchmarks/school_tier_matcher.py - 学校层次推断：逐项判断（旧实现）vs 预编译匹配器 vs 批量接口
+#
+# 用法（纯 CPU，不需要数据库）：
+#   python -m benchmarks.school_tier_matcher --names 1000000
+# 先逐条核对新旧结果完全一致，再计时；结果写到 benchmarks/results/school_tier_matcher_<时间>.json
+import argparse
+import json
+import os
+import random
+import time
+from datetime import datetime
+from typing import Iterable, Optional, Set
+
+from app.enums.education import (
+    JUNIOR_KEYWORDS,
+    ORDINARY_KEYWORDS,
+    SCHOOL_ALIASES,
+    SCHOOL_TIER_211,
+    SCHOOL_TIER_985,
+    SCHOOL_TIER_DOUBLE_FIRST,
+    SchoolTier,
+    infer_school_tier,
+    infer_school_tiers,
+    normalize_university_name,
+)
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+# ---- 旧实现（原样保留，作为对照和正确性基准）----
+
+def _strip_suffixes(name: str, suffixes: Iterable[str]) -> str:
+    for suffix in suffixes:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def _matches_school_set(name: str, school_set: Set[str]) -> bool:
+    if name in school_set:
+        return True
+    base = _strip_suffixes(name, ("大学", "学院", "学校", "分校"))
+    if base and base != name:
+        if base in school_set:
+            return True
+        if f"{base}大学" in school_set:
+            return True
+        if f"{base}学院" in school_set:
+            return True
+    return False
+
+
+def legacy_infer_school_tier(university: Optional[str]) -> Optional[SchoolTier]:
+    if not university:
+        return None
+    normalized = normalize_university_name(university)
+    if not normalized:
+        return None
+    if "985" in normalized:
+        return SchoolTier.c985
+    if "211" in normalized:
+        return SchoolTier.c211
+    if _matches_school_set(normalized, SCHOOL_TIER_985):
+        return SchoolTier.c985
+    if _matches_school_set(normalized, SCHOOL_TIER_211):
+        return SchoolTier.c211
+    if _matches_school_set(normalized, SCHOOL_TIER_DOUBLE_FIRST):
+        return SchoolTier.first_class
+    if any(keyword in normalized for keyword in JUNIOR_KEYWORDS):
+        return SchoolTier.junior
+    if any(keyword in normalized for keyword in ORDINARY_KEYWORDS):
+        return SchoolTier.ordinary
+    return None
+
+
+# ---- 数据 ----
+
+def make_names(count: int, distinct: int, seed: int = 42) -> list:
+    """
+    模拟简历里的学校名：名单内的名字、简称、换后缀 / 加空格的写法、普通院校、专科、带 985 字样、空值
+    先生成 distinct 个候选名字，再按长尾分布抽样（真实数据里热门学校占大头）
+    """
+    rnd = random.Random(seed)
+    listed = sorted(SCHOOL_TIER_985 | SCHOOL_TIER_211 | SCHOOL_TIER_DOUBLE_FIRST)
+    aliases = sorted(SCHOOL_ALIASES)
+    pool = []
+    while len(pool) < distinct:
+        kind = rnd.random()
+        school = rnd.choice(listed)
+        if kind < 0.3:
+            pool.append(school)
+        elif kind < 0.4:
+            pool.append(rnd.choice(aliases))
+        elif kind < 0.5:
+            stem = school[:-2] if school.endswith(("大学", "学院")) else school
+            pool.append(stem + rnd.choice(("学院", "学校", "分校", "大学", "")))
+        elif kind < 0.55:
+            pool.append(" ".join(school))
+        elif kind < 0.8:
+            pool.append(f"{rnd.choice('东南西北江河湖海山')}{rnd.randint(1, 9999)}{rnd.choice(('大学', '学院', '师范学院'))}")
+        elif kind < 0.92:
+            pool.append(f"某某{rnd.randint(1, 9999)}{rnd.choice(JUNIOR_KEYWORDS)}")
+        elif kind < 0.95:
+            pool.append(f"{school}（985）")
+        elif kind < 0.98:
+            pool.append(f"海外{rnd.randint(1, 9999)}University")
+        else:
+            pool.append(rnd.choice([None, "", "  "]))
+    weights = [1.0 / (i + 1) for i in range(len(pool))]
+    return rnd.choices(pool, weights=weights, k=count)
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=50_000, help="候选学校名个数（抽样前，可能有重复）")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    names = make_names(args.names, args.distinct)
+    print(f"{len(names)} 个学校名（{len(set(names))} 个不同）")
+
+    # 正确性：新旧实现逐条一致
+    expected = [legacy_infer_school_tier(n) for n in names]
+    assert [infer_school_tier(n) for n in names] == expected, "逐条推断结果与旧实现不一致"
+    assert infer_school_tiers(names) == expected, "批量推断结果与旧实现不一致"
+    print("结果与旧实现一致")
+
+    timings = {
+        "legacy": _time(lambda: [legacy_infer_school_tier(n) for n in names], args.repeat),
+        "matcher": _time(lambda: [infer_school_tier(n) for n in names], args.repeat),
+        "matcher_batch": _time(lambda: infer_school_tiers(names), args.repeat),
+    }
+    for label, seconds in timings.items():
+        print(
+            f"{label:>14}: {seconds:.3f}s  {len(names) / seconds / 1e6:.2f}M 个/秒  "
+            f"加速 {timings['legacy'] / seconds:.1f}x"
+        )
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"school_tier_matcher_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"names": len(names), "distinct": args.distinct, "seconds": timings}, f, ensure_ascii=False, indent=2)
+    print(f"结果已写入 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# benchmarks/startup.py - 冷启动耗时：导入耗时（python -X importtime）和服务从进程启动到可以接请求的时间
+#
+# 用法：
+#   python -m benchmarks.startup --repeat 5
+# 每一项都在新的子进程里测（冷启动），数据库是临时 SQLite 文件（先用 app.scripts.migrate 建表，不计入启动时间），
+# MinIO 指向一个没人监听的端口：启动不应该等桶检查
+# 结果写到 benchmarks/results/startup_<时间>.json
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 进入 lifespan（建连接、加载技能索引、启动 worker）之后打印 READY，等同 uvicorn 开始接请求的时刻
+SERVE_SCRIPT = """
+import asyncio
+from app.main import app
+
+async def main():
+    async with app.router.lifespan_context(app):
+        print("READY", flush=True)
+
+asyncio.run(main())
+"""
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def _env(db_path: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "DB_URL": f"sqlite://{db_path}",
+        "LLM_API_KEY": env.get("LLM_API_KEY") or "bench",
+        "MINIO_ENDPOINT": "127.0.0.1:1",
+        "PYTHONPATH": ROOT,
+    })
+    return env
+
+
+def _timed(args, env, until: str = None) -> float:
+    """从启动子进程开始计时，到进程退出（或 stdout 出现 until 那一行）为止"""
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, *args], cwd=ROOT, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    elapsed = None
+    if until:
+        for line in proc.stdout:
+            if line.strip() == until:
+                elapsed = time.perf_counter() - started
+                break
+    proc.stdout.read()
+    if proc.wait() != 0:
+        raise RuntimeError(f"{' '.join(args)} 退出码 {proc.returncode}")
+    if elapsed is None:
+        if until:
+            raise RuntimeError(f"{' '.join(args)} 没有输出 {until}")
+        elapsed = time.perf_counter() - started
+    return elapsed
+
+
+def importtime(module: str, env: dict, top: int) -> dict:
+    """解析 -X importtime 的输出：模块总耗时 + 自身耗时最多的若干模块（微秒换算成毫秒）"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us)))
+
+    total = next((cumulative for name, _, cumulative in rows if name == module), None)
+    # 各顶层包自身那一行的累计耗时（含其全部子模块），看大头是哪个第三方库
+    packages = {}
+    for name, _, cumulative in rows:
+        root = name.split(".")[0]
+        if name == root:
+            packages[root] = max(packages.get(root, 0), cumulative)
+    return {
+        "total_ms": round(total / 1000, 1) if total else None,
+        "top_self_ms": {name: round(s / 1000, 1) for name, s, _ in sorted(rows, key=lambda r: -r[1])[:top]},
+        "top_packages_ms": {
+            name: round(c / 1000, 1) for name, c in sorted(packages.items(), key=lambda kv: -kv[1])[:top]
+        },
+    }
+
+
+def _stats(values) -> dict:
+    return {
+        "min_ms": round(min(values) * 1000, 1),
+        "p50_ms": round(statistics.median(values) * 1000, 1),
+        "max_ms": round(max(values) * 1000, 1),
+        "runs": len(values),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="列出耗时最多的模块数")
+    args = parser.parse_args()
+
+    env = _env(os.path.join(tempfile.mkdtemp(prefix="resume_startup_"), "bench.sqlite3"))
+    migrate_seconds = _timed(["-m", "app.scripts.migrate"], env)
+
+    timings = {
+        "python_bare": [_timed(["-c", "pass"], env) for _ in range(args.repeat)],
+        "import_app_main": [_timed(["-c", "import app.main"], env) for _ in range(args.repeat)],
+        "import_app_worker": [_timed(["-c", "import app.worker"], env) for _ in range(args.repeat)],
+        "api_ready": [_timed(["-c", SERVE_SCRIPT], env, until="READY") for _ in range(args.repeat)],
+    }
+    report = {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "migrate_ms": round(migrate_seconds * 1000, 1),
+        "wall": {label: _stats(values) for label, values in timings.items()},
+        "importtime": {
+            "app.main": importtime("app.main", env, args.top),
+            "app.worker": importtime("app.worker", env, args.top),
+        },
+    }
+    try:
+        report["git_revision"] = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        report["git_revision"] = ""
+
+    for label, stats in report["wall"].items():
+        print(f"{label:>18}: p50 {stats['p50_ms']}ms  (min {stats['min_ms']}ms, max {stats['max_ms']}ms)")
+    for module, detail in report["importtime"].items():
+        print(f"{module} 导入 {detail['total_ms']}ms，最慢的包：")
+        for name, ms in list(detail["top_packages_ms"].items())[:8]:
+            print(f"  {name:<24}{ms}ms")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"startup_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"结果已写入 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `aerich` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `version` VARCHAR(255) NOT NULL,
+    `app` VARCHAR(100) NOT NULL,
+    `content` JSON NOT NULL
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `resumes` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `is_deleted` INT NOT NULL COMMENT '逻辑删除状态，0=正常, 1=已删除',
+    `file_url` VARCHAR(255) NOT NULL COMMENT '简历文件URL',
+    `avatar_url` VARCHAR(255) COMMENT '头像URL',
+    `status` INT NOT NULL COMMENT '处理状态',
+    `name` VARCHAR(50) COMMENT '姓名',
+    `phone` VARCHAR(50) COMMENT '联系电话',
+    `email` VARCHAR(100) COMMENT '邮箱',
+    `university` VARCHAR(100) COMMENT '毕业院校',
+    `schooltier` VARCHAR(50) COMMENT '学校层次',
+    `degree` VARCHAR(50) COMMENT '学历',
+    `major` VARCHAR(100) COMMENT '专业',
+    `graduation_time` VARCHAR(50) COMMENT '毕业时间/年份',
+    `education_history` JSON COMMENT '完整教育经历列表',
+    `work_experience` JSON COMMENT '工作经历列表',
+    `projects` JSON COMMENT '项目经历列表',
+    `skills` JSON COMMENT '技能标签列表，如 [\'Python\', \'Vue\']',
+    `parse_result` JSON COMMENT 'AI解析结果',
+    `created_at` DATETIME(6) NOT NULL
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `prompts` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `name` VARCHAR(50) NOT NULL,
+    `content` LONGTEXT NOT NULL,
+    `is_active` BOOL NOT NULL,
+    `is_deleted` INT NOT NULL COMMENT '逻辑删除状态，0=正常, 1=已删除',
+    `created_at` DATETIME(6) NOT NULL
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `resume_evaluations` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `score` INT COMMENT 'AI判断岗位契合度分数',
+    `is_qualified` BOOL NOT NULL COMMENT '是否合格',
+    `reason` LONGTEXT COMMENT 'AI判断合格/不合格的理由',
+    `evaluated_at` DATETIME(6) NOT NULL COMMENT '评估时间',
+    `prompt_id` INT NOT NULL COMMENT '关联的岗位提示词',
+    `resume_id` INT NOT NULL COMMENT '关联简历',
+    UNIQUE KEY `uid_resume_eval_resume__2f0a0c` (`resume_id`, `prompt_id`),
+    CONSTRAINT `fk_resume_e_prompts_79e5fa9c` FOREIGN KEY (`prompt_id`) REFERENCES `prompts` (`id`) ON DELETE CASCADE,
+    CONSTRAINT `fk_resume_e_resumes_7ac5d696` FOREIGN KEY (`resume_id`) REFERENCES `resumes` (`id`) ON DELETE CASCADE
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `skills` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `name` VARCHAR(100) NOT NULL UNIQUE COMMENT '技能名称',
+    `created_at` DATETIME(6) NOT NULL
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `resume_skills` (
+    `resumes_id` INT NOT NULL,
+    `skill_id` INT NOT NULL,
+    FOREIGN KEY (`resumes_id`) REFERENCES `resumes` (`id`) ON DELETE CASCADE,
+    FOREIGN KEY (`skill_id`) REFERENCES `skills` (`id`) ON DELETE CASCADE,
+    UNIQUE KEY `uidx_resume_skil_resumes_9502b6` (`resumes_id`, `skill_id`)
+) CHARACTER SET utf8mb4;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
+
+
+MODELS_STATE = (
+    "eJztXG1z2jgQ/isMX5KbybXG4Bdu5j5ASu9yTUInob1Om45HtmVwY2xqy0mYXv77aeV3Y1"
+    "NMgJiULy2sdm3peaTVSrvkR3Pq6NjyXvWwa2qT5h+NH00bTTH9kGs5aTTRbJbIQUCQajFV"
+    "lOioHnGRRqjUQJaHqUjHnuaaM2I6NpXavmWB0NGoommPE5Fvm999rBBnjMkEu7Thy1cqNm"
+    "0dP2Av+jq7VQwTW3qmq6YO72ZyhcxnTHZmk7dMEd6mKppj+VM7UZ7NycSxY23TJiAdYxu7"
+    "iGB4PHF96D70LhxnNKKgp4lK0MWUjY4N5FskNVxVSWRNRbkcjpTrwUhRmhUA0hwbwKVd9d"
+    "jox9CF3/lWR+rIbbEjUxXWzVgiPQavToAJDBk8l6PmI2tHBAUaDOME1DvsetClBWRPJ8gt"
+    "hjZlksOXdjyPb4TmMoAjQYJwMqt2AfEUPSgWtscElgYvCEsA/di7Ov27d3VMtX6DVzp0GQ"
+    "Sr4zJs4oM2QD1BGRZVBYRD9ReIbovjVkCXapWiy9qy6NI3Ehws7SzC/1wPL4sRTpnkUNZN"
+    "jTT+a1imt+Ar9gDtJeACGPDkqed9t9KYHl/0PuXhPj0f9hk4jkfGLnsKe0CfQg8O2rhNeR"
+    "MQqEi7vUeuriy0OLxTprvYNOWneQmy0ZgBCSOG8YVb1hX2fMb/wmYWtizdzFym4x12sxe1"
+    "m5ke7bOFAYwK4GaMfg7yptwAVw3k5o3f5drqjS8b3daNL/A8RyWi2LnxJV4Vb3yR46jcMD"
+    "iN+5N+U8U21cJtinGLfhd0g09bNXdIWEKQYVpY8V2rym6YtqnzlkgJklSZwiu0ZaBDkKUb"
+    "v4MN8cPV+Ypo7yASuaNrx61KQdZqLRJCN7N9DoRumy4JgdOMOuHuEUR8r4JXSgzq7JGELg"
+    "f+p8OJaS/0PL6F/V9hUkf6dZ/OOvjxDqevM5eFVcJtoTzaFhaC7RnFqhLMsUG9cZY5AWay"
+    "ZtAdVhLaApWoek0wx1NkVvLXsUG9Me9yCMOmqa7qMbZ/lqSDZvcbZF4F76xVvUEXVV2AuK"
+    "SFWCBIg0JR5utDgKdNHMciJnarEJC1qjcBgiqKAej0s9YBAtT1CNi8p9ExPe1Xcu+JxT6g"
+    "DqF5PZCeom9OpSkeG9QbZ+pY2oF7qY1LGbtI9xF0USFmtRixwLTe8Ke9uygYdMp3BaPzGm"
+    "4CpA47jtYlptF9LQB2YnrEcQv22/Lr20LjJ13k7tAPyRpQA2yIgtCFyFOle4CENSO6OhD4"
+    "lkTlsiivxtUubn3T3N077q2CH2bYNbGtFSyocuYKTPeENx3DwjIEbb+4mrnON6yRgquHcp"
+    "LSNvvBTleW6EqSRIz3ix3v1rSsStwkFvvBjMjDlajMGTrEvJwE5z0Jp5kJ7qzhpkPmG1+O"
+    "3rNhHZ00jj76+OhrPXmbIdfDCiSRrEp5x7zdPnDYO6M8dTGN6kSpy8H60oPPWj250VwMmC"
+    "mogJk3tAUCuZKscMYyz01o+ir6UJ/Mw+r5NzpAfWhb83D2LKFmdHYxuB71Lt5n+HnTGw2g"
+    "hWfSeU56LOY4ix/S+Pds9HcDvjY+Dy8HeRpjvdHnJvQJ+cRRbOdeQXoqRRlJI9SqZKJTge"
+    "cdsoKQvsDv9kPjt++usMWUCmZCJs08iB9Xn/kA4UpLaseXmnFWqtKCTaTRbHliOj+37SkE"
+    "jQsouED2fOTAv2yRntFOoOJIMeThGh62DvjPmgovA/kkHJeSK2qIR+nCxKROKmpPVTIYjs"
+    "uIuMXzBOWgdiAmKWwLrcJWMnEdfzxJGpQkzKCAB+lxaD3tXZ/23rD1qyzA/bi0XuO960xn"
+    "pFlQrxG2nCyr15gxnUO9xsuq19hpyq52m/GWb1hKy+JG+KFk3paXxe0nxMvim8Gn0fLQMw"
+    "5vzoeXf0Xq+Xg0C7npKdQxmXcFk7rvOBZGdmkJUmKXQ16lhtuCPpbsFvv+cHiewb5/lgf3"
+    "w0V/cHXcYkRQJTPYfhaT/oeKr5pXfB1OY+VQH05jUbj5Cx7KRBnK1LQuFAkaHbgda+twu9"
+    "JtI6g90VbM02zrsLZC7XUK5dIq7CwTP6vHzs+DzYb6X8K3sNkTnDm+HsL/Zwz/Pc1xC0Kl"
+    "8prISH+tLXuH16V002XpPaRnl7jQFVqsmE+GjRqxBAXHaoUl7nm2ZxoKffeRZVLtghn+s6"
+    "A1Y1rvuBVSESIPiaEOL0YciHL76ZfYG4xmaUDgFf0Yr/zElljUuS5hYU3E6L+GmgQuI4r2"
+    "xrCqWGivWBu168NeuFetFdvmbfcnum2y4ARKSYw2l64xWdF/vayYN5dppyGFUilSyNjs7i"
+    "Bam+h109tZGEZW4iBjs08cVEzrbALrhTNeHvpF3N/SmM0c2+/wqvmc5OebLwL2JYkeF93H"
+    "R43sNCxMuhR4mw3AnWRf6gn3ls/JeRoyHrmYhuf5vXOQACw4aMeZwfLTdZLNOyTPXszp+X"
+    "mTZ9uANlcuBj96g4VurHo23sGfmjjcZv8ikf3u/spFPoTaRE3M+jHUXhXFJMPMV8XkKoyy"
+    "hTHZ4pd8aUy6bObJhTHxVXxuX3/8H9bABMM="
+)
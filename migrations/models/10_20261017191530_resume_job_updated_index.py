@@ -0,0 +1,79 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resume_jobs` ADD INDEX `idx_resume_jobs_updated_2ad1c1` (`updated_at`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resume_jobs` DROP INDEX `idx_resume_jobs_updated_2ad1c1`;"""
+
+
+MODELS_STATE = (
+    "eJztXVlzm8gW/isqvSS3KhMjoFlu1TzYiTPxjGOnbGXu1MQpqoFGIkagsMTxnZv/fvs0Ow"
+    "IZZC3I1otL7u7D8p1ezvJ1889w5pnECV4fE982psN/D/4ZunhG6I9KzavBEM/neTkUhFh3"
+    "WFOct9GD0MdGSEst7ASEFpkkMHx7HtqeS0vdyHGg0DNoQ9ud5EWRa3+LiBZ6ExJOiU8rPn"
+    "+hxbZrkh8kSP+d32qWTRyz9Ki2Cfdm5Vp4P2dlZ274jjWEu+ma4TnRzM0bz+/DqedmrW03"
+    "hNIJcYmPQwKXD/0IHh+eLnnP9I3iJ82bxI9YkDGJhSMnLLyuruVlQ027uBxr16djTRt2AM"
+    "jwXACXPmrA3n4Cj/ALPxJlUREkUaFN2GNmJfLP+NY5MLEgg+diPPzJ6nGI4xYM4xzU78QP"
+    "4JEWkH0zxX49tAWRCr70wav4pmguAzgtyBHOe9U2IJ7hH5pD3EkIQ4NHaAmgfx5fvXl/fP"
+    "WStvoX3NKjwyAeHRdJFR/XAeo5yjCoOiCcNH+C6I44rgW6tFUjuqyujC69Y0jioV1G+Pfr"
+    "y4t6hAsiFZRN2wgH/xs4drAwV+wB2kvABTDgyrMg+OYUMX354fivKtxvzi9PGDheEE58dh"
+    "V2gRMKPUzQ1m1hNoECHRu3d9g3tYUaj/ea2i5WzfhZtQS7eMKAhDeG90uWrCsSREz/C4tZ"
+    "UrN0MfNZm2Djq9nnoR1QNTsEuhDoyyfQmzQcDmnLam0Q4jAK6tqxV4RL5+1ZOZlh26mrmN"
+    "NOvSBxWFu3ubaWddsW3JLQwyCva1LiuoE8vIlUTtBvIsVSRzcR4nmOlkiSeBPJvC7dRBLH"
+    "0XLL4gzuV/qfLgm0FREoxiP6PzItvig13KLCcgVZtkO0yHe6rM1FmU0t0GsYBFQ/sq5QdJ"
+    "GggDaQIt9EIrGkT1fnLcHegln0nQ4dv6sGylIr6SABeMOrNtUBUgU6IhBnWH3CnfXhKQ6m"
+    "nTt+KrQh1NfT8fPOfv3++BceSasAL4ktcJfERtihqox6vri3XApygT4vA0jlYNIXOak49e"
+    "9mQk+tpLZ9Om3f90nEhMVT5MxVOjJq43GhZocLLfhbmWnZFuZMoN84KxyCnmxY1KyRkYBo"
+    "iW72BPPMzm+LeSbQb8xVDhMwVfS2M8bmwwn0pVmIK7zvgndZqt+gS7qJYIEcYWZ9U0tcUv"
+    "j+KCAwpp7nhDbxuyigLNVvBSBdkmLQ6W9DBAXoqylg/TNN3pE1A7ueaxu408TTJN9vk1Hh"
+    "qMmIRoYEHtNIqqhoxaV3g6NDax4ep240Y6o5o4+GXYM0DBVtw2NlPZqpHyossqDU6Y2Wq6"
+    "vpqpWqlmiqqiiTTHzSyU7KJfZh+oLIQj+mrBn+6nVaKzKBfuNMV2ghXqd7M/tMfGxGGB6R"
+    "Th/dnK0a0X7DXzSTJGTRLq8iSzyCOKYssgBDX5wDMzJiYKd2EHp+jeHanAqrFX5UUmyL85"
+    "BigGpAGxJCKrhwOl0hZGJYaeQT8SO6QiiKpLTT1TYyaEXd3Xn+rUZ+zIlvk2Stbqu5GtE9"
+    "0ZtJYGBZyNgvXc197ysxwpoYXrOSijL7oR1VkelIkiVC9ks7wa3tOJ10k0vsh2YkHjI6Cm"
+    "eZqeUr6zIpaibOuEHIUOEHn198ZK/14tXgxZ8RefGln3qbYz8gGiTknU4cjqrcPujw+Izq"
+    "SSXUqpNklYPxZca/jX7qpkBDWNDMW1oDhlwDw6YkWdVNIvo6/bGpdMYm2QP0Bc1L17lPes"
+    "8S1YzPPpxej48/fCzp5+3x+BRqeFZ6Xyl9KVV0ll1k8J+z8fsB/Dv4+/LitKrGrN347yE8"
+    "E45CT3O9Ow2bBa88LU1R68LqKRie37ETm/Q18+5JIvzujyvisEY1PaFE2TnNLtef/gDmyk"
+    "gWsuxAllTvNGDz0ry35DB+9fS14Pe7pz8v4ELiz9aC3Jhe6OlD90g6XsXU0kI8qQH/A3bv"
+    "xx78XQhC1mvgGi62Cvg7JY81gfwqeS+tQkrM3tKHLkkXxrS+wES0PJ8p4pbc5yjHbLtMSU"
+    "ldIpXUhlPfiybTvELLTVsKeEwog9o3x9dvjt+yNUNbgPvnUr7lR9+bzcNhDd8yqXm1jG85"
+    "Z222xLekF7e/H8iPOyU/bpWK0TvbcMMBv0bG+5j8aOi3zYz3/YR4mbl9+td4uSeUWdvnlx"
+    "e/pc2r7lEZ8tK0UjE3PM8h2G3k8+ZyFeR1Krgp6LOS7WJ/cnl5XsL+5KwK7qcPJ6dXL0dM"
+    "EbSRHa9Mi2Quipw3JzVbkx7CO5XqN9oQz5F4iK6JPMumGTzkFDiI56iQckCGCjRGSzSBiG"
+    "RAxsESuEfHCdaroQPBvc8E90P4phnqpxW+KTF45uaKWi9L7o/WYS6VOY4xdQjMk5C7kJCg"
+    "FhO3LYfgfvaLFMVCx8hc/s5hvcSHfIbRPUkRywuvJJgQplcFzBbhlgn/TUVgWmyILKDcuD"
+    "WyrImHNklW+8F6/ffPyV1Y74kDCV8WfPq4Igl2BIbnk4M7v113Pga9Pa5Z+5UMvC1m46iJ"
+    "xtgj2CwPfKSimPmpgFmHWf6bYzvp5JY2+LqNOWo4f4uwY9PWNT38IaeoJLpfnpEYMz2Fx+"
+    "dI1+j7UDMhqDs3ozkCk0v0mfa2MCYy9I+Ye1oqSlfMZPcXElpy2LcdvKEvGBLfxp03PS4I"
+    "9ll1xTBBavjG+qlaMaBDg01sXMtBtenNkYmNsZLXUpXdK79lUWVP3ldp48OWLL6WNkdJZn"
+    "uBpd54Hes2OBLzv5MOSjL7pIOOOfZ1YL3gm1ehX8T9HbWq7Yn7B2mbXM/PwnkSsC/Juvv4"
+    "LnMGy92wNgNeM9usAe48Fd5PuDcc36iqoTQj16thN4dHxWyMmgBJRtNojork1IrDOYhPJr"
+    "6xW7rCJqCt8MVhDysMdKtt9GIL5/YdslPPxLLvkIVYG0exyKt7HEFxdRtqrxiK+WtWKYoV"
+    "umeZpVhmIlZ5ikUO46NZilkK5YEcCPCgG5MfCUn6waxHSsreMF0xP+QJf8c260nZoY95ne"
+    "MZt1QhkRvaTlznR26aD4lbHRIi202IPM3TvEQCpx8hHo92f5rX3Lc9v/YYniUhoFyk1zBb"
+    "Iwi/jkQF9oBheTcA4zAkKSu7JcBFkT4DHPOvVIVtXBVMKT02ZHfpu9L03tHercruj8WbMX"
+    "MkRFRQBbEqaukY894TS7iGj7MY5E5Wdb3TQWMloX6noyQBKJJU/7CfXDUtNtclSakBnF4Q"
+    "nz/UC2e0ZGF1HJ5V2TUMz63pqKgXxLMslDyynvm4xEGoEd+vO1SoOb9flur5yGRzsmKZI5"
+    "bU59LlEakC/auYPIL5WQUOhkQezznfUFL/ED56HuGj/SU3b9Xj3U+lNzGXD5no3fgpeWCp"
+    "LdCZQJ+5npANEQFYA8HeAB7OOFJHcLoR/QuJUFPUtwf4IfXfl9Q/7b1rwRq72LkP7OAqar"
+    "O9Ye86fWv0s8mgBD19wMHFp/PzXeX7C6d8NCYG0jNAHswMZKeOPJgagC7PjeDMWkGFcwlN"
+    "HjYFWiMEGwdhj2dseyuKaAx+HYBZDmwMOFiy/PmWhMWZ1PKwOVRHMhjtOmK6hCO/RhYtlw"
+    "WdGfaGXG4fsz7jQ3NpiZl+JYO66Cwsw67Arol4Tk7J7nWH6T6Vd2qTnAmTLmGlC18+uXRL"
+    "t5zYk+eScVF5XhBknhMkBYmyjBQuWyAXq5atlCdnv8FiWbI5H87LZKpqG0/LBPp8LAJz2S"
+    "U6LiQCx8blI2Wl+JnUJnxWNfcL0TOpGjwrjZMWmKftew55B+ptCWClBb5KI7xKFd07aotM"
+    "a9zdxhklF9ie3zPq3qHZ+oGIAtFGWRRio2RHTs/Bwdwo1gd/Z5f+zq5s7qJPVGt2V5ymZZ"
+    "Z32lSjHkZr47sY2q73fmL78SghMR0l9/kvOcKOE9uK6ZG6imXq6VZQsDAHBZ7Q69jtAWvX"
+    "EGFl5oQFv2rHj3Pjls3veCtfvM+y9Fwcz76oAWcJqxxhLAUwPFQJskLJvTn4G8vCpr8klz"
+    "dIjXrF4IRs16wgQivM6alhLmOgnyMBTsFN9tQykx8hhU/fq0hDie8MZxy3M9sPPKht8qBC"
+    "L6z7PlAjrln7PrNHJJk30gFRHJzJbtfSh1V3xSd5ogS0Etw7JqCBUb+KZbgg12fAl/f15F"
+    "gdlZeL/X5w9nY3GjGmxLide/Ty3TSyINdnjSRnhxWW3Qd0kX0Ni+3Ylzld7fQdrLXTNr16"
+    "UuHSj2Q0kAp7eYp/86ARLZnZRLzStPW+k/FfB/jhnP8Dl6LUbnUuhWW7djBdSe0V0X1ivC"
+    "VfjeJHK5y4sCfKb2S5ddiItavPEzyZ1OgGDnv7+X+04wCV"
+)
@@ -0,0 +1,74 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `resume_jobs` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `status` INT NOT NULL COMMENT '任务状态',
+    `attempts` INT NOT NULL COMMENT '已领取次数',
+    `available_at` DATETIME(6) NOT NULL COMMENT '最早可领取时间',
+    `locked_by` VARCHAR(100) COMMENT '持有租约的 worker',
+    `locked_until` DATETIME(6) COMMENT '租约到期时间',
+    `last_error` LONGTEXT COMMENT '最近一次失败原因',
+    `created_at` DATETIME(6) NOT NULL,
+    `updated_at` DATETIME(6) NOT NULL,
+    `resume_id` INT NOT NULL COMMENT '关联简历',
+    CONSTRAINT `fk_resume_j_resumes_50ad19c1` FOREIGN KEY (`resume_id`) REFERENCES `resumes` (`id`) ON DELETE CASCADE,
+    KEY `idx_resume_jobs_status_0647a2` (`status`, `available_at`),
+    KEY `idx_resume_jobs_status_18aad8` (`status`, `locked_until`)
+) CHARACTER SET utf8mb4;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `resume_jobs`;"""
+
+
+MODELS_STATE = (
+    "eJztXG1zmzgQ/isef2luJtdibN5u5j44aXpNm8SdxO11mnQYAcKhweCCyMv08t9PK94xOM"
+    "axHez6S2KvtFg8j7Ra7S78ao9dA9v+6z72LP26/VfrV9tBY0w/FFr2W200maRyEBCk2awr"
+    "SvtoPvGQTqjURLaPqcjAvu5ZE2K5DpU6gW2D0NVpR8sZpaLAsX4GWCXuCJNr7NGGy+9UbD"
+    "kGvsd+/HVyo5oWto3cUC0DfpvJVfIwYbJjh7xjHeHXNFV37WDspJ0nD+TadZLelkNAOsIO"
+    "9hDBcHniBTB8GF10n/EdhSNNu4RDzOgY2ESBTTK3q6mprK2qZ4OhenE0VNV2DYB01wFw6V"
+    "B9dvcjGMKffKcn9eSu2JNpFzbMRCI9hj+dAhMqMnjOhu1H1o4ICnswjFNQb7Hnw5CmkD28"
+    "Rl45tBmVAr504EV8YzRnARwLUoTTWbUOiMfoXrWxMyKwNHhBmAHol/754fv++R7t9Qf8pE"
+    "uXQbg6zqImPmwD1FOUYVHVQDjqvoXodjhuDnRpr0p0WVseXfqLBIdLO4/wh4vBWTnCGZUC"
+    "yoalk9Z/Ldvyp2zFBqA9A1wAA6489v2fdhbTvdP+1yLchyeDAwaO65ORx67CLnBAoQcDbd"
+    "5krAkINKTf3CHPUKdaXN6t6jvdNObHRQly0IgBCXcM9xdtWefYDxj/U5tZ1DJzM/NYH3+3"
+    "m23Vbmb5dMw2BjBqgJtTehrkZZkBrh7I7atA4braVSCbSucqEHieoxJR7F0FEq+JV4HIcV"
+    "RumpzO/U2/aWKX9sJdinGHfhcMk89qtddIWEqQadlYDTy7zm6Y1WnylkgJkjSZwit0ZaBD"
+    "kKWroIdN8fP5yZxor8ETuaVrx6tLQV5rIRIiM7N6DgSlS5eEwOlmk3D3CSKBX8MqpQpNtk"
+    "iCwoH96XFi1gq9jG1h/2tM6rh/06ezAXa8xxmLzGVhHndbqPa2hSlne0KxqgVzotBsnGVO"
+    "gJmsm3SHlYSuQCWa0RDM8RhZtex1otBszBUOYdg0tXktxurPkvSmWXyDPNTBO6/VbNBFzR"
+    "DAL+kg5ghSp1CU+eYQ4OvXrmsTC3t1CMhrNZsAQRPFEHT6We8BAdpiBCzf0hiYnvZrmfdU"
+    "YxNQB9e8GUiP0Q+31hRPFJqNMzUs3dC8NMakjDxkBAiGqBKrno9Yotps+LPWXRRMOuUVwe"
+    "y9gUiA1GPH0ab4NEagh8BeWz5xvZL9tjp8W6r8rEDuGu2QrAM1wIYoCAp4nhrdAySsm3Ho"
+    "QOA7EpXLojwfV+uI+ma5u3O9GxXfT7BnYUcvWVDVzJWobghvBoaFZQr6ZnE18dwfWCcloY"
+    "dqkrI6m8GOIkt0JUkixpvFjn9j2XYtblKNzWBG5CEkKnOmAT4vJ8F5T8JZZsKYNUQ6ZL51"
+    "+eoTu61X+61XXwL86nszeZsgz8cqJJHsWnnHot4mcNg/pjwpmHp1oqRwsL6M8LPeTG50Dw"
+    "NmKiph5i1tAUeuIiuc0yxyE6m+jj80J/Mwf/6N3qAxcOyHaPbMoGZ4fHp0Meyffsrx87Y/"
+    "PIIWnkkfCtI9scBZcpHWv8fD9y342vo2ODsq0pj0G35rw5hQQFzVce9UZGRSlLE0Rq1OJj"
+    "rjeN4iO3TpS+zuQaT87uM5tlmnkpmQSzMfJZdrznwAd6UjdZOgZpKVqrVgU2k6W1IYf7ja"
+    "UvD74GrbD9wz6yAK/oJK0KgE+1PkPAxd+Mus2zEdBCp3sSMCLuBii4D/ojUEVSDvR/elFq"
+    "pBkrv0YEZS6x63Z0pATNdjRNzghxTlsOgiISlqi7SiVnLtucHoOm1QU/+MAh7WFUDrYf/i"
+    "sP+WGT51Cu7HmYUunzx3PCHtkkKXqGV/VqHLhPXZFbpsV6HLWnOdjfNiVhyaqqwnHOL7in"
+    "lbXU+4mRDPcgyPvg5n++yJX3gyOPsn7l505POQW75KDZN1WzKpD1zXxsiprN1K9QrIa1Rx"
+    "VdAnkvVifzAYnOSwPzgugvv59ODofK/DiKCdrHD7ma6W2JXKNbxUbneMrYZ6d4yN3c3f8D"
+    "QrylDfpytQXWn2IKzYNSAspXQRFO3ocya4VnVYm6NoPYNyZfl6nomnCtmL82C5rv5l9Cts"
+    "9oRnju879/8F3X9fd70SV6m6mDTuv9CWvcY4M910WV4UGfklLihCh1VByrBRI5bZ4ViRtc"
+    "S9zPZMXaGfAbIt2rtkhj/ltOZUm+23Qg5H5CGj1uPFmANR7j4/+r9Eb5Y6BH7ZU4zVJ7ZU"
+    "o8kFHVNrIkH/DRRzcDlRvDdG5dhCd86isnUf9qK9aiHftqi7Od5tmzknUINjdrlscc6c9m"
+    "u7fN5CiQJ1KdRankJOZ30H0cZ4r8veziI3shYHOZ1N4qBmWmcZWE+d8YrQT+P+jvps1sj5"
+    "iOfN56TPvW4F7DMSPR66S44a+WlYmnQpsTZLgDvNvjQT7hWfk4s05CxyOQ0v86B4mAAsOW"
+    "gnmcHq03Wazdslz7bm9PyyybNVQFuos4OnBWGhm/Oejdfwjo5dNPs38ezX93qQogu1jJqY"
+    "xX2ojSqKSW+zWBVTqDDKF8bki1+KpTHZsplnF8YkofgnYulQP1YZRI+Ky56MnsfFbCvd5C"
+    "8zz/SjW2SxmQRmjfbLttmufkMJCRxi2WGcfecarC2wvp2vaehheKxd4FHn5V/TgAjBcUXa"
+    "nCBnVZoMc1g4oMjsyZOuIYZP9r5kliJnZ2o6XkXdzXG9wB2WOBZkxQpQgc0CLTWDrxviks"
+    "XYzYy2RtuLVusFBzmlJidMIMoBtT2Uf3ggTDFMeGAFEoYQD2nB44fhOwIacSrKbfU1l2dR"
+    "dwnLc20cZXkReJYOkTrmb74ukU9U7HllbwWoTmPmtRq+MplNlk2jw3KXXLw9CkqX/pUNXg"
+    "D7rECqWcRzbpjrzl3u4hjV9nK74hi5twJNjAVZz2vuWG8K6yUmeeoRt11OdJcTbRjsS8yJ"
+    "rjMZ9/g/Ojqp0Q=="
+)
@@ -0,0 +1,63 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resumes` ADD `file_hash` VARCHAR(64) COMMENT '文件SHA-256';
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_file_ha_4c4b53` (`file_hash`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_file_ha_4c4b53`;
+        ALTER TABLE `resumes` DROP COLUMN `file_hash`;"""
+
+
+MODELS_STATE = (
+    "eJztXG1zmzgQ/isef2luJm0xNm83cx+cNL3mmpdO4vY6TTqMAGHTYHBB5GV6+e+nFe8YHO"
+    "PYDnb9JbElLYbnkXZXuyt+tceugW3/TR97lj5q/9n61XbQGNMPhZ79VhtNJmk7NBCk2Wwo"
+    "SsdoPvGQTmiriWwf0yYD+7pnTYjlOrTVCWwbGl2dDrScYdoUONbPAKvEHWIywh7tuPpOmy"
+    "3HwPfYj79OblTTwraRu1XLgN9m7Sp5mLC2Y4e8ZwPh1zRVd+1g7KSDJw9k5DrJaMsh0DrE"
+    "DvYQwXB54gVw+3B30XPGTxTeaTokvMWMjIFNFNgk87iamra1VfXsfKBeHg1UtV0DIN11AF"
+    "x6qz57+iHcwmu+05N6clfsyXQIu82kRXoMfzoFJhRk8JwN2o+sHxEUjmAYp6DeYs+HW5pC"
+    "9nCEvHJoMyIFfOmNF/GN0ZwFcNyQIpzOqnVAPEb3qo2dIYGlwQvCDEC/9C8OP/Qv9uioP+"
+    "AnXboMwtVxFnXxYR+gnqIMi6oGwtHwLUS3w3FzoEtHVaLL+vLo0l8kOFzaeYT/uTw/K0c4"
+    "I1JA2bB00vqvZVv+lK7YALRngAtgwJXHvv/TzmK6d9r/WoT78OT8gIHj+mTosauwCxxQ6E"
+    "FBmzcZbQINGtJv7pBnqFM9Lu9WjZ3uGvPjYgty0JABCU8MzxeZrAvsB4z/KWMW9cw0Zh4b"
+    "4++s2VZZM8un92xjAKMGuDmhp0Felhrg6oHcvg4UrqtdB7KpdK4Dgec52iKKvetA4jXxOh"
+    "A5jrabJqdzf9Fvmtilo3CXYtyh3wXD5LNS7TUSlhJkWjZWA8+uYw2zMk02iZQgSZMpvEJX"
+    "BjoEWboOetgUP1+czIn2GjyRW7p2vLoU5KUWIiFSM6vnQFC6dEkInG42CXc2iUfIH9We+b"
+    "HQilBfgvpvZyf75Yf+a14QFwFe7M2Bu9irhB268qj7BJHAr2ELUoEm2wFB4UDr9zgxq/tf"
+    "RqOz/zXmdDy+6UrEAOvZ44xFJrIwzyZHqN7jCFNbnAnFqhbMiUCzcZY5AWayblK/RhK6Am"
+    "3RjIZgjsfIqmUlE4FmY65wCIOros2rMVa/g6cPzaJK5KEO3nmpZoMuaoYABrKDmPtNXXFR"
+    "5ptDgK+PXNcmFvbqEJCXajYBgiaKIej0s94DArTFCFi+pjHw0MO11HsqsQmow4aoGUiP0Q"
+    "+31hRPBJqNM1Us3VC9NEalDD1kBAhuUSVWPR+xRLTZ8Ge1uyiYdMorgtl7C/EXqcf2RU3x"
+    "aYxAD4EdWT5xvRJ7Wx00LxV+Vvh8jXpI1oEaYEMUBAU8T43aAAnrZhywEfgO3cPKsijPx9"
+    "U6Yu1Z7u5c70bF9xPsWdjRSxZUNXMlohvCm4FhYZmCvllcTTz3B9ZJSeihmqSszGawo8gS"
+    "XUmSiPFmsePfWLZdi5tUYjOYEXkIRMucaYDPy0mw35NwlpkwUwCRDplvXb36xB7r1X7r1Z"
+    "cAv/reTN4myPOxCqk7u1a2tyi3CRz2jylPCqZenSgpHKwvI/ysN5Mb3cOAmYpKmHlHe8CR"
+    "q8jF5ySL3ESib+IPzcn3zJ/1pA9onDv2QzR7ZlAzOD49uhz0Tz/l+HnXHxxBD89aHwqte2"
+    "KBs+QirX+PBx9a8LX17fzsqEhjMm7wrQ33hALiqo57pyIjkxmIW2PU6uT/M47nLbJDl75E"
+    "7x5Ewu8/XmCbDSqZCbnk/lFyuebMB3BXOlI3CWomucBaCzZtTWdLCuMPV1sKfv+42vYD98"
+    "zqk4K/oBI0LMH+FDkPAxf+Mu12TG8ClbvYEQGXcLFFwH/Ryo0qkPej51ILNTjJU3owI6l2"
+    "j/szhTem6zEibvBDinJY6pKQFPVFUlEvGXluMBylHWrqn1HAw2oO6D3sXx723zHFp07B/T"
+    "izvOiT544npF1SXhT17M8qL5qwMbvyou0qL1prrrNxXsyKQ1OVVZwDfF8xb6urODcT4lmO"
+    "4dHXwWyfPfELT87P/o6HFx35POSWr1LFZN2WTOoD17Uxcior5lK5AvIaFVwV9EnLerE/OD"
+    "8/yWF/cFwE9/PpwdHFXocRQQdZofmZrpbYFSg2vEBxt42thnq3jY3dzd9wNyvKUFWpK1Dm"
+    "Z/YgrNg1ICyldBEU7ehzJrhWtVmb46hABuXKQwN5Jp46PlCcB8t19a+iX2GzJ9xzfN+5/y"
+    "/o/vu665W4StXFpPH4hUz2GuPM1OiyvCgy8ktcUIQOq4KUwVAjltnhWGm7xL2Meaau0M8A"
+    "2RYdXTLDn3Jac6LN9lshhyPykFHr8WLMgSh3nx/9X6I3Sx0Cv+zsaPWOLZVockHH1JpI0H"
+    "8LxRxcrim2jVE5ttCds6hs3Zu9yFYt5NsWZTfHu20z5wRqcMwuly3OmVN/bZfPWyhRoC6F"
+    "WstTyMmsbyPaGO912eYsciNrcZCT2SQOaqZ1loH11B6vCP007u+pz2YNnY943nxOetp4K2"
+    "Cfkejx0F2y1chPw9KkS4m2WQLcafalmXCveJ9cpCGnkctpeJnj+WECsGSjnWQGq3fXaTZv"
+    "lzzbmt3zyybPVgFtoc4OTgvCQjfn3Ruv4c0ou2j2b+LZr++lLEUXahk1MYv7UBtVFJM+Zr"
+    "EqplBhlC+MyRe/FEtjsmUzzy6MSULxT8TSoX6sMogeFZc9GT2Pi9lWauSvMmf60S2y2EwC"
+    "tUbHZftsV7+hhAQOsewwzr5zDdYWWN/O1zT0MBxrF3jUefnXNCBCcFyRNifIWZEmwxwWDi"
+    "gyO3nSNcTwZO9LZilyeqam41WU3RzXC9xhiWNBVqwAFdgs0FIz+LohLlmM3cxoa2RetFov"
+    "OMgJNTlhAlEOqO2h/MOBMMUw4cAKJAwhHtKC44fhOwIasSvKmfqay7Mou4TluTaOsrwIPE"
+    "uHSB3zN1+XyCcq9ryytwJUpzHzUg1fmUwny6bRYblLLjaPgtKlf2WDF0A/K5BqFvGcBnPd"
+    "uctdHKNaX25XHCP3VqCJsSDreckd601hvUQlTx1x2+VEdznRhsG+xJzoOpNxj/8Dzp8fiA"
+    "=="
+)
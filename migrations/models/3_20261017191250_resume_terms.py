@@ -0,0 +1,74 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `resume_terms` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `field` VARCHAR(16) NOT NULL COMMENT '来源字段',
+    `term` VARCHAR(8) NOT NULL COMMENT '词',
+    `weight` INT NOT NULL COMMENT '排序权重',
+    `resume_id` INT NOT NULL COMMENT '关联简历',
+    CONSTRAINT `fk_resume_t_resumes_4b456ca2` FOREIGN KEY (`resume_id`) REFERENCES `resumes` (`id`) ON DELETE CASCADE,
+    KEY `idx_resume_term_term_e50800` (`term`, `field`)
+) CHARACTER SET utf8mb4 COMMENT='倒排索引：一行 = 某份简历的某个字段里出现过某个词（中文按双字切分）';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `resume_terms`;"""
+
+
+MODELS_STATE = (
+    "eJztXFtv2zYU/iuGX9oB3SZLpi4D9mCn6Zq1SYrEu2BNIVASZauRJVeXpMHW/z4e6i5Lju"
+    "Tajuz4JbFJHpn6Dnnu5L/9uWsQ2/9pRDxLn/V/6f3bd/Cc0A+lnle9Pl4ssnZoCLBms6E4"
+    "G6P5gYf1gLaa2PYJbTKIr3vWIrBch7Y6oW1Do6vTgZYzzZpCx/oSEjVwpySYEY92fPxEmy"
+    "3HIF+Jn3xd3KqmRWyjMFXLgN9m7WrwsGBtZ07whg2EX9NU3bXDuZMNXjwEM9dJR1tOAK1T"
+    "4hAPBwQeH3ghTB9mF79n8kbRTLMh0RRzNAYxcWgHudfV1Kytr6oXlxP1+nSiqv0WAOmuA+"
+    "DSqfrs7acwhR/5wVAayoI4lOkQNs20RfoW/XQGTETI4LmY9L+xfhzgaATDOAP1jng+TGkJ"
+    "2ZMZ9qqhzZGU8KUTL+OboLkK4KQhQzhbVbuAeI6/qjZxpgFsDR6hFYD+Obo6eTu6eklH/Q"
+    "A/6dJtEO2Oi7iLj/oA9Qxl2FQtEI6HHyC6A45rgC4dVYsu6yuiS38xINHWLiL8+/XlRTXC"
+    "OZISyoalB73/erblL8mKPUB7BbgABjx57vtf7DymL89Hf5fhPnl/OWbguH4w9dhT2APGFH"
+    "oQ0OZtTppAg4b123vsGepSj8u7dWOXu+b8vNyCHTxlQMIbw/vFKuuK+CHj/5Iyi3tWKjOP"
+    "jfGP2uygtJnl0znbBMBoAW6B6HGQNyUGuHYg929ChRO0m1A2lcFNiHieoy2iOLwJJV4Tb0"
+    "KR42i7aXI69yv9pokCHUUEivGAfkeGyeep+jtkWMYg07KJGnp2G22Yp+mySqQMkjSZwosE"
+    "GdiBZOkmHBJT/OPqfUO0d2CJ3NG947VlQZFqLSbEYmb7PECKQLcE4nSzS7izRTzD/qz1yk"
+    "+ItoT6BsR/P7/Yr9+OfuSRuA7w4rAB7uKwFnboKqLuBzgI/Ra6ICPosh5ACgdSf8iJedn/"
+    "NBKd/W+xppPxXRciBmjPIWess5BREycH1fs4aMnFWVCsWsGcEnQbZ5lDsJJ1k9o1EhIQbd"
+    "GMjmBO5thqpSVTgm5jrnCYgKmiNZUY2/fg6UuzqFLw0AbvIlW3QRc1A4GCHGBmflNTXJT5"
+    "7jDA12euawcW8dowoEjVbQYgTRQj0OlnfQgM0NZjwOYljUGmHmkl3jOKfUAdHKJuID3Hn9"
+    "1WSzwl6DbOVLAIkXjpjEiZetgIMUxRDax2NmIFabfhz0t3EZl0ySvIHP4M8RdpyPyirtg0"
+    "RqhHwM4sP3C9Cn1bHzSvJP6u8PkO5ZCsA2uAGyJCClieGtUBEtHNJGCD+AH1YWVZlJvxah"
+    "ex9jzv7l3vViVfF8SziKNXbKh6zlWQ7gnfDAIby0T6fvFq4bmfiR5UhB7qmZSn2Q/uKLJE"
+    "d5IkErJf3PFvLdtuxZuMYj84I/IQiJY50wCbl5PA35NInjNRpgAiHTLf+/jiA3utF696L/"
+    "4MyYtP3eTbAns+USF1Z7fK9pbp9oGHozPKJ4VQq06UFA72lxF91rvJG90jgJmKKzjzmvaA"
+    "IVeTiy9QlnkTk/6UfOhOvqd51pO+oHHp2A/x6lnBmsnZ+en1ZHT+ocCf16PJKfTwrPWh1P"
+    "pSLPEsfUjvr7PJ2x587f1zeXFaZmM6bvJPH+aEw8BVHfdexUYuM5C0Jqi1yf/nDM87bEcm"
+    "fYXcHcfEb95dEZsNqlgJheT+afq47qwHMFcGkpAGNdNcYKsNm7VmqyWD8bOrbQS/313teQ"
+    "EXEG++EeQm9EGHD913Fu6UTC01wNMK8M+x8zBx4S9TDGd0ErjaO4k5cA0PWwf8Jy16qQP5"
+    "Vfxeaql8KX1LD5YkVYxJf65myXQ9xohb8pChHFUJpUyK+2KquDeYeW44nWUdambaUsCjQh"
+    "joPRldn4xeM52hLsH9bWVl1gfPnS+CfkVlVtzzalVl1oKNOVZmHVZl1k7TxJ0zALcc1ast"
+    "gJ2QrzXrtr4Adj8hXmVTn/49We3upCb1+8uL35LhZR+oCLnlq1QwWXcVi3rsujbBTm2xYU"
+    "ZXQl6jhNuCPm3ZLfbjy8v3BezHZ2Vw/zgfn169HDBG0EFWpH6WC02OtZ0dr+08RgDqoT5G"
+    "ABJz8xkGAkQZClJ1BSokzSFEZAUDInqKgKHeSW+YG9yWs9bglEUO5drzFkVOPHbyorwONm"
+    "vqf4x/ha2eyOf4dDT/n9D893XXqzCV6utwk/Frqewdhuip0mUpZWwUtzhS0IAVkMqgqDFL"
+    "inHsVIDEPY16pqbQlxDbFh1dscIfM1oLpN22WyH9JfKQjBzyYsIDURa+P3GyQWuWGgR+1b"
+    "Hbeo8to+hyLczSnkjR/xnqYLhCU6Ib40p2JDSsx9u1sxfrqrVs2zLt/li3fWacQPmSKXD5"
+    "uqaG8uuwbN5SdQc1KdRWlkKBZneOaGes102rs9iMbMWDAs0+8aBlWmcTWC/5eGXol3F/Q2"
+    "02a+q8I03zOdlB7YOAfUWix8P3qatRXIaVSZcKabMBuLPsSzfh3rKfXGZDQSJXs+FpbjaI"
+    "EoAVjnaaGaz3rrNs3jF5djDe89Mmz7YBbalEEQ5awkY3m/rGO7hU5hjNfiaW/e7usymbUJ"
+    "uoiVnfhtqropjsNctVMaUKo2JhTLH4pVwaky+b+e7CmDQU/0gsHUrvaoPocV3eo9HzpA5w"
+    "q0r+Y+46BHyHLbaSQKzRcfk+29VvKUNCJ7DsKM5+NA12Flg/zBsuhgRuBEA8Hjz9DRc4CE"
+    "hSkdYQ5DxJl2GOCgcUmR3aEQwxOhT9lFmKgpxpaXiVaffH9AJzWOJYkJUowApiltjSMvi6"
+    "JyZZgt3KaGusXrRWd0MUiLqcMIEoB9T2UP7DWTrFMOGsDyQMIR7Sg5Ob0fUKnfCKCqq+5f"
+    "Ys025ge+6MR3m+IJ6lQ6SB+cz3JfYDlXhe1YUK9WnMIlXHdyaTybJpDFjukkvUI1IE+lc2"
+    "eATyWYFUs0gaKsxd5y6PcYx6eXlYcYzChUoLY02uFymPXO8K1ytE8tIht2NO9JgT7RjsG8"
+    "yJPk0yLnfqszZql5wJfTRsl55CfTRuB7BzA7ilTFDgnhqDhwp/c4DgFABcMxTZI7I81Hu/"
+    "9sBUgVQpXDRUvIU4SqomvTyGq3CQBIaMRh+lDHS4AmJg0nZJ0Jixo0vF8ZB4ZUcPZNZiJJ"
+    "e9UreFuarsCeyZiOekpM6RjlfKK+RQ3qlJ5DSIl0S0wNsFRcfW9LnERRWeFwSJ5wRRRkNJ"
+    "QjKXyuXlrlUCenz2G8joguZ9PHpqJhg3DSukBF0+NMc8F5FuBZHAzSHZ5lgrjCA2iSKUjZ"
+    "5cEEEsxxAKW6MB5sn4jkPeohSuALDcAF+5Fl65jO49NTdmFVZ/rUTJCHZn/Q3aL2imMhCR"
+    "IegiDQUm54+lh52z945m9tHMbm5mf/sfopAboA=="
+)
@@ -0,0 +1,73 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resumes` ADD `university_canonical` VARCHAR(100) COMMENT '标准化学校名';
+        ALTER TABLE `resumes` ADD `school_tier` VARCHAR(10) COMMENT '学校层次（标准化）';
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_univers_75c0c2` (`university_canonical`);
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_school__69516f` (`school_tier`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_school__69516f`;
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_univers_75c0c2`;
+        ALTER TABLE `resumes` DROP COLUMN `university_canonical`;
+        ALTER TABLE `resumes` DROP COLUMN `school_tier`;"""
+
+
+MODELS_STATE = (
+    "eJztXNty2zYQ/RWNXpLOpC1FCrx0pg+S4zRuYjtjq5dpnOGAJCgxpkiFFzueNv9eLHinSJ"
+    "lUJJmS9ZLYAJYmzwF2F7sL/Nufuwax/Z9GxLP0Wf+X3r99B88J/aHU86rXx4tF1g4NAdZs"
+    "NhRnYzQ/8LAe0FYT2z6hTQbxdc9aBJbr0FYntG1odHU60HKmWVPoWF9CogbulAQz4tGOj5"
+    "9os+UY5Cvxk18Xt6ppEdsovKplwN9m7WrwsGBtZ07whg2Ev6apumuHcycbvHgIZq6Tjrac"
+    "AFqnxCEeDgg8PvBCeH14u/g7ky+K3jQbEr1iTsYgJg7tIPe5mpq19VX14nKiXp9OVLXfAi"
+    "DddQBc+qo++/opvMKP/GAoDWVBHMp0CHvNtEX6Fv3pDJhIkMFzMel/Y/04wNEIhnEG6h3x"
+    "fHilJWRPZtirhjYnUsKXvngZ3wTNVQAnDRnC2azaBcRz/FW1iTMNYGnwCK0A9M/R1cnb0d"
+    "VLOuoH+JMuXQbR6riIu/ioD1DPUIZF1QLhePgBojvguAbo0lG16LK+Irr0LwYkWtpFhH+/"
+    "vryoRjgnUkLZsPSg91/PtvwlXbEHaK8AF8CAJ899/4udx/Tl+ejvMtwn7y/HDBzXD6Yeew"
+    "p7wJhCDwravM1pE2jQsH57jz1DXepxebdu7HLXnJ+XW7CDpwxI+GL4vthkXRE/ZPwvGbO4"
+    "Z6Ux89gY/2jNDsqaWT59Z5sAGC3ALQg9DvKm1ADXDuT+TahwgnYTyqYyuAkRz3O0RRSHN6"
+    "HEa+JNKHIcbTdNTud+pb9pokBHEYFiPKC/I8Pk81L9HRKWEWRaNlFDz25jDfMyXTaJlCBJ"
+    "kym8SJCBDiRLN+GQmOIfV+8bor0DT+SOrh2vLQVFqbVIiNXM9jlAikCXBOJ0s0u4s0k8w/"
+    "6s9cxPhLaE+gbUfz8/2a/fjn7kkbgO8OKwAe7isBZ26Cqi7gc4CP0WtiAT6LIdQAoHWn/I"
+    "iXnd/zQanf3fYk4n47uuRAywnkPOWGcioyabHFS/x0FLW5wFxaoVzKlAt3GWOQQzWTepXy"
+    "MhAdEWzegI5mSOrVZWMhXoNuYKhwm4KlpTjbH9HTz9aBZVCh7a4F2U6jboomYgMJADzNxv"
+    "6oqLMt8dAnx95rp2YBGvDQFFqW4TgDRRjECnP+tDIEBbj4DNa5psIqs6dlzH0nErxVMn32"
+    "2XUeaoy4gGugg7poFYomhN07vF1aHWL49TJ5wzas7oq2FHJzVLRd3yWtkMM9VLhYUW5Cre"
+    "aLuyHleNqFrBVJkog0w90spPyiT2QX1BZKEbKmuOP7utbEUq0G2cqYUWIjvdGe0z9bARYn"
+    "hFqj7abbYqRLsNf95NEpFJp7yCzOHPEMiUhizA0JXNgRHqEbAzyw9cr8Jxrc8+VQp/Vx5q"
+    "h3pI1oEaYENESIEtnEYthER0M4l8In5ALYQsi3IzrnaRtMpzd+96tyr5uiCeRWJb3ZS5Ct"
+    "E94c0gsLBMpO8XVwvP/Uz0oCKGV09SXmY/2FFkia4kSSRkv9jxby3bbsVNJrEfzIg8ZHRk"
+    "zjQSz1fSJJJnJkq5QchQ5nsfX3xgn/XiVe/FnyF58ambvC2w5xMVcuB2q7KJstw+cDg6oz"
+    "wphHp1oqRwsL6M6Ge9m9zoHgHMVFzBzGvaA45cTVFLQbLMTSz6U/LDttIZ2ywfoB9oXDr2"
+    "Qzx7VlAzOTs/vZ6Mzj8U+Hk9mpxCD89aH0qtL8USZ+lDen+dTd724NfeP5cXp2Ua03GTf/"
+    "rwTjgMXNVx71Vs5HblSWuCWptCmpzjeYftyKWv0LvjWPjNuytis0EVM6FQJXOaPq478wHc"
+    "lYEkpNmBNKneasFmrdlsyWD87Gobwe93V3tewAXEm28EuQl90OFD950VcCVXSw3wtAL8c+"
+    "w8TFz4dykIWc3ANTxsHfCftHqsDuRX8XeppTrA9Cs9mJLUMCb9ueI/0/UYEbfkIUM5KrdL"
+    "SYr7Yqm4N5h5bjidZR1q5tpSwKOKMug9GV2fjF4zm6Euwf1tZYnjB8+dL4J+RYlj3PNqVY"
+    "njgo05ljgeVonjTustOucAbjmqV1tJPiFfa+ZtfSX5fkK8yqc+/XuyeruTutTvLy9+S4aX"
+    "90BFyC1fpYrJuquY1GPXtQl2aqt2M7kS8hoV3Bb0actusR9fXr4vYD8+K4P7x/n49OrlgB"
+    "FBB1mR+Vmu2DoWSXe8SPoYAaiH+hgBSNzNZxgIEGWo7NYVKDU2hxCRFQyI6CkChsJBvWFu"
+    "cFubtQbHlXIo1x5cKjLx2BGm8jzYrKv/Mf4rbPZEe45PR/f/Cd1/X3e9ClepvqA9Gb+Wyd"
+    "5hiJ4aXZZSxkZxiSMFReVgMhhqzJJiHDteI3FPY56pK/QlxLZFR1fM8Mec1oJot/1WSH+J"
+    "PCQjh7yYcCDKwvcnTjbozVKHwK86v16/Y8skulwLs7QmUvR/hjoYrtCU2Mb4SAgSGha27n"
+    "qzF9uqtXzbsuz+eLd95pxA+ZIpcPm6pob667B83lJ1B3Up1FaeQkFmdxvRznivmzZnsRvZ"
+    "ioOCzD5x0DKtswmsl/Z4ZeiXcX9DfTZr6rwjTfM52Y0HBwH7ikSPh+/TrUZxGlYmXSq0zQ"
+    "bgzrIv3YR7y/vkMg0FjVxNw9NcERIlACs22mlmsH53nWXzjsmzg9k9P23ybBvQlkoU4dgU"
+    "LHSz6d54B7czHaPZz8Sz393FUGUXahM1Mev7UHtVFJN9ZrkqplRhVCyMKRa/lEtj8mUz31"
+    "0Yk4biH4mlQ+ldbRA9rst7NHqe1AFu1ch/zN0rgu+wxWYSqDU6Lt9nu/otJSR0AsuO4uxH"
+    "12BngfXDvCpmSOBqDcTjwdNfFYODgCQVaQ1Bzot0GeaocECR2aEdwRCTI9NPl6Uo6JmWjl"
+    "dZdn9cL3CHJY4FWYkCVBCzREvL4OueuGQJdiujrbF50VpdslIQ6nLCBKIcUNtD+YezdIph"
+    "wlkfSBhCPKQHJzejuxc6sSsqmPqWy7Msu4HluTOO8rwgnqVDpIH5zNcl9gOVeF7VhQr1ac"
+    "yiVMdXJtPJsmkMWO6SS8wjUgT6r2zwCPSzAqlmkTQ0mLvOXR7jGPX68rDiGIWrmRbGmqwX"
+    "JY+sd4X1CpW8dMjtmBM95kQ7BvsGc6JPk4zLnfqsjdolZ0IfDdulp1AfjdsB7NwA7jATFL"
+    "inxuChwt8cIDgFANcMRf6ILA/13q89cFUgVQoXDRWv846Sqkkvj+EqHCSBI6PRRykDHa6A"
+    "GJi0XRI05uzoUnE8JF6TS9Roi5Hcmky3LWyryp7Anol4TkrqHKsuVzuUb2oSOQ3iKRFN8H"
+    "ZB0bE1fS5xUYXnBUHiOUGU0VCSkMylenm5a5WCHp/9Bjq6YHkfj56aCcZNwwqpQJcPzbGd"
+    "i0iXgkjg5pBscawVRhCbRBHKTk8uiCCWYwiFpdEA82R8xyFvUQpXAFhugK9cC69cRveeuh"
+    "uzCq+/VqNkArvz/gbtJzQzGYjIEHSRhgLT88fSw875e0c3++hmN3ezv/0PjkgnfQ=="
+)
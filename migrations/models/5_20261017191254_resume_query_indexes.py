@@ -0,0 +1,84 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resume_terms` DROP INDEX `idx_resume_term_term_e50800`;
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_is_dele_ccb121` (`is_deleted`, `status`, `created_at`);
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_phone_717dfd` (`phone`, `is_deleted`);
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_is_dele_c29bc6` (`is_deleted`, `created_at`);
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_name_7e5f9d` (`name`, `is_deleted`);
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_email_71631f` (`email`, `is_deleted`);
+        ALTER TABLE `resumes` ADD INDEX `idx_resumes_file_ur_e73497` (`file_url`);
+        ALTER TABLE `prompts` ADD INDEX `idx_prompts_is_acti_bd912c` (`is_active`, `is_deleted`);
+        ALTER TABLE `resume_terms` ADD INDEX `idx_resume_term_term_7c85c6` (`term`, `field`, `resume_id`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resume_terms` DROP INDEX `idx_resume_term_term_7c85c6`;
+        ALTER TABLE `prompts` DROP INDEX `idx_prompts_is_acti_bd912c`;
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_file_ur_e73497`;
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_email_71631f`;
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_name_7e5f9d`;
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_is_dele_c29bc6`;
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_phone_717dfd`;
+        ALTER TABLE `resumes` DROP INDEX `idx_resumes_is_dele_ccb121`;
+        ALTER TABLE `resume_terms` ADD INDEX `idx_resume_term_term_e50800` (`term`, `field`);"""
+
+
+MODELS_STATE = (
+    "eJztXFtz27YS/isavSSdSVuKFHg5M32QHadxG9sZW71M4wwHJEGJMUUqvNjxtPnvBwveKV"
+    "ImFYmiHL14bABLk98H7C52F/h3uHANYvs/TYhn6fPh/wb/Dh28IPSXUs+rwRAvl1k7NARY"
+    "s9lQnI3R/MDDekBbTWz7hDYZxNc9axlYrkNbndC2odHV6UDLmWVNoWN9DokauDMSzIlHOz"
+    "58pM2WY5AvxE/+XN6ppkVso/CqlgH/m7WrweOStZ07wRs2EP6bpuquHS6cbPDyMZi7Tjra"
+    "cgJonRGHeDgg8PjAC+H14e3i70y+KHrTbEj0ijkZg5g4tIPc52pq1jZU1curqXpzNlXVYQ"
+    "uAdNcBcOmr+uzrZ/AKP/KjsTSWBXEs0yHsNdMW6Wv0rzNgIkEGz+V0+JX14wBHIxjGGaj3"
+    "xPPhlVaQPZ1jrxranEgJX/riZXwTNNcBnDRkCGezqguIF/iLahNnFsDS4BFaA+ifk+vTt5"
+    "Prl3TUD/AvXboMotVxGXfxUR+gnqEMi6oFwvHwZ4juiOMaoEtH1aLL+oro0v8YkGhpFxH+"
+    "7ebqshrhnEgJZcPSg8F/A9vyV3TFAaC9BlwAA5688P3Pdh7TlxeTv8twn767OmHguH4w89"
+    "hT2ANOKPSgoM27nDaBBg3rdw/YM9SVHpd368audi34RbkFO3jGgIQvhu+LTdY18UPG/4ox"
+    "i3vWGjOPjfF3bs0+DC2f0mwTmELAl0dgNqk4GNKR5V4/wEHoV41jnwiPzsazdrLAll3Vsa"
+    "STekXiaFu7tK1FbpuCWxB6GuRtKSWuHcjD21DhBO02lE1ldBsinudoiyiOb0OJ18TbUOQ4"
+    "2m6anM79Qv/SRIGOIgLFeET/RobJ56WGHRKWEWRaNlFDz25jm/MyuzLQW1gElB9Jkym6SJ"
+    "CBDSRLt+GYmOIf1+8agt2BW3RPl47XloGi1EYcxADv2GpTDpAi0BWBON3sE+5sDs+xP289"
+    "8ROhHaG+nYmfTfabt5MfeSRuArw4boC7OK6FHbqKqGfGvaEpyAT6bAaQwoHSH3NiXvXvR6"
+    "EnXlLTOZ2M77sSMcB4jjljk4mMmuy4UP2GC63st1LXsinMqUC/cZY5BDNZN6lbIyEB0RbN"
+    "6AnmqZ/fFPNUoN+YKxwm4KpoTTXG7sMJ9KNZiCt4bIN3UarfoIuagcBAjjDzvqknLsp8fw"
+    "jw9bnr2oFFvDYEFKX6TQDSRDECnf6uj4EAbTMCtq9psoms6thxHUvHrRRPnXy/XUaZoy4j"
+    "Guki7JhGYomiDU3vDleHWr88zpxwwag5p6+GHZ3ULBV1x2tlO8xULxUWWZCreKPtymZcNa"
+    "JqDVNlogwy80grPymTOAT1BZGFfqisBf7ktrIVqUC/caYWWojsdG+0z8zDRojhFan6aLfZ"
+    "qhDtN/x5N0lEJp3yCjLHP0McUxqzAENfNgdGqEfAzi0/cL0Kx7U+FVYp/E1JsQ71kKwDNc"
+    "CGiJACWziNWgiJ6GYS+UT8iFoIWRblZlx1kUHLc/fgencq+bIknkViW92UuQrRA+HNILCw"
+    "TKQfFldLz/1E9KAihldPUl7mMNhRZImuJEkk5LDY8e8s227FTSZxGMyIPGR0ZM40Es9X0i"
+    "SSZybKuEHIUOYHH168Z5/14tXgxZ8hefGxn7wtsecTFRLydqsajrLcIXA4Oac8KYR6daKk"
+    "cLC+jOh3vZ/c5MoQVph5TXvAkaupsClIlrmJRX9KftlVOmOX1QP0A40rx36MZ88aaqbnF2"
+    "c308nF+wI/ryfTM+jhWetjqfWlWOIsfcjgr/Pp2wH8Ofjn6vKsTGM6bvrPEN4Jh4GrOu6D"
+    "io3crjxpTVBrU9WTczzvsR259BV69yQWfvP7NbHZoIqZUCjZOUsf15/5AO7KSBLS7ECaVG"
+    "+1YLPWbLZkMH5yta3g95urfV/ABcRbbAW5KX3Q84fuG8vxSq6WGuBZBfgX2HmcuvBzJQhZ"
+    "zcANPGwT8PdaPFYH8qv4u9RSUWL6lR5MSWoYk/5cJaLpeoyIO/KYoRxV26UkxX2xVNwbzD"
+    "03nM2zDjVzbSngUUEZ9J5Obk4nr5nNUFfg/rq23vK95y6WwbCi3jLuebWu3nLJxnRUb0kf"
+    "bt0fix/3WvzYaSlG73zDHQf8aivep+RLzbytr3g/TIjXudtnf0/X74RSb/vd1eWvyfDy9q"
+    "gIeUGtlNwN17UJdmrreTO5EvIaFdwV9GlLt9ifXF29K2B/cl4G94+Lk7PrlyNGBB1kRZZp"
+    "tZjrWD7d8/LpY3CgHupjcCDxRL/DGIEoQ9G3rkAVsjmGYK1gQLBPETDUFOoN04a72sc1OF"
+    "aVQ7n2gFWRiaeOWpXnwXZ3AR/i/8JmT7Qd+Xg8V7xH99/XXa/CVaqvdU/Gb2SyO4zeU6PL"
+    "ss3YKC5xpKCoUkwGQ41ZvoxjJ28kbj/mmbpCn0NsW3R0xQx/ymktiPbbb4XMmMhDnnLMiw"
+    "kHoix8e05li94sdQj8qnP29Tu2TKLPZTIrayJF/2cokeEKTYltjE+LIKFhzWvXm73YVm3k"
+    "25ZlD8e7HTLnBCqbTIHLlzw11F/Py+ctFX5Ql0Jt5SkUZLrbiPbGe922OYvdyFYcFGQOiY"
+    "OWGZ9tYL2yxytDv4r7G+qzWTPnd9I01ZPdzPAsYF+TA/LwQ7rVKE7DynxMhbbZAtxZYqaf"
+    "cO94n1ymoaCRq2nYz1UmUW6wYqOdJg3rd9dZou94K9ez2T3vN3m2C2hL1YtwogoWutl0b9"
+    "zBLVLHaPZ34tl3d4FV2YXaRrnM5j7UQdXLZJ9ZLpgpFR8Va2aKdTHlqpl8Rc0318ykofgn"
+    "YulQlVcbRI9L9p6MniclgjsunsmuHMH32GIzKb2CLOuzXf2OEhI6gWUf62o6Dqw/z1tkxg"
+    "Ru3UA8Hu3/FhkcBCQpVmsIcl6kzzBHhQOKzM7zCIaYnKbeX5aioGdaOl5l2cNxvcAdljgW"
+    "ZCUKUEHMEi0tg68H4pIl2K2NtsbmRWt1/0pBqM8JE4hyQG0P5R+O2SmGCceAIGEI8ZABHO"
+    "qMrmXoxa6oYOpbLs+y7BaWZ2cc5XlBPEuHSCPzO1+X2A9U4nlVdy3UpzGLUj1fmUwny6Yx"
+    "YrlLLjGPSBHoT9ngEehnBVLNImloMLvOXR7jGPX68nnFMQq3Ni2NDVkvSh5Z7wvrFSp55f"
+    "zbMSd6zIn2DPYt5kT3k4zLHQitjdolx0WfDNulB1SfjNsB7NwIrjcTFLjCxuChwt8cITgF"
+    "ADcQRf6ILI/1wS8DcFUgVQp3EBVv+o6Sqkkvj+GWHCSBI6PRRykjHW6HGJm0XRI05uzoUn"
+    "E8JF6T+9Voi5FcqEy3LWyryp7Anol4TkrqHKvuXXsu39QkchrEU8JMlG42wdtFSE+s2fcS"
+    "JFV4XhAknhNEGY0lCclcqqRXu9Zp65PzX0FhF8zw06HUlKqmMYZUoM8n6Ng2RqTrQiRww0"
+    "i2UjaKKYhNQgplDygXURDLAYXCOmmAeTK+55C3qIsrACw3wFeuhVcuo/tAfY95xRagVqNk"
+    "At25gqP2E5rZD0RkiMBIY4Ep/WMdYu+cv6PPffS5m/vcX/8P6VdjKQ=="
+)
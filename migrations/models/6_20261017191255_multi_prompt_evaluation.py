@@ -0,0 +1,74 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `prompts` ADD `is_open` BOOL NOT NULL COMMENT '是否参与多岗位评估' DEFAULT 0;
+        ALTER TABLE `resume_evaluations` ADD `criteria_hash` VARCHAR(64) COMMENT '评估时的提示词哈希';
+        ALTER TABLE `resume_evaluations` ADD INDEX `idx_resume_eval_prompt__1f3dde` (`prompt_id`, `score`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resume_evaluations` DROP INDEX `idx_resume_eval_prompt__1f3dde`;
+        ALTER TABLE `prompts` DROP COLUMN `is_open`;
+        ALTER TABLE `resume_evaluations` DROP COLUMN `criteria_hash`;"""
+
+
+MODELS_STATE = (
+    "eJztXFtz27YS/isavSSdSVuKJHg5M32QHadxG9sZW71M4wwHJEGJMUUqvNjxtPnvBwveKV"
+    "ImZUmmbL14bABLk98H7C52F/h3OPdM4gQ/jYlvG7Ph/wb/Dl08J/SXSs+bwRAvFnk7NIRY"
+    "d9hQnI/Rg9DHRkhbLewEhDaZJDB8exHanktb3chxoNEz6EDbneZNkWt/jYgWelMSzohPOz"
+    "59ps22a5JvJEj/XNxolk0cs/Sqtgn/m7Vr4f2CtZ264Ts2EP6brhmeE83dfPDiPpx5bjba"
+    "dkNonRKX+Dgk8PjQj+D14e2S70y/KH7TfEj8igUZk1g4csLC5+pa3jbUtPOLiXZ1MtG0YQ"
+    "eADM8FcOmrBuzrp/AKP/IjURYVQRIVOoS9ZtYif4//dQ5MLMjgOZ8Mv7N+HOJ4BMM4B/WW"
+    "+AG80hKyxzPs10NbEKngS1+8im+K5iqA04Yc4XxW7QLiOf6mOcSdhrA0eIRWAPrn+PL4/f"
+    "jyNR31A/xLjy6DeHWcJ1183Aeo5yjDouqAcDL8GaI74rgW6NJRjeiyvjK69D+GJF7aZYR/"
+    "u7o4r0e4IFJB2bSNcPDfwLGDJV2xB2ivABfAgCfPg+CrU8T09dn47yrcxx8ujhg4XhBOff"
+    "YU9oAjCj0oaOumoE2gQcfGzR32TW2px+O9prHLXXN+Xm3BLp4yIOGL4fsSk3VJgojxv2TM"
+    "kp6VxsxnY4KtW7NPQzugNDsEphDw5ROYTRoOh3RktTcIcRgFdePYJ8Kj8/Gsncyx7dR1LO"
+    "ikXpI42NZd2tYyt23BLQk9DPKmlBLXDeThdaRygn4dKZY6uo4Qz3O0RZLE60jmdek6kjiO"
+    "tlsWZ3C/0L90SaCjiEAxHtG/kWnxRanhDgnLCbJsh2iR73SxzUWZbRnoDSwCyo+sKxRdJC"
+    "jABlLk60gklvTH5YeWYO/ALbqlS8fvykBZai0OEoC3bLUpB0gV6IpAnGH1CXc2h2c4mHWe"
+    "+KnQllDfzMTPJ/vV+/GPPJLWAV4SW+AuiY2wQ1cZ9dy4tzQFuUCfzQBSOVD6IicVVf/TKP"
+    "TUS2o7p9PxfVciJhhPkTPXmciozY4LNW+40NJ+K3Mt28KcCfQbZ4VDMJMNi7o1MhIQbdHN"
+    "nmCe+fltMc8E+o25ymECroreVmNsP5xAP5qFuML7LniXpfoNuqSbCAzkCDPvm3riksL3h4"
+    "DAmHmeE9rE70JAWarfBCBdkmLQ6e+GCATo6xGweU2TT2TNwK7n2gbupHia5PvtMiocdRnR"
+    "yJBgxzSSKhStaXq3uDq05uVx4kZzRs0pfTXsGqRhqWhbXiubYaZ+qbDIglLHG21X1+OqFV"
+    "UrmKoSZZKpTzr5SbnEPqgviCz0Q2XN8Revk63IBPqNM7XQQmyne6N9pj42IwyvSNVHt81W"
+    "jWi/4S+6SRKy6JRXkSX+DHFMWWQBhr5sDszIiIGd2UHo+TWOa3MqrFb4UUmxHeohxQBqgA"
+    "0JIRW2cDq1EDIxrDTyifgRtRCKIintuNpFBq3I3Z3n32jk24L4NklsdVvmakT3hDeTwMKy"
+    "kLFfXC187wsxwpoYXjNJRZn9YEdVZLqSZImQ/WInuLEdpxM3ucR+MCPxkNFROMtMPV9Zl0"
+    "mRmTjjBiFDhR98evWRfdarN4NXf0bk1ed+8rbAfkA0SMg7nWo4qnL7wOH4lPKkEurVSbLK"
+    "wfoy49+NfnJTKENYYuYt7QFHrqHCpiRZ5SYR/Sn9ZVvpjG1WD9APNC9c5z6ZPSuomZyenV"
+    "xNxmcfS/y8HU9OoIdnrfeV1tdShbPsIYO/TifvB/Dn4J+L85Mqjdm4yT9DeCcchZ7menca"
+    "Ngu78rQ1Ra1LVU/B8bzFTuzS1+jdo0T43e+XxGGDamZCqWTnJHtcf+YDuCsjWciyA1lSvd"
+    "OCzVvz2ZLD+MXTN4Lfb57+soALiT/fCHIT+qDnD90jy/EqrpYW4mkN+GfYvZ948HMpCFnP"
+    "wBU8bB3wn7R4rAnkN8l3aZWixOwrfZiS1DCm/YVKRMvzGRE35D5HOa62y0hK+hKppDec+V"
+    "40neUdWu7aUsDjgjLoPR5fHY/fMpuhLcH9fWW95Uffmy/CYU29ZdLzZlW95YKN2VG9JX24"
+    "fXsofnzS4sedlmL0zjfccsCvseJ9Qr41zNvmivf9hHiVu33y92T1Tijztj9cnP+aDq9uj8"
+    "qQl9RKxd3wPIdgt7GeN5erIK9TwW1Bn7XsFvuji4sPJeyPTqvg/nF2dHL5esSIoIPs2DIt"
+    "F3NR5LwFqTma9BDeqVS/0YZ4jsRDdE3kWTbN4CGnwEE8R4WUAzJUKGO0RBMKkQzIOFgC9+"
+    "g4wWYZOhS497nA/RC+aYb6EL5J9wovMIojKWJZwUqCCeFYVcBM2bZM7G5rp93i4FsB5cYj"
+    "cGUmHjoMV50Hm92nfUr+C5s98Ybx89LeLe5INrWB4fnksG3b7bYtBr09rtn4tQz5DrMu1B"
+    "SzKgFslhc+UlFc4aeA+cYsz8mxE1NyS19r00abOkhfI+zYdHTNDH/I+S2J7pcHLMYVfcLj"
+    "c2Eb9HGpmxDU3Y/QvNPOJfpc3rS0JjL0f2bbkFJTajGTUz5IaFmrvOtNOv3AkPg27ny4bU"
+    "mwz9QVt4NpZVrMT9WLAQ4Npti4lotq24fgEh9jrT1JVXZ/diW1lEExYUtSntdepVJSlXt8"
+    "LX2OkszuAgi92XVs2uFI3P9OHJRk9omDjrnUTWC9tDevQr+M+zvqVdtT93fSNoma33nyLG"
+    "BfkV318V22GSxPw9pMZ4222QDcecqzn3BvOb5RpaGkketpeJpLguKse02AJEvHN0dF8hT6"
+    "4b67ZxPfeNq09DagrdQFw1lFWOhW2+jFDu5nO2QhXohn3yELsbFatGL91OMK0db3ofaqEi"
+    "3/zGopWqWsr1yNVq44q9ajFWvVHl2NlqVQHsiBQL1rY/IjKYZ9MOuRFt9uuSwtv8wH32Kb"
+    "zaTscr+8z/GMG0pI5Ia2c0h97Dj18TzvZxIJ3GeDeDx6+vuZcBiStAy0JchFkT7DHBd8qA"
+    "o7KSeYUnpPwdPlkUp6pqPjVZXdH9cL3GGZY0FWogIVxKrQ0jH4uicuWYrdymhrYl70Tjcb"
+    "lYT6nReRBKjJovzDAVbVtOCAHU6yIwM4Lh1feNKLXVHJ1HdcnlXZDSzPnXFU5AXxLB0ij6"
+    "wXvi5xEGrE9+tuMWlONJeler4ymU5WLHPEsstcah6RKtCfiskj0M8qFANI5PFFrlvKLh/i"
+    "GC8jjlG6D21hrsl6WfLAel9Yr1HJSydLDznRQ060Z7BvMCf6NMm4wlHrxqhdehD7wbBddv"
+    "T7wbgdwM6N4OJAQYXLoUweTmZYIwSnN+CgTeyPKIpoDH4ZgKsCqVK43at8h35SYpX08nBC"
+    "R0cyODI6fZQ6MuDelZFF22VBZ86OIZfHxyVZ8c2FtMVMryqn2xa2VWVPYM9EPCenlah1Nx"
+    "o+l29qEzkNkylhpUo3n+DdIqRH9vSlBElVnhcEmecESUGiLCOFy5T0ctcqbX10+iso7JIZ"
+    "fjiUmlHVNsaQCfT5bCrbxkh0XUgE7u7JV8paMQWpTUih6gEVIgpSNaBQWictME/H9xzyDn"
+    "VxJYCVFvgqjfAqVXTvqO8xq9kCNGqUXGB3ruCo+4Rm9gMRBSIwsigwpX+oQ+yd83fwuQ8+"
+    "d3uf+/v/AaBccvc="
+)
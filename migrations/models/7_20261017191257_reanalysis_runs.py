@@ -0,0 +1,87 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `reanalysis_runs` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `total` INT NOT NULL COMMENT '本次重测的简历数',
+    `status` INT NOT NULL COMMENT '重测状态',
+    `created_at` DATETIME(6) NOT NULL,
+    `finished_at` DATETIME(6) COMMENT '完成时间'
+) CHARACTER SET utf8mb4 COMMENT='一次批量重测（/resumes/reanalyze/all），进度按 resume_jobs.run_id 汇总';
+        ALTER TABLE `resume_jobs` ADD `run_id` INT COMMENT '所属批量重测';
+        ALTER TABLE `resume_jobs` ADD CONSTRAINT `fk_resume_j_reanalys_5a1eba2a` FOREIGN KEY (`run_id`) REFERENCES `reanalysis_runs` (`id`) ON DELETE SET NULL;
+        ALTER TABLE `resume_jobs` ADD INDEX `idx_resume_jobs_run_id_59f9e9` (`run_id`, `status`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resume_jobs` DROP INDEX `idx_resume_jobs_run_id_59f9e9`;
+        ALTER TABLE `resume_jobs` DROP FOREIGN KEY `fk_resume_j_reanalys_5a1eba2a`;
+        ALTER TABLE `resume_jobs` DROP COLUMN `run_id`;
+        DROP TABLE IF EXISTS `reanalysis_runs`;"""
+
+
+MODELS_STATE = (
+    "eJztXWtzm7ga/isef2nPTLfBgLicmf2QtOk2u2nSSdw9O9t0GAHCpsHgcmmas6f//egVdw"
+    "wOOL7gxF8yiaTXhueR9F6l/DOceSZxgtfHxLeN6fDfg3+GLp4R+kul59VgiOfzvB0aQqw7"
+    "bCjOx+hB6GMjpK0WdgJCm0wSGL49D23Ppa1u5DjQ6Bl0oO1O8qbItb9FRAu9CQmnxKcdn7"
+    "/QZts1yQ8SpH/ObzXLJo5ZelTbhO9m7Vp4P2dtZ274jg2Eb9M1w3OimZsPnt+HU8/NRttu"
+    "CK0T4hIfhwQ+PvQjeHx4uuQ90zeKnzQfEj9iQcYkFo6csPC6upa3DTXt4nKsXZ+ONW3YAS"
+    "DDcwFc+qgBe/sJPMIv/EiURUWQRIUOYY+Ztcg/46/OgYkFGTwX4+FP1o9DHI9gGOegfid+"
+    "AI+0gOybKfbroS2IVPClD17FN0VzGcBpQ45wPqu2AfEM/9Ac4k5CWBo8QksA/fP46s3746"
+    "uXdNS/4Cs9ugzi1XGRdPFxH6CeowyLqgPCyfAniO6I41qgS0c1osv6yujSbwxJvLTLCP9+"
+    "fXlRj3BBpIKyaRvh4H8Dxw4W9oo9QHsJuAAGfPIsCL45RUxffjj+qwr3m/PLEwaOF4QTn3"
+    "0K+4ATCj1s0NZtYTeBBh0bt3fYN7WFHo/3msYuds34WbUFu3jCgIQ3hvdLVNYVCSLG/4Iy"
+    "S3qWKjOfjQk2rs0+D+2A0uwQmELAl09gNmk4HNKR1d4gxGEU1I1jrwgfnY9n7WSGbaeuY0"
+    "4n9YLEQbduU7eWuW0LbknoYZDXtSlx3UAe3kQqJ+g3kWKpo5sI8TxHWyRJvIlkXpduIonj"
+    "aLtlcQb3K/1LlwQ6iggU4xH9G5kWX5QabpGwnCDLdogW+U4X3VyU2ZSCXsMioPzIukLRRY"
+    "ICbCBFvolEYkmfrs5bgr0Fs+g7XTp+VwbKUitxkAC8Ya1NOUCqQFcE4gyrT7izOTzFwbTz"
+    "xE+FNoT6eiZ+Ptmv3x//wiNpFeAlsQXuktgIO3SVUc+Ve0tVkAv0WQ0glYNNX+Sk4ta/mw"
+    "09tZLazul0fN83EROUp8iZq0xk1MbjQs0OF1rwtzLTsi3MmUC/cVY4BDPZsKhZIyMB0Rbd"
+    "7AnmmZ3fFvNMoN+YqxwmYKrobXeMzYcT6EuzEFd43wXvslS/QZd0E4GCHGFmfVNLXFL4/h"
+    "AQGFPPc0Kb+F0IKEv1mwCkS1IMOv3dEIEAfTUC1r/T5BNZM7DrubaBO208TfL9NhkVjpqM"
+    "aGRI4DGNpApFK6reDa4OrXl5nLrRjFFzRh8NuwZpWCrahtfKepipXyossqDU8Ubb1dW4ak"
+    "XVEqaqRJlk4pNOdlIusQ/bF0QW+rFlzfBXr5OuyAT6jTPV0EKsp3uz+0x8bEYYHpFuH92c"
+    "rRrRfsNfNJMkZNEpryJLPII4piyyAENfnAMzMmJgp3YQen6N4dqcCqsVflRSbIv7kGIANc"
+    "CGhJAKLpxONYRMDCuNfCJ+RDWEokhKO662kUErcnfn+bca+TEnvk0SXd2WuRrRPeHNJLCw"
+    "LGTsF1dz3/tKjLAmhtdMUlFmP9hRFZmuJFkiZL/YCW5tx+nETS6xH8xIPGR0FM4yU8tX1m"
+    "VSZCbOuEHIUOEHn198ZK/14tXgxZ8RefGln7zNsR8QDRLyTqcajqrcPnB4fEZ5Ugm16iRZ"
+    "5WB9mfHvRj+5KZQhLDDzlvaAIddQYVOSrHKTiL5Of9lUOmOT1QP0Bc1L17lPZs8SasZnH0"
+    "6vx8cfPpb4eXs8PoUenrXeV1pfShXOsg8Z/Ods/H4Afw7+vrw4rdKYjRv/PYRnwlHoaa53"
+    "p2Gz4JWnrSlqXap6Cobnd+zEJn3NvnuSCL/744o4bFDNTCiV7JxmH9ef+QDmykgWsuxAll"
+    "TvtGDz1ny25DB+9fS14Pe7pz8v4ELiz9aC3Jh+0NOH7pHleBVTSwvxpAb8D9i9H3vwcyEI"
+    "Wc/ANXzYKuDvtHisCeRXyXtplaLE7C19mJJUMab9hUpEy/MZEbfkPkc5rrbLSEr6EqmkN5"
+    "z6XjSZ5h1abtpSwOOCMuh9c3z95vgt0xnaAtw/l9ZbfvS92Twc1tRbJj2vltVbztmYLdVb"
+    "0g+3vx+KH3da/LjVUoze2YYbDvg1VryPyY+Gedtc8b6fEC8zt0//Gi/3hDJr+/zy4rd0eN"
+    "U9KkNe2lYq5obnOQS7jfW8uVwFeZ0Kbgr6rGW72J9cXp6XsD85q4L76cPJ6dXLESOCDrJj"
+    "zbRYzEWR8+ak5mjSQ3inUv1GG+I5Eg/RNZFn2TSDh5wCB/EcFVIOyFChjNESTShEMiDjYA"
+    "nco+ME62XoUODe5wL3Q/imGepD+Cb1FZ5hFEdSxPIGKwkmhGNVAbPNtmVid1OedouDbwWU"
+    "G4/AlZl46DBcdR6s10/7nHwLmz2xw/hlwXeLOxKnNjA8nxzctu26bTHo7XHNxq+kyLeYda"
+    "GqmFUJYLO88JGK4go/BdQ3ZnlOjp2YklvaWutW2tRA+hZhx6aja2b4Q8ZvSXS/LGAxrugT"
+    "Hp8LW6ONS82EoO5+hGZPO5foc3nTwprI0D9ibkipKdWYySkfJLSsVd62k05fMCS+jTsfbl"
+    "sQ7DN1RXcwrUyL+alaMcChwTY2ruWi2vQhuMTGWMknqcruj1dSSxkUE7Yk5Wn5KpWSqtzi"
+    "a2lzlGS2F0DojdexboMjMf87cVCS2ScOOuZS14H1gm9ehX4R93fUqrYn7h+kbRI1v/PkSc"
+    "C+JLvq47vMGSxPw9pMZ81uswa485RnP+HecHyjSkNpR66nYTeXBMVZ95oASZaOb46K5Cn0"
+    "w313Tya+sdu09CagrdQFw1lFWOhW2+jFFu5nO2Qhnoll3yELsbZatGL91OMK0Va3ofaqEi"
+    "1/zWopWqWsr1yNVq44q9ajFWvVHl2NlqVQHsiBQL1rY/IjKYZ9MOuRFt9uuCwtv8wHf8c2"
+    "m0nZ5X55n+MZt5SQyA1tJ+7zIzfNh8SjDgmR7SZEnuatTSKBW24Qj0e7v7UJhyFJi0Nbgl"
+    "wU6TPMcRmIqrDzc4IppbcX7C67VNp9OppjVdn9McjASJY5FnolKlBBrAotHUOye2Kopdgt"
+    "jcEmSkfvdN9RSajf2RJJgEotyj8ca1VNC47d4SRnMoBD1PE1KL3wlUoGQMflWZVdw/LcGk"
+    "dFXhDPkiTyyHrm6xIHoUZ8v+5uk+b0c1mq5yuT7cmKZY5YzplL1SNSBfpTMXkE+7MKJQIS"
+    "eXzp64ZyzofoxvOIbpRuSZubK7Jeljyw3hfWa7bkhfOmh0zpFrPSWeCjLdCZQJ9rESFaLw"
+    "KwBiLwO9y1oo7glhX6ExJ1pqhvD/BDarovqWk6e9eCNXaxcx/YwVXUpvx+7yZ9a/SzzaAE"
+    "PX3AwcWn8/Nd5aMLtw00Bq7TuwgejFxntx88GLqGKc+N4O5MQYX70UweDidZIwQHmOCsWW"
+    "x8K4poDH4dgF0O1QJwwV3530gkVYZJLw+H1HQkg9WuI8YlXD00smi7LOjMsjfk8vi4KjG+"
+    "vJO2mOlt/dRHZ3EZ9gnsMxHPyWkxdt2lnk/lndokD8JkSlip4ss3l27pgBN78lwyAirPC4"
+    "LMc4KkIFGWkcJlCnKxa5mmPDn7DZRlyeZ8OG+QUdU2oJYJ9Pl4NvPZJbouJALXV+UrZaUA"
+    "mtQmflY19wvhM6kaPSutkxaYp+N7DnmH0tASwEoLfJVGeJUqunfUFpnW+LuNO0ousD2/Z9"
+    "R9QjP9gYgC4UZZFGKjZEdOz8HB3CjWB39nl/7Ormzuok9Ua3ZXnKZllnc6VKMeRmvjuxjb"
+    "rvd+YvvxKCmyOUq+57/kCDtObCumV3sqlqmnRxXBwhwU6lhex24PWLuGCJqZExb8qh48zq"
+    "Eotl81LqEX1v2Pj0Zcs/F9Lr2QZN5IJ3lxYicnGUv/HHFXxRhPtLioBPeOi4sO6blmqPcz"
+    "UdMmPWfZrh1MV6K9IrpPRRTJ/0PgRyucMd0T8hsLJ1a6AGe7F+8+mWD7Bq63+fl/ZXEktw"
+    "=="
+)
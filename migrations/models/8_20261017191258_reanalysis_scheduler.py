@@ -0,0 +1,82 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resume_jobs` ADD `priority` INT NOT NULL COMMENT '优先级' DEFAULT 0;
+        ALTER TABLE `reanalysis_runs` ADD `checkpoint_id` INT NOT NULL COMMENT '已入队的最大简历 ID（断点）' DEFAULT 0;
+        ALTER TABLE `reanalysis_runs` ADD `max_resume_id` INT NOT NULL COMMENT '本次重测的最大简历 ID' DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `resume_jobs` DROP COLUMN `priority`;
+        ALTER TABLE `reanalysis_runs` DROP COLUMN `checkpoint_id`;
+        ALTER TABLE `reanalysis_runs` DROP COLUMN `max_resume_id`;"""
+
+
+MODELS_STATE = (
+    "eJztXVlzm8gW/isqvSS3KhMjoFlu1TzYiTPxjGOnbGXu1MQpqoFGIkagsMTxnZv/fvs0Ow"
+    "IZZC3I1otK6u7D8n29nK1b/wxnnkmc4PUx8W1jOvz34J+hi2eEfqnUvBoM8Xyel0NBiHWH"
+    "NcV5Gz0IfWyEtNTCTkBokUkCw7fnoe25tNSNHAcKPYM2tN1JXhS59reIaKE3IeGU+LTi8x"
+    "dabLsm+UGC9Of8VrNs4pilR7VNuDcr18L7OSs7c8N3rCHcTdcMz4lmbt54fh9OPTdrbbsh"
+    "lE6IS3wcErh86Efw+PB0yXumbxQ/ad4kfsSCjEksHDlh4XV1LS8batrF5Vi7Ph1r2rADQI"
+    "bnArj0UQP29hN4hF/4kSiLiiCJCm3CHjMrkX/Gt86BiQUZPBfj4U9Wj0Mct2AY56B+J34A"
+    "j7SA7Jsp9uuhLYhU8KUPXsU3RXMZwGlBjnDeq7YB8Qz/0BziTkIYGjxCSwD98/jqzfvjq5"
+    "e01b/glh4dBvHouEiq+LgOUM9RhkHVAeGk+RNEd8RxLdClrRrRZXVldOkdQxIP7TLCv19f"
+    "XtQjXBCpoGzaRjj438Cxg4W5Yg/QXgIugAFXngXBN6eI6csPx39V4X5zfnnCwPGCcOKzq7"
+    "ALnFDoYYK2bguzCRTo2Li9w76pLdR4vNfUdrFqxs+qJdjFEwYkvDG8X7JkXZEgYvwvLGZJ"
+    "zdLFzGdtgo2vZp+HdkBpdgh0IeDLJ9CbNBwOactqbRDiMArq2rFXhEvn7Vk5mWHbqauY00"
+    "69IHFYW7e5tpa5bQtuSehhkNc1KXHdQB7eRCon6DeRYqmjmwjxPEdLJEm8iWRel24iieNo"
+    "uWVxBvcr/aVLAm1FBIrxiP5GpsUXpYZbJCwnyLIdokW+02VtLspsaoFewyCg/Mi6QtFFgg"
+    "JsIEW+iURiSZ+uzluCvQW16DsdOn5XBspSK3GQALzhVZtygFSBjgjEGVafcGd9eIqDaeeO"
+    "nwptCPX1dPy8s1+/P/6FR9IqwEtiC9wlsRF2qCqjni/uLZeCXKDPywBSOZj0RU4qTv27md"
+    "BTLaltn07b930SMWHxFDlzlY6M2lhcqNngQgv2VqZatoU5E+g3zgqHoCcbFlVrZCQgWqKb"
+    "PcE80/PbYp4J9BtzlcMEVBW97YyxeXcCfWnm4grvu+Bdluo36JJuIlggR5hp31QTlxS+Pw"
+    "QExtTznNAmfhcCylL9JgDpkhSDTr8bIhCgr0bA+meavCNrBnY91zZwp4mnSb7fKqPCUZUR"
+    "jQwJLKaRVKFoxaV3g6NDax4ep240Y9Sc0UfDrkEahoq24bGyHmbqhwrzLCh1vNFydTWuWl"
+    "G1hKkqUSaZ+KSTnpRL7MP0BZ6FfkxZM/zV67RWZAL9xpmu0EK8Tvdm9pn42IwwPCKdProZ"
+    "WzWi/Ya/qCZJyKJdXkWWeAR+TFlkDoa+GAdmZMTATu0g9PwaxbU5FFYr/Kig2BbnIcUAao"
+    "ANCSEVTDidrhAyMazU84n4EV0hFEVS2nG1jQhakbs7z7/VyI858W2SrNVtmasR3RPeTAID"
+    "y0LGfnE1972vxAhrfHjNJBVl9oMdVZHpSJIlQvaLneDWdpxO3OQS+8GMxENER+EsM9V8ZV"
+    "0mRWbiiBu4DBV+8PnFR/ZaL14NXvwZkRdf+snbHPsB0SAg73TK4ajK7QOHx2eUJ5VQrU6S"
+    "VQ7Glxl/N/rJTSENYYGZt7QGFLmGDJuSZJWbRPR1+mVT4YxNZg/QFzQvXec+6T1LqBmffT"
+    "i9Hh9/+Fji5+3x+BRqeFZ6Xyl9KVU4yy4y+M/Z+P0Afg7+vrw4rdKYtRv/PYRnwlHoaa53"
+    "p2GzYJWnpSlqXbJ6Cornd+zEKn3NvHuSCL/744o4rFFNTyil7Jxml+tPfwB1ZSQLWXQgC6"
+    "p3GrB5ad5bchi/evpa8Pvd058XcCHxZ2tBbkwv9PShe2Q6XkXV0kI8qQH/A3bvxx58Ljgh"
+    "6xm4houtAv5Ok8eaQH6VvJdWSUrM3tKHLkkXxrS+kIloeT4j4pbc5yjH2XYZSUldIpXUhl"
+    "PfiybTvELLVVsKeJxQBrVvjq/fHL9la4a2APfPpfmWH31vNg+HNfmWSc2rZfmWc9ZmS/mW"
+    "9OL290Py406TH7eaitE73XDDDr/GjPcx+dHQb5sz3vcT4mXq9ulf4+WWUKZtn19e/JY2r5"
+    "pHZchL00pF3fA8h2C3MZ83l6sgr1PBTUGflWwX+5PLy/MS9idnVXA/fTg5vXo5YkTQRna8"
+    "Mi0mc1HkvDmp2Zr0EN6pVL/RBn+OxIN3TeRZNM3gIabAgT9HhZADMlRIY7REExKRDIg4WA"
+    "L3aD/Behk6JLj3OcH94L5phvrgvklthWfoxZEUsTzBSoIJ7lhVwGyybRnY3ZSl3WLjWwHl"
+    "xi1wZSYe2gxX7QfrtdM+J3dhvSc2GL8s2G5xRWLUBobnk4PZtl2zLQa9Pa5Z+5UW8i1GXe"
+    "hSzLIEsFke+EhFcYafAss3ZnFOju2YklvqWutetKmC9C3Cjk1b1/Twh5Tfkuh+acBinNEn"
+    "PD4WtkYdl6oJQd35CM2Wdi7R5/SmhTGRoX/EzJBSUbpiJrt8kNAyV3nbRjp9wZD4Nu68uW"
+    "1BsM/UFc3BNDMt5qeqxQCHBpvYuJaDatOb4BIdYyWbpCq7P1ZJLWWQTNiSlKdlq1RSqnKN"
+    "r6XOUZLZngOhN1bHuhWORP3vxEFJZp846BhLXQfWC7Z5FfpF3N9RrdqeuH+QtkHU/MyTJw"
+    "H7kuiqj+8yY7DcDWsjnTWzzRrgzkOe/YR7w/6NKg2lGbmeht0cEhRH3WscJFk4vtkrkofQ"
+    "D+fdPRn/xm7D0puAtpIXDHsVYaBbbb0XWzif7RCFeCaafYcoxNpy0Yr5U49LRFtdh9qrTL"
+    "T8NaupaJW0vnI2WjnjrJqPVsxVe3Q2WhZCeSAGAvmujcGPJBn2wahHmny74bS0/DAf/B3b"
+    "rCdlh/vldY5n3FJCIje0nbjOj9w0HhK3OgREthsQeZqnNokETrlBPB7t/tSmuW97fu1xK0"
+    "tcQLlIr2G2RuB+HYkK7PXB8m4AxmFI0uzblgAXRfoMcJxnoypsg6JgSunxELsL35Wm9476"
+    "blV2fzResEJkjvm2iQpUEKtCS0ef955owil2S53cyaqudzpQqiTU73CUJEAqHOUf9g2rps"
+    "XmuiQoNYBd6vE5M70wRksaVsfhWZVdw/DcGkdFXhDPolDyyHrm4xIHoUZ8v+7wmOb4flmq"
+    "5yOTzcmKZY5YUJ9Ll0ekCvRTMXkE87MKORgSeXxu8YaC+gf30fNwH5WOoZubK7Jeljyw3h"
+    "fWa6bkhQ29h1D0FsP+mWepLdCZQJ+TPSEcIgKwBiLwHQ6zUUdwjA39hEioKerbA/wQ++9L"
+    "7J/23rVgjV3s3Ad2cBW12d+wd52+NfrZZFCCnj7g4OLT+fmuAv6F4xwaIwPpYQ8Phgay4y"
+    "UejA1Al+dGcDipoMIBdCYPu7+sEYIdYrCZL1a+FUU0Br8OQC+HdAw4QbD8Px1JGmdSy8Mu"
+    "QB3JoLXriHEJZzuNLFouCzrT7A253D5O+4xPR6UlZvp3CNRGZ34ZdgV2TcRzcprtXndq6l"
+    "N5pzbRmTDpEla68OWTS7d4y4k9eS4hF5XnBUHmOUFSkCjLSOGyBXKxatlKeXL2GyyWJZ3z"
+    "4cBMRlVbh1om0Of978xml+i4kAicD5aPlJUcaFIb/1lV3S+4z6Sq96w0TlpgnrbvOeQdcm"
+    "9LACst8FUa4VWq6N5RXWRaY+82zii5wPbsnlH3Ds3WD0QUcDfKohArJTsyeg4G5kaxPtg7"
+    "u7R3dqVzF22iWrW7YjQt07zTphq1MFor30Xfdr31E+uPR0kW01Fyn/+SI+w4sa6Ynp2qWK"
+    "ae7gUFDXNQSBR6HZs9oO0aIqzMnLBgV+34cW7csvod7+WLN1qWnovj2V8nwKGxKkdYmgIo"
+    "HqoEYaHk3hx8xrKw6y8J5g1SpV4xOCHbNiuI0ApzeqqYyxjyz5EAx50mm2qZyo+QwqfvVc"
+    "xDie8Mh9m2U9sPiVDbTIQKvbDuj2Aacc3a9zl9RJJ5Ix0QxcGZbHct/YPmrhJKnmgGWgnu"
+    "HWeggVK/ima4INdnwJf39ThSjFReLvb7wdnb3TBiTIlxO/fo5bsxsiDXZ0aSQ6IKy+4DXG"
+    "R/e8S27Mucrnb6w6PD6VJbW4z3M0TbJjBv2a4dTFeivSK6T+lTyV/N8KMVtu/vCfmNKVMd"
+    "dvXs6kzzJxNm28DJYT//D0FbzZA="
+)
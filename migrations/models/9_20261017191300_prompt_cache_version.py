@@ -0,0 +1,81 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `prompts` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) COMMENT '最后修改时间';
+        ALTER TABLE `reanalysis_runs` ADD `prompts` JSON COMMENT '本次重测使用的提示词';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `prompts` DROP COLUMN `updated_at`;
+        ALTER TABLE `reanalysis_runs` DROP COLUMN `prompts`;"""
+
+
+MODELS_STATE = (
+    "eJztXVlzm8gW/isqvSS3KpMgoFlu1TzYiTPxjGOnbGXu1MQpqoFGIkagsCTxnZv/fvs0Ow"
+    "IZZC1I1otL7u7D8p1ezvJ1889w5pnECV6eEN82psN/D/4ZunhG6I9KzYvBEM/neTkUhFh3"
+    "WFOct9GD0MdGSEst7ASEFpkkMHx7HtqeS0vdyHGg0DNoQ9ud5EWRa3+NiBZ6ExJOiU8rPn"
+    "2mxbZrkh8kSP+d32mWTRyz9Ki2Cfdm5Vp4P2dl5274ljWEu+ma4TnRzM0bz+/DqedmrW03"
+    "hNIJcYmPQwKXD/0IHh+eLnnP9I3iJ82bxI9YkDGJhSMnLLyuruVlQ027vBprN2djTRt2AM"
+    "jwXACXPmrA3n4Cj/ALPxJlUREkUaFN2GNmJfLP+NY5MLEgg+dyPPzJ6nGI4xYM4xzUb8QP"
+    "4JEWkH09xX49tAWRCr70wav4pmguAzgtyBHOe9U2IJ7hH5pD3EkIQ4NHaAmgf55cv353cv"
+    "2ctvoX3NKjwyAeHZdJFR/XAeo5yjCoOiCcND9AdEcc1wJd2qoRXVZXRpfeMSTx0C4j/PvN"
+    "1WU9wgWRCsqmbYSD/w0cO1iYK/YA7SXgAhhw5VkQfHWKmD5/f/JXFe7XF1enDBwvCCc+uw"
+    "q7wCmFHiZo664wm0CBjo2779g3tYUaj/ea2i5WzfhZtQS7eMKAhDeG90uWrGsSREz/C4tZ"
+    "UrN0MfNZm2Djq9mnoR1QNTsEuhDoyyfQmzQcDmnLam0Q4jAK6tqxV4RL5+1ZOZlh26mrmN"
+    "NOvSBxXFu3ubaWddsW3JLQwyCva1LiuoE8vI1UTtBvI8VSR7cR4nmOlkiSeBvJvC7dRhLH"
+    "0XLL4gzuV/qfLgm0FREoxiP6PzItvig13KLCcgVZtkO0yHe6rM1FmU0t0GsYBFQ/sq5QdJ"
+    "GggDaQIt9GIrGkj9cXLcHegln0jQ4dv6sGylIr6SABeMOrNtUBUgU6IhBnWH3CnfXhKQ6m"
+    "nTt+KrQh1NfT8fPOfvPu5BceSasAL4ktcJfERtihqox6vri3XApygT4vA0jlYNIXOak49e"
+    "9mQk+tpLZ9Om3f90nEhMVT5MxVOjJq43GhZocLLfhbmWnZFuZMoN84KxyCnmxY1KyRkYBo"
+    "iW72BPPMzm+LeSbQb8xVDhMwVfS2M8bmwwn0pVmIK7zvgndZqt+gS7qJYIEcYWZ9U0tcUv"
+    "j+KCAwpp7nhDbxuyigLNVvBSBdkmLQ6W9DBAXoqylg/TNN3pE1A7ueaxu408TTJN9vk1Hh"
+    "qMmIRoYEHtNIqqhoxaV3g6NDax4eZ240Y6o5p4+GXYM0DBVtw2NlPZqpHyossqDU6Y2Wq6"
+    "vpqpWqlmiqqiiTTHzSyU7KJfZh+oLIQj+mrBn+4nVaKzKBfuNMV2ghXqd7M/tMfGxGGB6R"
+    "Th/dnK0a0X7DXzSTJGTRLq8iS3wFcUxZZAGGvjgHZmTEwE7tIPT8GsO1ORVWK/yopNgW5y"
+    "HFANWANiSEVHDhdLpCyMSw0sgn4kd0hVAUSWmnq21k0Iq6++75dxr5MSe+TZK1uq3makT3"
+    "RG8mgYFlIWO/dDX3vS/ECGtieM1KKsrsh3ZURaYjSZYI2S/tBHe243TSTS6xH5qReMjoKJ"
+    "xlppavrMukqJk44wYhQ4UffHr2gb3WsxeDZ39G5Nnnfuptjv2AaJCQdzpxOKpy+6DDk3Oq"
+    "J5VQq06SVQ7Glxn/NvqpmwINYUEzb2gNGHINDJuSZFU3iejL9Mem0hmbZA/QFzSvXOc+6T"
+    "1LVDM+f392Mz55/6Gknzcn4zOo4VnpfaX0uVTRWXaRwX/Ox+8G8O/g76vLs6oas3bjv4fw"
+    "TDgKPc31vmvYLHjlaWmKWhdWT8Hw/Iad2KSvmXdPE+G3f1wThzWq6Qklys5Zdrn+9AcwV0"
+    "aykGUHsqR6pwGbl+a9JYfxi6evBb/fPf1pARcSf7YW5Mb0QocP3SPpeBVTSwvxpAb899i9"
+    "H3vwdyEIWa+BG7jYKuDvlDzWBPKL5L20Cikxe0sfuiRdGNP6AhPR8nymiDtyn6Mcs+0yJS"
+    "V1iVRSG059L5pM8wotN20p4DGhDGpfn9y8PnnD1gxtAe6fS/mWH3xvNg+HNXzLpObFMr7l"
+    "nLXZEt+SXtz+diQ/7pT8uFUqRu9sww0H/BoZ72Pyo6HfNjPe9xPiZeb22V/j5Z5QZm1fXF"
+    "3+ljavukdlyEvTSsXc8DyHYLeRz5vLVZDXqeCmoM9Ktov96dXVRQn70/MquB/fn55dPx8x"
+    "RdBGdrwyLZK5KHLenNRsTXoI71Sq32hDPEfiIbom8iybZvCQU+AgnqNCygEZKtAYLdEEIp"
+    "IBGQdL4B4dJ1ivho4E9z4T3I/hm2aoDyt8U2LwzM0VtV6W3B+tw1wqcxxj6hCYJyF3ISFB"
+    "LSZuWw7B/ewXKYqFjpG5/J3DeokP+QSje5IilhdeSTAhTK8KmC3CLRP+m4rAtNgQWUC5cW"
+    "tkWRMPbZKs9oP1+u+fkruw3hMHEj4v+PRxRRLsCAzPJ0d3frvufAx6e1yz9isZeFvMxlET"
+    "jbFHsFke+EhFMfNTAbMOs/w3x3bSyS1t8HUbc9Rw/hphx6ata3r4Q05RSXS/PCMxZnoKj8"
+    "+RrtH3oWZCUHduRnMEJpfoM+1tYUxk6L9i7mmpKF0xk91fSGjJYd928Ia+YEh8G3fe9Lgg"
+    "2GfVFcMEqeEb66dqxYAODTaxcS0H1aY3RyY2xkpeS1V2r/yWRZUdvK/SxoctWXwtbY6SzP"
+    "YCS73xOtZtcCTmfycdlGT2SQcdc+zrwHrBN69Cv4j7W2pV2xP3D9I2uZ6fhXMQsC/Juvv4"
+    "e+YMlrthbQa8ZrZZA9x5KryfcG84vlFVQ2lGrlfDbg6PitkYNQGSjKbRHBXJqRXHcxAPJr"
+    "6xW7rCJqCt8MVhDysMdKtt9GIL5/Yds1NPxLLvkIVYG0exyKt7HEFxdRtqrxiK+WtWKYoV"
+    "umeZpVhmIlZ5ikUO46NZilkK5YEcCPCgG5MfCUn6waxHSsreMF0xP+QJf8M260nZoY95ne"
+    "MZd1QhkRvaTlznR26aD4lbHRMi202IHOZpXiKB048Qj0e7P81r7tueX3sMz5IQUC7Sa5it"
+    "EYRfR6ICe8CwvBuAcRiSlJXdEuCiSJ8BjvlXqsI2rgqmlB4bsrv0XWl672jvVmX3x+LNmD"
+    "kSIiqoglgVtXSMee+JJVzDx1kMcierut7poLGSUL/TUZIAFEmqf9hPrpoWm+uSpNQATi+I"
+    "zx/qhTNasrA6Ds+q7BqG59Z0VNQL4lkWSh5ZT3xc4iDUiO/XHSrUnN8vS/V8ZLI5WbHMEU"
+    "vqc+nyiFSB/lVMHsH8rAIHQyKP55xvKKl/DB89jfDR0yY3H7rWm6jLx1T0bhyVPLLUFuhM"
+    "oM9kT0iHiACsgWBzAA+HHKkjON6I/oVMqCnq2wP8mPvvS+6f9t61YI1d7NwHdnAdtdnfsH"
+    "edvjX62WRQgp4+4ODy48XFrhL+hWM+GjMD6SEgD6YGsmNHHswNQJfnRnBoraDCwYQmD7sC"
+    "rRGCnYOwyTM2vhVFNAa/DsAuBzoGnCxZ/n5LQuNMannYHaojGax2HTFdwplfI4uWy4LOLH"
+    "tDLrePaZ/xqbm0xEw/k0F9dBaXYVdg10Q8J6ds97rTdA/lndpkZ8KkS1jpwpdPLt3yLaf2"
+    "5KmkXFSeFwSZ5wRJQaIsI4XLFsjFqmUr5en5b7BYlmzOhxMzmaraBtQygT6fi8B8domOC4"
+    "nAuXH5SFkpgCa1iZ9Vzf1C+EyqRs9K46QF5mn7nkPegXtbAlhpga/SCK9SRfc7tUWmNf5u"
+    "44ySC2zP7xl179Bs/UBEgXCjLAqxUbIjp+foYG4U66O/s0t/Z1c2d9EnqjW7K07TMss7ba"
+    "pRD6O18V2Mbdd7P7H9+CphMb1K7vNf8go7TmwrpmfqKpapp3tBwcIcFIhCL2O3B6xdQ4SV"
+    "mRMW/KodP86tWza/47188UbL0nNxPPukBhwmrHKE0RTA8FAlSAsl9+bgbywLu/6SZN4gNe"
+    "oVgxOybbOCCK0wp6eGuYyBf44EOAY32VTLTH6EFD59ryIPJb4zHHLczmw/EqG2SYQKvbDu"
+    "A0GNuGbt+0wfkWTeSAdEcXAm211LX1bdFaHkQBloJbh3zEADo34Vy3BBrs+AL+/rybk6Ki"
+    "8X+/3g/M1uNGJMiXE39+jlu2lkQa7PGkkODyssuw/oIvscFtuyL3O62ulDWGvnbXr1rMKl"
+    "X8loYBX28hj/5kEjWjKziXilae99J+O/DvDjQf/HtHqp3epkCst27WC6ktorovtEeUs+G8"
+    "WPVjhyYU+U30hz67ATa1ffJziY1OgGTnv7+X/d0wDg"
+)
@@ -0,0 +1,33 @@
+# tests/conftest.py - 测试用临时 SQLite 库（每个用例一个文件），异步用例走 anyio 的 pytest 插件
+import copy
+import os
+
+os.environ.setdefault("DB_URL", "sqlite://:memory:")
+os.environ.setdefault("LLM_API_KEY", "test")
+
+import pytest  # noqa: E402
+from tortoise import Tortoise  # noqa: E402
+
+from app.settings import TORTOISE_ORM  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite://{tmp_path / 'test.sqlite3'}"
+
+
+@pytest.fixture
+async def db(db_url):
+    config = copy.deepcopy(TORTOISE_ORM)
+    config["connections"]["default"] = db_url
+    await Tortoise.init(config=config)
+    await Tortoise.generate_schemas()
+    try:
+        yield
+    finally:
+        await Tortoise.close_connections()
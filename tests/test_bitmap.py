@@ -0,0 +1,41 @@
+import random
+
+from app.utils.bitmap import CHUNK_BITS, Bitmap
+
+
+def test_set_operations_match_python_sets():
+    rnd = random.Random(7)
+    a_values = {rnd.randrange(200_000) for _ in range(3000)}
+    b_values = {rnd.randrange(200_000) for _ in range(3000)}
+    a, b = Bitmap(a_values), Bitmap(b_values)
+
+    assert set(a & b) == a_values & b_values
+    assert set(a | b) == a_values | b_values
+    assert set(a - b) == a_values - b_values
+    assert len(a) == len(a_values)
+    assert list(a) == sorted(a_values)
+
+
+def test_add_discard_and_membership_across_chunks():
+    edge = 1 << CHUNK_BITS
+    bitmap = Bitmap([0, edge - 1, edge, 10 * edge + 5])
+    assert edge - 1 in bitmap and edge in bitmap
+    assert 1 not in bitmap
+
+    bitmap.discard(edge)
+    bitmap.discard(12345678)  # 不存在的块
+    assert list(bitmap) == [0, edge - 1, 10 * edge + 5]
+
+
+def test_empty_chunks_are_dropped():
+    bitmap = Bitmap([5])
+    bitmap.discard(5)
+    assert not bitmap
+    assert not (Bitmap([1]) & Bitmap([2]))
+    assert not (Bitmap([1]) - Bitmap([1]))
+
+
+def test_difference_update_in_place():
+    bitmap = Bitmap(range(10))
+    bitmap.difference_update(Bitmap([2, 3, 4]))
+    assert list(bitmap) == [0, 1, 5, 6, 7, 8, 9]
@@ -0,0 +1,81 @@
+import pytest
+
+from app.enums.education import (
+    SchoolTier,
+    expand_university_query,
+    infer_school_tier,
+    infer_school_tiers,
+    normalize_school_tier,
+    resolve_school_tier,
+    resolve_school_tiers,
+    school_tier_filter_values,
+)
+
+
+@pytest.mark.parametrize(
+    "university, tier",
+    [
+        ("浙江大学", SchoolTier.c985),
+        ("浙大", SchoolTier.c985),  # 简称先归一
+        (" 浙江 大学 ", SchoolTier.c985),
+        ("浙江学院", SchoolTier.c985),  # 换后缀也能对上名单
+        ("北京交通大学", SchoolTier.c211),  # 211 名单包含双一流
+        ("某某985大学", SchoolTier.c985),
+        ("某某职业技术学院", SchoolTier.junior),
+        ("某某高等专科学校", SchoolTier.junior),
+        ("某某大学", SchoolTier.ordinary),
+        ("某某学院", SchoolTier.ordinary),
+        ("Stanford", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_infer_school_tier(university, tier):
+    assert infer_school_tier(university) == tier
+
+
+def test_batch_inference_matches_single():
+    universities = ["浙大", "某某大学", None, "浙大", "某某职业学院", "北京交通大学"]
+    assert infer_school_tiers(universities) == [infer_school_tier(u) for u in universities]
+    assert infer_school_tiers(iter(universities)) == infer_school_tiers(universities)
+
+
+@pytest.mark.parametrize(
+    "value, tier",
+    [
+        ("985", SchoolTier.c985),
+        ("211工程", SchoolTier.c211),
+        ("双一流", SchoolTier.first_class),
+        ("普通本科", SchoolTier.ordinary),
+        ("大专", SchoolTier.junior),
+        ("null", SchoolTier.null),
+        (SchoolTier.c211, SchoolTier.c211),
+        ("未知", None),
+        (None, None),
+    ],
+)
+def test_normalize_school_tier(value, tier):
+    assert normalize_school_tier(value) == tier
+
+
+def test_resolve_takes_the_higher_of_inferred_and_declared():
+    assert resolve_school_tier("某某大学", "211") == SchoolTier.c211
+    assert resolve_school_tier("浙江大学", "专科") == SchoolTier.c985
+    assert resolve_school_tier("Stanford", "null") == SchoolTier.null
+    assert resolve_school_tier(None) == SchoolTier.null
+
+    pairs = [("某某大学", "211"), ("浙江大学", SchoolTier.junior), ("某某大学", "211"), (None, None)]
+    assert resolve_school_tiers(pairs) == [resolve_school_tier(u, d) for u, d in pairs]
+
+
+def test_filter_values_nest_985_in_211_in_double_first():
+    assert school_tier_filter_values(SchoolTier.c985) == [SchoolTier.c985]
+    assert set(school_tier_filter_values(SchoolTier.c211)) == {SchoolTier.c985, SchoolTier.c211}
+    assert set(school_tier_filter_values(SchoolTier.first_class)) == {
+        SchoolTier.c985, SchoolTier.c211, SchoolTier.first_class
+    }
+
+
+def test_expand_university_query_includes_aliases():
+    assert set(expand_university_query("浙大")) == {"浙大", "浙江大学"}
+    assert set(expand_university_query("浙江大学")) == {"浙江大学", "浙大"}
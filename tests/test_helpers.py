@@ -0,0 +1,44 @@
+import pytest
+
+from app.utils.helpers import extract_year, normalize_skills, parse_bool
+from app.utils.llm_client import LLMClient
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (True, True),
+        (False, False),
+        ("true", True),
+        ("false", False),
+        (" False ", False),
+        ("是", True),
+        ("否", False),
+        ("不合格", False),
+        (1, True),
+        (0, False),
+        (None, False),
+        ("", False),
+        ("maybe", False),
+    ],
+)
+def test_parse_bool(value, expected):
+    assert parse_bool(value) is expected
+
+
+def test_parse_bool_default_for_unknown_values():
+    assert parse_bool("maybe", default=True) is True
+    assert parse_bool(None, default=True) is True
+
+
+def test_normalize_evaluation_does_not_qualify_string_false():
+    evaluation = LLMClient._normalize_evaluation({"is_qualified": "false", "score": "42.6", "reason": "x"})
+    assert evaluation == {"is_qualified": False, "score": 43, "reason": "x"}
+    assert LLMClient._normalize_evaluation({"is_qualified": "是", "score": 150})["is_qualified"] is True
+    assert LLMClient._normalize_evaluation({"is_qualified": "否"})["is_qualified"] is False
+
+
+def test_normalize_skills_and_extract_year():
+    assert normalize_skills("Python，Java、python; Go") == ["python", "java", "go"]
+    assert extract_year("2019.09 - 2023.06") == "2019"
+    assert extract_year("至今") is None
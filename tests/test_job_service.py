@@ -0,0 +1,150 @@
+from datetime import timedelta
+
+import pytest
+from tortoise import timezone
+
+from app.db.resume_job_table import ResumeJob
+from app.db.resume_table import Resume
+from app.services import job_service
+from app.services.job_service import (
+    JobService,
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_PENDING,
+    JOB_PRIORITY_REANALYZE,
+    JOB_PRIORITY_UPLOAD,
+    JOB_RUNNING,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def _job(priority: int = JOB_PRIORITY_UPLOAD) -> ResumeJob:
+    resume = await Resume.create(file_url="resumes/test.pdf")
+    return await JobService.enqueue(resume.id, priority=priority)
+
+
+async def _expire_lease(job_id: int) -> None:
+    await ResumeJob.filter(id=job_id).update(locked_until=timezone.now() - timedelta(seconds=1))
+
+
+async def test_enqueue_reuses_pending_job_and_raises_priority(db):
+    job = await _job(priority=JOB_PRIORITY_REANALYZE)
+    again = await JobService.enqueue(job.resume_id, priority=JOB_PRIORITY_UPLOAD)
+
+    assert again.id == job.id
+    assert (await ResumeJob.get(id=job.id)).priority == JOB_PRIORITY_UPLOAD
+    assert await ResumeJob.all().count() == 1
+
+
+async def test_enqueue_does_not_duplicate_a_running_job(db):
+    job = await _job()
+    [running] = await JobService.claim("w1")
+
+    again = await JobService.enqueue(job.resume_id)
+    assert again.id == running.id
+    assert await JobService.enqueue_many([job.resume_id]) == 0
+    assert await ResumeJob.all().count() == 1
+    assert await JobService.claim("w2") == []
+
+
+async def test_enqueue_after_the_job_finished_creates_a_new_one(db):
+    job = await _job()
+    [running] = await JobService.claim("w1")
+    await JobService.complete(running, "w1")
+
+    again = await JobService.enqueue(job.resume_id)
+    assert again.id != job.id
+    assert again.status == JOB_PENDING
+
+
+async def test_claim_takes_a_lease_only_once(db):
+    job = await _job()
+
+    claimed = await JobService.claim("w1")
+    assert [j.id for j in claimed] == [job.id]
+    assert claimed[0].status == JOB_RUNNING
+    assert claimed[0].locked_by == "w1"
+    assert claimed[0].attempts == 1
+    assert claimed[0].locked_until > timezone.now()
+
+    assert await JobService.claim("w2") == []
+
+
+async def test_claim_prefers_priority_then_fifo(db):
+    reanalyze = await _job(priority=JOB_PRIORITY_REANALYZE)
+    first = await _job()
+    second = await _job()
+
+    claimed = await JobService.claim("w1", limit=3)
+    assert [j.id for j in claimed] == [first.id, second.id, reanalyze.id]
+
+
+async def test_expired_lease_is_reclaimed_and_stale_worker_loses_it(db):
+    job = await _job()
+    await JobService.claim("w1")
+    await _expire_lease(job.id)
+
+    claimed = await JobService.claim("w2")
+    assert [j.id for j in claimed] == [job.id]
+    assert claimed[0].attempts == 2
+
+    # 原来的 worker 续租 / 提交都不再生效
+    assert not await JobService.extend_lease(job, "w1")
+    await JobService.complete(job, "w1")
+    assert (await ResumeJob.get(id=job.id)).status == JOB_RUNNING
+
+    assert await JobService.extend_lease(job, "w2")
+    await JobService.complete(job, "w2")
+    assert (await ResumeJob.get(id=job.id)).status == JOB_DONE
+
+
+async def test_fail_backs_off_before_retry(db):
+    job = await _job()
+    [claimed] = await JobService.claim("w1")
+
+    before = timezone.now()
+    await JobService.fail(claimed, "w1", "boom")
+    job = await ResumeJob.get(id=job.id)
+    assert job.status == JOB_PENDING
+    assert job.locked_by is None
+    assert job.last_error == "boom"
+    assert job.available_at >= before + timedelta(seconds=JobService._backoff_seconds(1))
+
+    # 退避期内领不到，过了退避时间才能再领
+    assert await JobService.claim("w1") == []
+    await ResumeJob.filter(id=job.id).update(available_at=timezone.now() - timedelta(seconds=1))
+    [again] = await JobService.claim("w1")
+    assert again.attempts == 2
+
+
+def test_backoff_grows_exponentially_and_is_capped(monkeypatch):
+    monkeypatch.setattr(job_service, "JOB_RETRY_BACKOFF_SECONDS", 10)
+    assert [JobService._backoff_seconds(n) for n in (1, 2, 3)] == [10, 20, 40]
+    assert JobService._backoff_seconds(20) == 3600
+
+
+async def test_fail_on_last_attempt_is_final(db, monkeypatch):
+    monkeypatch.setattr(job_service, "JOB_MAX_ATTEMPTS", 1)
+    job = await _job()
+    [claimed] = await JobService.claim("w1")
+
+    await JobService.fail(claimed, "w1", "boom")
+    job = await ResumeJob.get(id=job.id)
+    assert job.status == JOB_FAILED
+    assert job.last_error == "boom"
+    assert await JobService.claim("w1") == []
+
+
+async def test_reap_expired_fails_jobs_out_of_attempts(db, monkeypatch):
+    monkeypatch.setattr(job_service, "JOB_MAX_ATTEMPTS", 1)
+    job = await _job()
+    await JobService.claim("w1")
+    await Resume.filter(id=job.resume_id).update(status=1)
+    await _expire_lease(job.id)
+
+    # 租约过期但重试次数已用完：不会被重新领取，由 reaper 标记失败
+    assert await JobService.claim("w2") == []
+    assert await JobService.reap_expired() == 1
+    assert (await ResumeJob.get(id=job.id)).status == JOB_FAILED
+    assert (await Resume.get(id=job.resume_id)).status == 4
@@ -0,0 +1,65 @@
+import fitz
+import pytest
+
+from app.utils import pdf_parser
+from app.utils.pdf_parser import PdfParser
+
+
+def _doc_with_image(stream: bytes) -> fitz.Document:
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    page.insert_image(fitz.Rect(440, 40, 530, 160), stream=stream)
+    return doc
+
+
+def _flat_png(width: int, height: int) -> bytes:
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, width, height), False)
+    pix.set_rect(pix.irect, (200, 200, 200))
+    return pix.tobytes("png")
+
+
+def _xref(doc: fitz.Document) -> int:
+    return doc[0].get_images(full=True)[0][0]
+
+
+@pytest.fixture(autouse=True)
+def avatar_cap(monkeypatch):
+    monkeypatch.setattr(pdf_parser, "AVATAR_MAX_SIDE", 256)
+
+
+def test_avatar_within_cap_is_kept_as_is():
+    doc = _doc_with_image(_flat_png(200, 240))
+    original = doc.extract_image(_xref(doc))
+
+    avatar = PdfParser._avatar_image(doc, _xref(doc))
+    assert avatar == {"bytes": original["image"], "ext": original["ext"]}
+
+
+def test_oversized_avatar_is_always_resized():
+    # 纯色 PNG 压缩后比缩小后的 JPEG 还小，也不能原样返回
+    doc = _doc_with_image(_flat_png(270, 360))
+    original = doc.extract_image(_xref(doc))
+
+    avatar = PdfParser._avatar_image(doc, _xref(doc))
+    assert avatar["ext"] == "jpeg"
+    assert len(avatar["bytes"]) > len(original["image"])
+    resized = fitz.Pixmap(avatar["bytes"])
+    assert (resized.width, resized.height) == (192, 256)
+
+
+def test_avatar_cap_disabled_keeps_web_formats(monkeypatch):
+    monkeypatch.setattr(pdf_parser, "AVATAR_MAX_SIDE", 0)
+    doc = _doc_with_image(_flat_png(270, 360))
+
+    assert PdfParser._avatar_image(doc, _xref(doc))["ext"] == "png"
+
+
+def test_oversized_avatar_falls_back_to_the_original_when_resizing_fails(monkeypatch):
+    doc = _doc_with_image(_flat_png(270, 360))
+    original = doc.extract_image(_xref(doc))
+
+    def broken_pixmap(*args):
+        raise RuntimeError("无法解码")
+
+    monkeypatch.setattr(fitz, "Pixmap", broken_pixmap)
+    assert PdfParser._extract_avatar(doc) == {"bytes": original["image"], "ext": "png"}
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from app.utils.pipeline import Pipeline, Stage
+
+pytestmark = pytest.mark.anyio
+
+
+class Boom(BaseException):
+    pass
+
+
+async def _double(item):
+    item["value"] *= 2
+
+
+def _pipeline(handler, batch_size: int = 1) -> Pipeline:
+    return Pipeline([Stage("first", handler, batch_size=batch_size), Stage("double", _double)])
+
+
+async def test_items_flow_through_every_stage():
+    async def add_one(item):
+        item["value"] += 1
+
+    pipeline = _pipeline(add_one)
+    try:
+        results = await asyncio.gather(*(pipeline.submit({"value": i}) for i in range(5)))
+    finally:
+        await pipeline.close()
+    assert [r["value"] for r in results] == [2, 4, 6, 8, 10]
+
+
+async def test_exception_fails_only_the_bad_item_in_a_batch():
+    async def check(items):
+        if any(item["value"] < 0 for item in items):
+            raise ValueError("坏数据")
+
+    pipeline = _pipeline(check, batch_size=4)
+    try:
+        results = await asyncio.gather(
+            *(pipeline.submit({"value": v}) for v in (1, -1, 2)), return_exceptions=True
+        )
+    finally:
+        await pipeline.close()
+    assert results[0] == {"value": 2}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"value": 4}
+
+
+@pytest.mark.parametrize("error", [asyncio.CancelledError, Boom])
+async def test_base_exception_fails_the_batch_and_the_stage_keeps_working(error):
+    async def explode(item):
+        if item["value"] < 0:
+            raise error()
+
+    pipeline = _pipeline(explode)
+    try:
+        with pytest.raises(RuntimeError, match="first"):
+            await asyncio.wait_for(pipeline.submit({"value": -1}), 5)
+        assert await asyncio.wait_for(pipeline.submit({"value": 3}), 5) == {"value": 6}
+        assert pipeline.stats()["first"]["failed"] == 1
+    finally:
+        await pipeline.close()
+
+
+async def test_close_fails_items_still_in_flight():
+    started = asyncio.Event()
+
+    async def block(item):
+        started.set()
+        await asyncio.Event().wait()
+
+    pipeline = _pipeline(block)
+    pending = asyncio.ensure_future(pipeline.submit({"value": 1}))
+    await asyncio.wait_for(started.wait(), 5)
+    await pipeline.close()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(pending, 5)
@@ -0,0 +1,118 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from app.db.prompt_table import Prompt
+from app.services import prompt_service
+from app.services.prompt_service import PromptService
+
+pytestmark = pytest.mark.anyio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 另一个进程（API 或 worker）：开放一个岗位
+OTHER_PROCESS = textwrap.dedent(
+    """
+    import asyncio
+    import sys
+    from tortoise import Tortoise
+    from app.settings import TORTOISE_ORM
+    from app.services.prompt_service import PromptService
+
+    async def main():
+        await Tortoise.init(config=TORTOISE_ORM)
+        try:
+            await PromptService.set_open(int(sys.argv[1]), True)
+        finally:
+            await Tortoise.close_connections()
+
+    asyncio.run(main())
+    """
+)
+
+
+@pytest.fixture(autouse=True)
+def prompt_cache(monkeypatch):
+    """提示词缓存是类级别的进程内状态；默认不按时间过期，用例里显式放开"""
+    monkeypatch.setattr(prompt_service, "PROMPT_CACHE_CHECK_SECONDS", 3600)
+    PromptService._invalidate()
+    PromptService._lock = None
+    yield
+    PromptService._invalidate()
+    PromptService._lock = None
+
+
+def _ids(prompts) -> list:
+    return [p.id for p in prompts]
+
+
+async def test_evaluation_prompts_put_the_active_one_first(db):
+    opened = await Prompt.create(name="后端", content="...", is_open=True)
+    active = await PromptService.create_prompt("通用", "...", is_active=True)
+    await Prompt.create(name="已删除", content="...", is_open=True, is_deleted=1)
+    await Prompt.create(name="未开放", content="...")
+
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id, opened.id]
+    assert (await PromptService.get_active_prompt()).id == active.id
+
+
+async def test_cache_is_reused_within_the_check_interval(db, monkeypatch):
+    active = await PromptService.create_prompt("通用", "...", is_active=True)
+    cached = await PromptService.get_evaluation_prompts()
+
+    # 过了检查间隔、版本号没变时沿用原来的列表
+    monkeypatch.setattr(prompt_service, "PROMPT_CACHE_CHECK_SECONDS", 0)
+    assert await PromptService.get_evaluation_prompts() is cached
+
+    # 别的进程的修改在检查间隔内看不到
+    monkeypatch.setattr(prompt_service, "PROMPT_CACHE_CHECK_SECONDS", 3600)
+    await Prompt.create(name="后端", content="...", is_open=True)
+    assert await PromptService.get_evaluation_prompts() is cached
+    assert _ids(cached) == [active.id]
+
+
+async def test_local_changes_invalidate_immediately(db):
+    active = await PromptService.create_prompt("通用", "...", is_active=True)
+    backend = await PromptService.create_prompt("后端", "...")
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id]
+
+    assert await PromptService.set_open(backend.id, True)
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id, backend.id]
+
+    assert await PromptService.delete_prompt(active.id)
+    assert _ids(await PromptService.get_evaluation_prompts()) == [backend.id]
+    assert await PromptService.get_active_prompt() is None
+
+
+async def test_version_key_sees_changes_from_another_process(db, db_url, monkeypatch):
+    active = await PromptService.create_prompt("通用", "...", is_active=True)
+    backend = await PromptService.create_prompt("后端", "...")
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id]
+    version = PromptService._version
+
+    env = dict(os.environ, DB_URL=db_url, PYTHONPATH=ROOT)
+    subprocess.run(
+        [sys.executable, "-c", OTHER_PROCESS, str(backend.id)], cwd=ROOT, env=env, check=True, timeout=60
+    )
+
+    # 行数没变，靠最大 updated_at 发现修改
+    assert (await PromptService._db_version())[0] == version[0]
+    assert await PromptService._db_version() != version
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id]
+    monkeypatch.setattr(prompt_service, "PROMPT_CACHE_CHECK_SECONDS", 0)
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id, backend.id]
+
+
+async def test_version_key_counts_rows(db, monkeypatch):
+    active = await PromptService.create_prompt("通用", "...", is_active=True)
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id]
+    monkeypatch.setattr(prompt_service, "PROMPT_CACHE_CHECK_SECONDS", 0)
+
+    # 其他进程直接删掉一行（最大 updated_at 不一定变），行数变化也要重新加载
+    opened = await Prompt.create(name="后端", content="...", is_open=True)
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id, opened.id]
+    await Prompt.filter(id=opened.id).delete()
+    assert _ids(await PromptService.get_evaluation_prompts()) == [active.id]
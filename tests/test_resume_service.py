@@ -0,0 +1,129 @@
+from datetime import timedelta
+
+import pytest
+from tortoise import timezone
+
+from app.db.resume_table import Resume
+from app.services import resume_service
+from app.services.resume_service import ResumeService
+from app.services.search_service import SearchService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def count_cache():
+    ResumeService._count_cache.clear()
+    yield
+    ResumeService._count_cache.clear()
+
+
+async def _resumes(count: int, **fields) -> list:
+    """同一时刻创建的一批简历（created_at 相同，靠 id 排序）以及更早的一批"""
+    now = timezone.now()
+    resumes = []
+    for i in range(count):
+        resume = await Resume.create(file_url="resumes/test.pdf", name=f"张{i:02d}", **fields)
+        created_at = now if i % 2 else now - timedelta(minutes=i)
+        await Resume.filter(id=resume.id).update(created_at=created_at)
+        resumes.append(await Resume.get(id=resume.id))
+    return resumes
+
+
+async def _all_pages(page_size: int, **filters) -> list:
+    pages, cursor = [], None
+    while True:
+        result = await ResumeService.get_resumes(page_size=page_size, cursor=cursor, **filters)
+        pages.append([r.id for r in result["items"]])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+async def test_keyset_pages_cover_everything_once_in_order(db):
+    resumes = await _resumes(7)
+    expected = [r.id for r in sorted(resumes, key=lambda r: (r.created_at, r.id), reverse=True)]
+
+    pages = await _all_pages(3)
+    assert [len(p) for p in pages] == [3, 3, 1]
+    assert sum(pages, []) == expected
+
+
+async def test_keyset_cursor_ignores_rows_inserted_ahead_of_it(db):
+    await _resumes(4)
+    first = await ResumeService.get_resumes(page_size=2)
+    await Resume.create(file_url="resumes/new.pdf", name="新来的")
+
+    second = await ResumeService.get_resumes(page_size=2, cursor=first["next_cursor"])
+    seen = [r.id for r in first["items"] + second["items"]]
+    assert len(set(seen)) == 4
+    assert second["next_cursor"] is None
+
+
+async def test_ranked_pages_follow_relevance(db):
+    resumes = await _resumes(5, major="推荐系统")
+    await SearchService.index_resumes([(r, None) for r in resumes])
+
+    pages = await _all_pages(2, keyword="推荐")
+    assert [len(p) for p in pages] == [2, 2, 1]
+    assert sorted(sum(pages, [])) == sorted(r.id for r in resumes)
+
+
+async def test_cursor_from_the_other_path_is_rejected(db):
+    resumes = await _resumes(3, major="推荐系统")
+    await SearchService.index_resumes([(r, None) for r in resumes])
+    keyset = (await ResumeService.get_resumes(page_size=1))["next_cursor"]
+    ranked = (await ResumeService.get_resumes(page_size=1, keyword="推荐"))["next_cursor"]
+
+    # 单字关键字走不了索引，按时间排序
+    with pytest.raises(ValueError, match="cursor 无效"):
+        await ResumeService.get_resumes(keyword="张", cursor=ResumeService._encode_cursor({"o": 10}))
+    with pytest.raises(ValueError, match="cursor 无效"):
+        await ResumeService.get_resumes(keyword="推荐", cursor=keyset)
+    with pytest.raises(ValueError, match="cursor 无效"):
+        await ResumeService.get_resumes(cursor=ranked)
+    with pytest.raises(ValueError, match="cursor 无效"):
+        await ResumeService.get_resumes(cursor="not-a-cursor")
+
+
+async def test_parse_uses_the_cache_hit_from_download_even_if_evicted():
+    text = "张三的个人简历，负责推荐系统"
+    resume = Resume(id=1, file_url="resumes/test.pdf", file_hash="abc")
+    ResumeService._parsed_cache.set("abc", (text, {"bytes": b"x", "ext": "png"}))
+    ctx = {"resume": resume, "profile": None}
+    try:
+        await ResumeService._stage_download(ctx)
+        # 下载和解析之间缓存过期 / 被挤出
+        ResumeService._parsed_cache.clear()
+        await ResumeService._stage_parse(ctx)
+    finally:
+        ResumeService._parsed_cache.clear()
+
+    assert ctx["text"] == text
+    assert ctx["avatar_data"]["ext"] == "png"
+    assert "parsed" not in ctx
+
+
+async def test_failed_avatar_upload_keeps_the_avatar_for_the_retry(monkeypatch):
+    calls = []
+
+    async def flaky_upload(data, object_name, content_type):
+        calls.append(object_name)
+        if len(calls) == 1:
+            raise ConnectionError("MinIO 不可用")
+        return f"http://minio/{object_name}"
+
+    monkeypatch.setattr(resume_service.MinioClient, "upload_bytes", flaky_upload)
+    ctx = {"avatar_data": {"bytes": b"x", "ext": "jpeg"}}
+
+    with pytest.raises(ConnectionError):
+        await ResumeService._upload_avatar(ctx)
+    assert "avatar_url" not in ctx
+
+    await ResumeService._upload_avatar(ctx)
+    assert ctx["avatar_url"].endswith(".jpeg")
+    assert "avatar_data" not in ctx
+
+    # 上传成功后再重试（比如写库失败）不会重复上传
+    await ResumeService._upload_avatar(ctx)
+    assert len(calls) == 2
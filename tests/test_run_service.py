@@ -0,0 +1,206 @@
+import asyncio
+
+import pytest
+
+from app.db.reanalysis_run_table import ReanalysisRun
+from app.db.resume_table import Resume
+from app.db.resume_job_table import ResumeJob
+from app.services import run_service
+from app.services.job_service import (
+    JobService,
+    JOB_CANCELLED,
+    JOB_PAUSED,
+    JOB_PENDING,
+    JOB_RUNNING,
+)
+from app.services.run_service import (
+    RunService,
+    RUN_CANCELLED,
+    RUN_PAUSED,
+    RUN_RUNNING,
+    TOPIC_RESUMES,
+    run_topic,
+)
+from app.utils.events import event_bus
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def reset_run_service(monkeypatch):
+    monkeypatch.setattr(run_service, "RUN_WINDOW_SIZE", 4)
+    RunService._relayed_at = None
+    RunService._relayed = {}
+    yield
+    RunService._relayed_at = None
+    RunService._relayed = {}
+    RunService._snapshots.clear()
+    RunService._pinned_prompts.clear()
+    RunService._samples.clear()
+
+
+async def _run(resumes: int) -> ReanalysisRun:
+    for _ in range(resumes):
+        await Resume.create(file_url="resumes/test.pdf")
+    return await RunService.create_run()
+
+
+async def _job_statuses(run_id: int) -> list:
+    return await ResumeJob.filter(run_id=run_id).order_by("resume_id").values_list("status", flat=True)
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+async def test_relay_publishes_status_changes_made_elsewhere(db):
+    resume = await Resume.create(file_url="resumes/test.pdf")
+    await JobService.enqueue(resume.id)
+    queue = event_bus.subscribe(TOPIC_RESUMES)
+    try:
+        # 第一次只记下起点
+        assert await RunService.relay_job_events() == 0
+
+        # 以下相当于独立 worker 进程里的操作：只改库，不发本进程事件
+        [job] = await JobService.claim("other-worker")
+        assert await RunService.relay_job_events() == 1
+        [started] = _drain(queue)
+        assert (started["resume_id"], started["to"], started["error"]) == (resume.id, 1, None)
+
+        await Resume.filter(id=resume.id).update(status=2)
+        await JobService.complete(job, "other-worker")
+        assert await RunService.relay_job_events() == 1
+        [finished] = _drain(queue)
+        assert (finished["from"], finished["to"]) == (1, 2)
+
+        # 回看窗口里的同一次变化不重复推送
+        assert await RunService.relay_job_events() == 0
+        assert _drain(queue) == []
+    finally:
+        event_bus.unsubscribe(TOPIC_RESUMES, queue)
+
+
+async def test_relay_reports_failures_and_run_topic(db):
+    resume = await Resume.create(file_url="resumes/test.pdf")
+    run = await ReanalysisRun.create(total=1, max_resume_id=resume.id)
+    await JobService.enqueue_many([resume.id], run_id=run.id)
+    queue = event_bus.subscribe(run_topic(run.id))
+    try:
+        await RunService.relay_job_events()
+        [job] = await JobService.claim("other-worker")
+        await Resume.filter(id=resume.id).update(status=4)
+        await JobService.fail(job, "other-worker", "LLM 超时")
+
+        assert await RunService.relay_job_events() == 1
+        [failed] = _drain(queue)
+        assert (failed["run_id"], failed["to"], failed["error"]) == (run.id, 4, "LLM 超时")
+    finally:
+        event_bus.unsubscribe(run_topic(run.id), queue)
+
+
+async def test_create_run_on_empty_library(db):
+    assert await RunService.create_run() is None
+
+
+async def test_feed_fills_the_window_in_id_order(db):
+    run = await _run(10)
+    assert (run.total, run.checkpoint_id) == (10, 0)
+
+    assert await RunService.feed() == 4
+    assert (await ReanalysisRun.get(id=run.id)).checkpoint_id == 4
+
+    # 窗口还满着不补；空出一半以上才补
+    assert await RunService.feed() == 0
+    [first, second, *_] = await JobService.claim("w1", limit=2)
+    await JobService.complete(first, "w1")
+    await JobService.complete(second, "w1")
+    assert await RunService.feed() == 2
+    assert await ResumeJob.filter(run_id=run.id).order_by("resume_id").values_list("resume_id", flat=True) == list(
+        range(1, 7)
+    )
+
+
+async def test_feed_skips_deleted_resumes_and_reaches_the_end(db):
+    run = await _run(3)
+    await Resume.filter(id=2).update(is_deleted=1)
+
+    assert await RunService.feed() == 2
+    assert (await ReanalysisRun.get(id=run.id)).checkpoint_id == run.max_resume_id
+    assert await RunService.feed() == 0
+
+
+async def test_pause_holds_queued_jobs_and_stops_feeding(db):
+    run = await _run(6)
+    await RunService.feed()
+    [running] = await JobService.claim("w1")
+
+    assert await RunService.pause(run.id)
+    assert not await RunService.pause(run.id)
+    assert (await ReanalysisRun.get(id=run.id)).status == RUN_PAUSED
+    assert await _job_statuses(run.id) == [JOB_RUNNING, JOB_PAUSED, JOB_PAUSED, JOB_PAUSED]
+
+    # 挂起的任务不会被领取，也不再补新任务
+    assert await JobService.claim("w2", limit=4) == []
+    await JobService.complete(running, "w1")
+    assert await RunService.feed() == 0
+
+
+async def test_resume_requeues_paused_jobs_and_continues_from_checkpoint(db):
+    run = await _run(6)
+    await RunService.feed()
+    await RunService.pause(run.id)
+
+    assert not await RunService.resume(run.id + 1)
+    assert await RunService.resume(run.id)
+    assert not await RunService.resume(run.id)
+    assert (await ReanalysisRun.get(id=run.id)).status == RUN_RUNNING
+    assert await _job_statuses(run.id) == [JOB_PENDING] * 4
+
+    claimed = await JobService.claim("w1", limit=4)
+    for job in claimed:
+        await JobService.complete(job, "w1")
+    assert await RunService.feed() == 2
+    assert (await ReanalysisRun.get(id=run.id)).checkpoint_id == run.max_resume_id
+
+
+async def test_cancel_drops_unstarted_jobs_and_lets_running_ones_finish(db):
+    run = await _run(6)
+    await RunService.feed()
+    [running] = await JobService.claim("w1")
+    await RunService.pause(run.id)
+
+    assert await RunService.cancel(run.id)
+    assert not await RunService.cancel(run.id)
+    assert not await RunService.resume(run.id)
+    cancelled = await ReanalysisRun.get(id=run.id)
+    assert cancelled.status == RUN_CANCELLED
+    assert cancelled.finished_at is not None
+    assert await _job_statuses(run.id) == [JOB_RUNNING, JOB_CANCELLED, JOB_CANCELLED, JOB_CANCELLED]
+    assert await RunService.feed() == 0
+
+    snapshot = await RunService.snapshot(run.id)
+    assert (snapshot["running"], snapshot["cancelled"], snapshot["done"]) == (1, 3, False)
+    # 吞吐采样在批次进入终态时就删掉，不会一直留在进程里
+    assert RunService._samples.get(run.id) is None
+
+    await JobService.complete(running, "w1")
+    RunService._snapshots.clear()
+    snapshot = await RunService.snapshot(run.id)
+    assert (snapshot["finished"], snapshot["eta_seconds"], snapshot["done"]) == (1, None, True)
+
+
+async def test_throughput_samples_are_kept_only_while_running(db):
+    run = await _run(2)
+    await RunService.feed()
+    await RunService.snapshot(run.id)
+    assert len(RunService._samples.get(run.id)) == 1
+
+    for job in await JobService.claim("w1", limit=2):
+        await JobService.complete(job, "w1")
+    RunService._snapshots.clear()
+    snapshot = await RunService.snapshot(run.id)
+    assert snapshot["done"]
+    assert RunService._samples.get(run.id) is None
@@ -0,0 +1,95 @@
+import itertools
+import string
+
+import pytest
+
+from app.db.resume_table import Resume
+from app.db.resume_term_table import ResumeTerm
+from app.services import search_service
+from app.services.resume_service import ResumeService
+from app.services.search_service import SearchService
+from app.utils.tokenizer import query_tokens, tokenize
+
+pytestmark = pytest.mark.anyio
+
+
+def _ascii_words(count: int) -> str:
+    """count 个互不相同的英文词，每个贡献两个新 bigram"""
+    pairs = itertools.product(string.ascii_lowercase, repeat=2)
+    return " ".join(f"{a}{b}{i % 10}" for i, (a, b) in zip(range(count), pairs))
+
+
+def test_tokenize_bigrams_in_first_appearance_order():
+    assert tokenize("张三丰 python") == ["张三", "三丰", "py", "yt", "th", "ho", "on"]
+    assert tokenize("Go, 张") == ["go", "张"]
+    assert tokenize("张三张三") == ["张三", "三张"]
+    assert tokenize(None) == []
+
+
+def test_query_tokens_needs_two_characters():
+    assert query_tokens("推荐系统") == ["推荐", "荐系", "系统"]
+    assert query_tokens("张") is None
+    assert query_tokens("") is None
+
+
+async def _resume(**fields) -> Resume:
+    return await Resume.create(file_url="resumes/test.pdf", **fields)
+
+
+async def test_match_field_requires_every_bigram(db):
+    zju = await _resume(university="浙江大学")
+    zjut = await _resume(university="浙江工业大学")
+    await SearchService.index_resumes([(zju, None), (zjut, None)])
+
+    assert sorted(await SearchService.match_field("university", "浙江")) == [zju.id, zjut.id]
+    assert await SearchService.match_field("university", "浙江大学") == [zju.id]
+    assert await SearchService.match_field("university", "浙") is None
+
+
+async def test_rank_orders_by_field_weight(db):
+    in_name = await _resume(name="王推荐")
+    in_text = await _resume(name="李四")
+    await SearchService.index_resumes([(in_name, ""), (in_text, "负责推荐系统")])
+
+    ranked = await SearchService.rank("推荐")
+    assert [rid for rid, _ in ranked] == [in_name.id, in_text.id]
+    assert ranked[0][1] > ranked[1][1]
+
+
+async def test_reindex_without_text_keeps_text_terms(db):
+    resume = await _resume(name="张三")
+    await SearchService.index_resume(resume, "负责推荐系统")
+
+    resume.name = "张三丰"
+    await SearchService.index_resume(resume)
+    assert [rid for rid, _ in await SearchService.rank("推荐系统")] == [resume.id]
+    assert [rid for rid, _ in await SearchService.rank("三丰")] == [resume.id]
+
+
+async def test_long_cjk_text_keeps_chinese_terms_under_the_cap(db, monkeypatch):
+    monkeypatch.setattr(search_service, "SEARCH_MAX_TERMS_PER_FIELD", 200)
+    # 长中文简历：中文内容在前，后面跟着大量英文技术词，总词数远超上限
+    text = "2019年至今在某电商公司负责推荐系统和订单中台的设计与开发。\n" + _ascii_words(400)
+    assert len(tokenize(text)) > 200
+    resume = await _resume(name="张三")
+    await SearchService.index_resume(resume, text)
+
+    assert await ResumeTerm.filter(resume_id=resume.id, field="text").count() == 200
+    for keyword in ("推荐系统", "订单中台", "电商公司"):
+        assert [rid for rid, _ in await SearchService.rank(keyword)] == [resume.id], keyword
+
+
+async def test_rank_gives_up_when_candidates_exceed_the_cap(db, monkeypatch):
+    resumes = [await _resume(major="推荐系统") for _ in range(3)]
+    await SearchService.index_resumes([(r, None) for r in resumes])
+
+    monkeypatch.setattr(search_service, "SEARCH_MAX_CANDIDATES", 3)
+    assert len(await SearchService.rank("推荐")) == 3
+    monkeypatch.setattr(search_service, "SEARCH_MAX_CANDIDATES", 2)
+    assert await SearchService.rank("推荐") is None
+
+    # 列表页退回 LIKE 过滤，总数和分页仍然完整
+    ResumeService._count_cache.clear()
+    result = await ResumeService.get_resumes(keyword="推荐", page_size=2)
+    assert result["total"] == 3
+    assert result["next_cursor"] is not None
@@ -0,0 +1,130 @@
+import os
+import subprocess
+import sys
+import textwrap
+from datetime import timedelta
+
+import pytest
+from tortoise import timezone
+
+from app.db.resume_job_table import ResumeJob
+from app.db.resume_table import Resume
+from app.db.skill_table import Skill
+from app.services.job_service import JobService
+from app.services.skill_service import SkillService
+
+pytestmark = pytest.mark.anyio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 另一个进程（独立 worker）：领取任务，写技能，完成任务
+OTHER_WORKER = textwrap.dedent(
+    """
+    import asyncio
+    from tortoise import Tortoise
+    from app.settings import TORTOISE_ORM
+    from app.db.resume_table import Resume
+    from app.db.skill_table import Skill
+    from app.services.job_service import JobService
+    from app.services.skill_service import SkillService
+
+    async def main():
+        await Tortoise.init(config=TORTOISE_ORM)
+        try:
+            [job] = await JobService.claim("other-worker")
+            resume = await Resume.get(id=job.resume_id)
+            ids = await SkillService.resolve_skill_ids(["Rust", "MySQL"])
+            await resume.skill_tags.add(*await Skill.filter(id__in=list(ids.values())))
+            await JobService.complete(job, "other-worker")
+        finally:
+            await Tortoise.close_connections()
+
+    asyncio.run(main())
+    """
+)
+
+
+@pytest.fixture(autouse=True)
+def skill_index():
+    """技能索引是类级别的进程内状态，每个用例从空索引开始"""
+    SkillService._ids_by_name = {}
+    SkillService._postings = {}
+    SkillService._loaded = False
+    SkillService._synced_at = None
+    yield
+    SkillService._ids_by_name = {}
+    SkillService._postings = {}
+    SkillService._loaded = False
+    SkillService._synced_at = None
+
+
+async def _resume_with_skills(*names) -> Resume:
+    resume = await Resume.create(file_url="resumes/test.pdf")
+    ids = await SkillService.resolve_skill_ids(names)
+    if ids:
+        await resume.skill_tags.add(*await Skill.filter(id__in=list(ids.values())))
+    return resume
+
+
+def test_parse_query():
+    assert SkillService.parse_query("Python, java|go，-PHP, ") == ([["python"], ["java", "go"]], ["php"])
+    assert SkillService.parse_query("-php") == ([], ["php"])
+
+
+async def test_resolve_skill_ids_creates_once_and_caches(db):
+    first = await SkillService.resolve_skill_ids(["Python", "python ", "Go"])
+    assert set(first) == {"python", "go"}
+    assert await SkillService.resolve_skill_ids(["go"]) == {"go": first["go"]}
+    assert SkillService.index_stats()["name_cache_hits"] >= 1
+
+
+async def test_match_and_or_not(db):
+    py_mysql = await _resume_with_skills("python", "mysql")
+    java_php = await _resume_with_skills("java", "php")
+    go_mysql = await _resume_with_skills("go", "mysql")
+    await SkillService.load_index()
+
+    async def match(query):
+        result = await SkillService.match(*SkillService.parse_query(query))
+        return None if result is None else sorted(result)
+
+    assert await match("mysql") == [py_mysql.id, go_mysql.id]
+    assert await match("mysql,python") == [py_mysql.id]
+    assert await match("java|go") == [java_php.id, go_mysql.id]
+    assert await match("java|go,-php") == [go_mysql.id]
+    assert await match("unknown") == []
+    # 只有排除条件时交给数据库
+    assert await match("-php") is None
+
+
+async def test_match_is_none_until_index_is_loaded(db):
+    await _resume_with_skills("python")
+    assert await SkillService.match([["python"]], []) is None
+
+
+async def test_index_resume_skills_replaces_and_remove_drops(db):
+    resume = await _resume_with_skills("python")
+    await SkillService.load_index()
+    ids = await SkillService.resolve_skill_ids(["python", "rust"])
+
+    SkillService.index_resume_skills({resume.id: [ids["rust"]]})
+    assert sorted(await SkillService.match([["rust"]], [])) == [resume.id]
+    assert not await SkillService.match([["python"]], [])
+
+    SkillService.remove_resumes([resume.id])
+    assert not await SkillService.match([["rust"]], [])
+
+
+async def test_refresh_picks_up_jobs_completed_by_another_process(db, db_url):
+    resume = await _resume_with_skills()
+    job = await JobService.enqueue(resume.id)
+    # 任务是很久以前入队的：只有完成时刷新了 updated_at，增量同步才看得到它
+    await ResumeJob.filter(id=job.id).update(updated_at=timezone.now() - timedelta(hours=1))
+    await SkillService.load_index()
+    assert not await SkillService.match([["rust"]], [])
+
+    env = dict(os.environ, DB_URL=db_url, PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, "-c", OTHER_WORKER], cwd=ROOT, env=env, check=True, timeout=60)
+
+    assert await SkillService.refresh_index() == 1
+    assert sorted(await SkillService.match([["rust"], ["mysql"]], [])) == [resume.id]